@@ -43,6 +43,7 @@ from .embeds import *
 from .emoji import *
 from .enums import *
 from .errors import *
+from .executor import *
 from .file import *
 from .flags import *
 from .guild import *
@@ -72,6 +73,7 @@ from .template import *
 from .threads import *
 from .user import *
 from .voice_client import *
+from .voice_metrics import *
 from .webhook import *
 from .welcome_screen import *
 from .widget import *
@@ -57,6 +57,7 @@ from .commands import (
     UserCommand,
     command,
 )
+from .commands.sync import CommandSyncStore, _commands_hash
 from .enums import IntegrationType, InteractionContextType, InteractionType
 from .errors import CheckFailure, DiscordException
 from .interactions import Interaction
@@ -93,6 +94,9 @@ class ApplicationCommandMixin(ABC):
         methods.
     """
 
+    # the number of guilds whose commands are synced at once
+    _SYNC_CONCURRENCY: int = 8
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._pending_application_commands = []
@@ -544,7 +548,28 @@ class ApplicationCommandMixin(ABC):
 
         pending_actions = []
 
-        if not force:
+        store: CommandSyncStore | None = self._bot.command_sync_store
+        application_id = self._bot.user and self._bot.user.id
+        commands_hash = None
+        up_to_date = False
+        if store is not None and application_id:
+            commands_hash = _commands_hash(pending)
+            entry = None if force else await store.get(application_id, guild_id)
+            if entry is not None and entry.get("hash") == commands_hash:
+                registered = entry["commands"]
+                up_to_date = True
+            elif delete_existing:
+                # the bulk endpoint replaces the whole scope, so there is no
+                # need to fetch what is registered first
+                force = True
+
+        if up_to_date:
+            _log.debug(
+                "Skipping command sync for guild %s: Commands are unchanged since"
+                " the last sync",
+                guild_id,
+            )
+        elif not force:
             prefetched_commands: list[interactions.ApplicationCommand] = []
             if self._bot.user:
                 if guild_id is None:
@@ -670,6 +695,23 @@ class ApplicationCommandMixin(ABC):
             data = [cmd.to_dict() for cmd in pending]
             registered = await register("bulk", data, guild_id=guild_id)
 
+        if commands_hash is not None and not up_to_date:
+            await store.set(
+                application_id,
+                guild_id,
+                {
+                    "hash": commands_hash,
+                    "commands": [
+                        {
+                            key: i[key]
+                            for key in ("id", "name", "type", "guild_id")
+                            if key in i
+                        }
+                        for i in registered
+                    ],
+                },
+            )
+
         for i in registered:
             cmd = get(
                 self.pending_application_commands,
@@ -769,20 +811,46 @@ class ApplicationCommandMixin(ABC):
                     cmd_guild_ids.extend(cmd.guild_ids)
             if check_guilds is not None:
                 cmd_guild_ids.extend(check_guilds)
-            for guild_id in set(cmd_guild_ids):
-                guild_commands = [
-                    cmd
-                    for cmd in commands
-                    if cmd.guild_ids is not None and guild_id in cmd.guild_ids
-                ]
-                app_cmds = await self.register_commands(
-                    guild_commands,
-                    guild_id=guild_id,
-                    method=method,
-                    force=force,
-                    delete_existing=delete_existing,
-                )
-                registered_guild_commands[guild_id] = app_cmds
+            guild_ids = list(set(cmd_guild_ids))
+            # each guild has its own rate limit bucket, so they can be synced
+            # concurrently, but not all at once
+            semaphore = asyncio.Semaphore(self._SYNC_CONCURRENCY)
+
+            async def register_guild(
+                guild_id: int,
+            ) -> list[interactions.ApplicationCommand]:
+                async with semaphore:
+                    return await self.register_commands(
+                        [
+                            cmd
+                            for cmd in commands
+                            if cmd.guild_ids is not None and guild_id in cmd.guild_ids
+                        ],
+                        guild_id=guild_id,
+                        method=method,
+                        force=force,
+                        delete_existing=delete_existing,
+                    )
+
+            results = await asyncio.gather(
+                *(register_guild(guild_id) for guild_id in guild_ids),
+                return_exceptions=True,
+            )
+            errors = [
+                (guild_id, result)
+                for guild_id, result in zip(guild_ids, results)
+                if isinstance(result, BaseException)
+            ]
+            if errors:
+                for guild_id, error in errors[1:]:
+                    _log.error(
+                        "Failed to sync commands for guild ID %s",
+                        guild_id,
+                        exc_info=error,
+                    )
+                raise errors[0][1]
+
+            registered_guild_commands.update(zip(guild_ids, results))
 
         for i in registered_commands:
             cmd = get(
@@ -1179,6 +1247,9 @@ class BotBase(ApplicationCommandMixin, CogMixin, ABC):
         self.owner_id = options.get("owner_id")
         self.owner_ids = options.get("owner_ids", set())
         self.auto_sync_commands = options.get("auto_sync_commands", True)
+        self.command_sync_store: CommandSyncStore | None = options.get(
+            "command_sync_store"
+        )
 
         self.debug_guilds = options.pop("debug_guilds", None)
         self.default_command_contexts = options.pop(
@@ -1500,6 +1571,14 @@ class Bot(BotBase, Client):
         :attr:`.process_application_commands` if the command is not found. Defaults to ``True``.
 
         .. versionadded:: 2.0
+    command_sync_store: Optional[:class:`CommandSyncStore`]
+        Where to remember the commands that were last synced for each scope. When set,
+        :meth:`.sync_commands` skips scopes whose commands have not changed since the last
+        sync without making any requests, and overwrites the others in bulk. Commands
+        changed outside of this bot are not detected; pass ``force=True`` or clear the
+        store in that case. Defaults to ``None``.
+
+        .. versionadded:: 2.7
     default_command_contexts: Collection[:class:`InteractionContextType`]
         The default context types that the bot will use for commands.
         Defaults to a set containing :attr:`InteractionContextType.guild`, :attr:`InteractionContextType.bot_dm`, and
@@ -26,7 +26,9 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import re
 import signal
 import sys
 import traceback
@@ -42,12 +44,14 @@ from .application_role_connection import ApplicationRoleConnectionMetadata
 from .backoff import ExponentialBackoff
 from .channel import PartialMessageable, _threaded_channel_factory
 from .emoji import AppEmoji, GuildEmoji
-from .enums import ChannelType, Status
+from .enums import ChannelType, ComponentType, Status
 from .errors import *
+from .executor import EventExecutor
 from .flags import ApplicationFlags, Intents
 from .gateway import *
+from .gateway import GATEWAY_COMPRESSIONS, _zstd
 from .guild import Guild
-from .http import HTTPClient
+from .http import GlobalRateLimit, HTTPClient
 from .invite import Invite
 from .iterators import EntitlementIterator, GuildIterator
 from .mentions import AllowedMentions
@@ -58,6 +62,7 @@ from .state import ConnectionState
 from .sticker import GuildSticker, StandardSticker, StickerPack, _sticker_factory
 from .template import Template
 from .threads import Thread
+from .ui.dynamic import DynamicHandler, _DynamicRoute
 from .ui.view import View
 from .user import ClientUser, User
 from .utils import MISSING
@@ -82,6 +87,18 @@ Coro = TypeVar("Coro", bound=Callable[..., Coroutine[Any, Any, Any]])
 
 _log = logging.getLogger(__name__)
 
+# maps an event to a function returning the secondary key used by wait_for
+_WAIT_FOR_KEYS: dict[str, Callable[..., Any]] = {
+    "message": lambda message: message.channel.id,
+    "typing": lambda channel, user, when: channel.id,
+    "message_edit": lambda before, after: after.id,
+    "message_delete": lambda message: message.id,
+    "reaction_add": lambda reaction, user: reaction.message.id,
+    "reaction_remove": lambda reaction, user: reaction.message.id,
+    "raw_reaction_add": lambda payload: payload.message_id,
+    "raw_reaction_remove": lambda payload: payload.message_id,
+}
+
 
 def _cancel_tasks(loop: asyncio.AbstractEventLoop) -> None:
     tasks = {t for t in asyncio.all_tasks(loop=loop) if not t.done()}
@@ -160,6 +177,30 @@ class Client:
         currently selected intents.
 
         .. versionadded:: 1.5
+    compact_member_cache: :class:`bool`
+        Whether to store the members of each guild in a compact, column based
+        form and only create :class:`Member` objects when they are accessed.
+        This greatly reduces memory usage for bots in very large guilds, at
+        the cost of some CPU time when iterating over :attr:`Guild.members`.
+        Defaults to ``False``.
+
+        .. warning::
+
+            Only the most recently accessed members of a guild are kept as
+            objects. Other members are created anew every time they are
+            accessed, for example through :attr:`Guild.members` or
+            :meth:`Guild.get_member`, so they should be compared with ``==``
+            instead of ``is``, and changes made to such a :class:`Member`
+            object outside of the library are not kept.
+
+        .. versionadded:: 2.7
+    lazy_guilds: :class:`bool`
+        Whether to defer building the channels, threads, roles, stage instances,
+        scheduled events and voice states of a guild until they are first
+        accessed. This speeds up start-up for bots in many guilds. The raw data
+        is discarded once it has been used. Defaults to ``False``.
+
+        .. versionadded:: 2.7
     chunk_guilds_at_startup: :class:`bool`
         Indicates if :func:`.on_ready` should be delayed to chunk all guilds
         at start-up if necessary. This operation is incredibly slow for large
@@ -167,6 +208,28 @@ class Client:
         is ``True``.
 
         .. versionadded:: 1.5
+    chunk_concurrency: :class:`int`
+        The maximum number of guilds per shard whose members are being requested
+        at once. Requests are sent as fast as the gateway rate limit allows,
+        leaving some room for other gateway commands. Defaults to 8.
+
+        .. versionadded:: 2.7
+    chunk_priority: Optional[Callable[[:class:`Guild`], :class:`float`]]
+        A function deciding which guilds have their members requested first,
+        guilds with higher values go first. :meth:`Guild.chunk` always goes
+        ahead of the guilds chunked at start-up. Defaults to the member count
+        of the guild, so larger guilds are chunked first.
+
+        .. versionadded:: 2.7
+    chunk_timeout: Optional[:class:`float`]
+        How many seconds to wait for the members of a guild before giving up
+        on it. A warning is logged, anyone waiting on the guild receives the
+        members received so far, and the guild is not counted as chunked in
+        :func:`on_chunk_progress`. ``None`` waits forever, so a guild that is
+        never answered keeps one of the ``chunk_concurrency`` slots. Defaults
+        to 60.
+
+        .. versionadded:: 2.7
     status: Optional[:class:`.Status`]
         A status to start your presence with upon logging on to Discord.
     activity: Optional[:class:`.BaseActivity`]
@@ -193,6 +256,15 @@ class Client:
         sync your system clock to Google's NTP server.
 
         .. versionadded:: 1.3
+    global_ratelimit: Optional[:class:`GlobalRateLimit`]
+        The budget used to pre-emptively respect Discord's global rate limit of
+        50 requests per second. Defaults to a :class:`LocalGlobalRateLimit`, which is
+        only shared within this process. Pass a :class:`FileLockGlobalRateLimit` (or
+        your own :class:`GlobalRateLimit`) to share the budget between processes
+        running shards of the same bot, or ``None`` to only handle the global rate
+        limit once Discord reports it.
+
+        .. versionadded:: 2.7
     enable_debug_events: :class:`bool`
         Whether to enable events that are useful only for debugging gateway related information.
 
@@ -201,6 +273,56 @@ class Client:
         To enable these events, this must be set to ``True``. Defaults to ``False``.
 
         .. versionadded:: 2.0
+    gateway_compression: Optional[:class:`str`]
+        The transport compression to use for the gateway connection. Can be
+        ``"zlib-stream"`` (the default), ``"zstd-stream"`` or ``None`` to disable
+        compression. ``"zstd-stream"`` requires Python 3.14 or the
+        `zstandard <https://pypi.org/project/zstandard/>`_ package.
+
+        .. versionadded:: 2.7
+    gateway_offload_threshold: Optional[:class:`int`]
+        The size in bytes from which compressed gateway messages are decompressed
+        and parsed in a worker thread instead of on the event loop, so that large
+        payloads such as ``GUILD_CREATE`` do not block other coroutines. Events are
+        still processed in the order they are received. Defaults to ``None``, which
+        handles every message on the event loop.
+
+        .. versionadded:: 2.7
+    event_executor: Optional[:class:`EventExecutor`]
+        Runs event handlers on a bounded pool of workers per event, instead of
+        starting a new task for every handler of every event. Defaults to ``None``,
+        which keeps the latter behaviour. Handlers that are still queued or
+        running are cancelled when the client is closed.
+
+        .. warning::
+
+            With :attr:`EventOverflowPolicy.block`, a full queue stops the
+            gateway from reading, heartbeat acknowledgements included. If the
+            handlers don't catch up within the heartbeat timeout, the
+            connection is considered dead and the client reconnects.
+
+        .. versionadded:: 2.7
+    event_parsing: Dict[:class:`str`, :class:`EventParseMode`]
+        How to handle specific gateway events, keyed by their gateway name (e.g.
+        ``"PRESENCE_UPDATE"`` or ``"TYPING_START"``). Events that are ignored cost
+        close to nothing, which helps when an intent is needed for other features
+        but some of its events are not. Events that are not listed are parsed
+        fully.
+
+        :attr:`EventParseMode.raw` is only supported by events that have an
+        ``on_raw_*`` counterpart, and ``READY``, ``RESUMED`` and ``GUILD_CREATE``
+        must always be parsed fully.
+
+        .. warning::
+
+            Events handled as :attr:`EventParseMode.raw` or
+            :attr:`EventParseMode.ignore` no longer update the cache. Raw
+            ``MESSAGE_DELETE``, ``MESSAGE_DELETE_BULK``, ``THREAD_DELETE`` and
+            ``GUILD_MEMBER_REMOVE`` events still remove what they delete, but
+            raw updates such as ``MESSAGE_UPDATE`` and ``THREAD_UPDATE`` leave
+            the cached objects as they were, and ignored events change nothing.
+
+        .. versionadded:: 2.7
     cache_app_emojis: :class:`bool`
         Whether to automatically fetch and cache the application's emojis on startup and when fetching. Defaults to ``False``.
 
@@ -211,6 +333,12 @@ class Client:
             run :func:`fetch_emojis`.
 
         .. versionadded:: 2.7
+    component_state_store: Optional[:class:`~discord.ui.ComponentStateStore`]
+        Where components handled by :meth:`add_dynamic_handler` keep the state of
+        their messages, for example a :class:`~discord.ui.SQLiteComponentStateStore`.
+        Defaults to ``None``, in which case dynamic handlers can't store state.
+
+        .. versionadded:: 2.7
 
     Attributes
     -----------
@@ -231,9 +359,10 @@ class Client:
         self.loop: asyncio.AbstractEventLoop = (
             asyncio.get_event_loop() if loop is None else loop
         )
-        self._listeners: dict[str, list[tuple[asyncio.Future, Callable[..., bool]]]] = (
-            {}
-        )
+        # event -> secondary key -> future -> check
+        self._listeners: dict[
+            str, dict[Any, dict[asyncio.Future, Callable[..., bool]]]
+        ] = {}
         self.shard_id: int | None = options.get("shard_id")
         self.shard_count: int | None = options.get("shard_count")
 
@@ -241,12 +370,16 @@ class Client:
         proxy: str | None = options.pop("proxy", None)
         proxy_auth: aiohttp.BasicAuth | None = options.pop("proxy_auth", None)
         unsync_clock: bool = options.pop("assume_unsync_clock", True)
+        global_ratelimit: GlobalRateLimit | None = options.pop(
+            "global_ratelimit", MISSING
+        )
         self.http: HTTPClient = HTTPClient(
             connector,
             proxy=proxy,
             proxy_auth=proxy_auth,
             unsync_clock=unsync_clock,
             loop=self.loop,
+            global_ratelimit=global_ratelimit,
         )
 
         self._handlers: dict[str, Callable] = {"ready": self._handle_ready}
@@ -256,6 +389,25 @@ class Client:
         }
 
         self._enable_debug_events: bool = options.pop("enable_debug_events", False)
+        self._gateway_compression: str | None = options.pop(
+            "gateway_compression", "zlib-stream"
+        )
+        if (
+            self._gateway_compression is not None
+            and self._gateway_compression not in GATEWAY_COMPRESSIONS
+        ):
+            raise ValueError(
+                "gateway_compression must be one of"
+                f" {', '.join(GATEWAY_COMPRESSIONS)} or None"
+            )
+        if self._gateway_compression == "zstd-stream" and _zstd is None:
+            raise RuntimeError(
+                "zstandard is required for the zstd-stream gateway compression"
+            )
+        self._gateway_offload_threshold: int | None = options.pop(
+            "gateway_offload_threshold", None
+        )
+        self._event_executor: EventExecutor | None = options.pop("event_executor", None)
         self._connection: ConnectionState = self._get_state(**options)
         self._connection.shard_count = self.shard_count
         self._closed: bool = False
@@ -457,7 +609,13 @@ class Client:
         event_name: str,
         *args: Any,
         **kwargs: Any,
-    ) -> asyncio.Task:
+    ) -> asyncio.Task | None:
+        if self._event_executor is not None:
+            self._event_executor.submit(
+                event_name, self._run_event, coro, event_name, *args, **kwargs
+            )
+            return None
+
         wrapped = self._run_event(coro, event_name, *args, **kwargs)
 
         # Schedule task and store in set to avoid task garbage collection
@@ -466,23 +624,35 @@ class Client:
         task.add_done_callback(self._tasks.discard)
         return task
 
-    def dispatch(self, event: str, *args: Any, **kwargs: Any) -> None:
-        _log.debug("Dispatching event %s", event)
-        method = f"on_{event}"
+    def _dispatch_waiters(
+        self,
+        event: str,
+        listeners: dict[Any, dict[asyncio.Future, Callable[..., bool]]],
+        args: tuple[Any, ...],
+    ) -> None:
+        groups = [listeners.get(None)]
+        if len(listeners) > (None in listeners):
+            # only waiters registered for this event's key can match
+            try:
+                key = _WAIT_FOR_KEYS[event](*args)
+            except Exception:
+                key = None
+            if key is not None:
+                groups.append(listeners.get(key))
 
-        listeners = self._listeners.get(event)
-        if listeners:
-            removed = []
-            for i, (future, condition) in enumerate(listeners):
-                if future.cancelled():
-                    removed.append(i)
+        for waiters in groups:
+            if not waiters:
+                continue
+
+            # finished futures remove themselves through a done callback
+            for future, condition in list(waiters.items()):
+                if future.done():
                     continue
 
                 try:
                     result = condition(*args)
                 except Exception as exc:
                     future.set_exception(exc)
-                    removed.append(i)
                 else:
                     if result:
                         if len(args) == 0:
@@ -491,13 +661,29 @@ class Client:
                             future.set_result(args[0])
                         else:
                             future.set_result(args)
-                        removed.append(i)
 
-            if len(removed) == len(listeners):
-                self._listeners.pop(event)
-            else:
-                for idx in reversed(removed):
-                    del listeners[idx]
+    def _remove_waiter(self, event: str, key: Any, future: asyncio.Future) -> None:
+        listeners = self._listeners.get(event)
+        if listeners is None:
+            return
+
+        waiters = listeners.get(key)
+        if waiters is None:
+            return
+
+        waiters.pop(future, None)
+        if not waiters:
+            del listeners[key]
+            if not listeners:
+                del self._listeners[event]
+
+    def dispatch(self, event: str, *args: Any, **kwargs: Any) -> None:
+        _log.debug("Dispatching event %s", event)
+        method = f"on_{event}"
+
+        listeners = self._listeners.get(event)
+        if listeners:
+            self._dispatch_waiters(event, listeners, args)
 
         # Schedule the main handler registered with @event
         try:
@@ -759,6 +945,10 @@ class Client:
                 # if an error happens during disconnects, disregard it.
                 pass
 
+        if self._event_executor is not None:
+            # also wakes a gateway that is waiting for a full queue to drain
+            self._event_executor.cancel()
+
         if self.ws is not None and self.ws.open:
             await self.ws.close(code=1000)
 
@@ -1180,6 +1370,7 @@ class Client:
         *,
         check: Callable[..., bool] | None = None,
         timeout: float | None = None,
+        key: Any = None,
     ) -> Any:
         """|coro|
 
@@ -1212,6 +1403,17 @@ class Client:
         timeout: Optional[:class:`float`]
             The number of seconds to wait before timing out and raising
             :exc:`asyncio.TimeoutError`.
+        key: Optional[:class:`int`]
+            Only run ``check`` for events with this key. This is much cheaper than
+            filtering inside ``check`` when many waiters are pending for the same
+            event. The key depends on the event:
+
+            - ``message``, ``typing``: the channel ID.
+            - ``message_edit``, ``message_delete``: the message ID.
+            - ``reaction_add``, ``reaction_remove``: the ID of the reacted message.
+            - ``raw_reaction_add``, ``raw_reaction_remove``: :attr:`RawReactionActionEvent.message_id`.
+
+            .. versionadded:: 2.7
 
         Returns
         -------
@@ -1224,6 +1426,8 @@ class Client:
         ------
         asyncio.TimeoutError
             Raised if a timeout is provided and reached.
+        ValueError
+            A ``key`` was passed for an event that does not support keys.
 
         Examples
         --------
@@ -1261,6 +1465,10 @@ class Client:
                         await channel.send('\N{THUMBS UP SIGN}')
         """
 
+        ev = event.lower()
+        if key is not None and ev not in _WAIT_FOR_KEYS:
+            raise ValueError(f"the {ev!r} event does not support waiting by key")
+
         future = self.loop.create_future()
         if check is None:
 
@@ -1269,14 +1477,9 @@ class Client:
 
             check = _check
 
-        ev = event.lower()
-        try:
-            listeners = self._listeners[ev]
-        except KeyError:
-            listeners = []
-            self._listeners[ev] = listeners
-
-        listeners.append((future, check))
+        listeners = self._listeners.setdefault(ev, {})
+        listeners.setdefault(key, {})[future] = check
+        future.add_done_callback(functools.partial(self._remove_waiter, ev, key))
         return asyncio.wait_for(future, timeout)
 
     # event registration
@@ -2056,6 +2259,124 @@ class Client:
 
         self._connection.store_view(view, message_id)
 
+    def add_dynamic_handler(
+        self,
+        prefix: str,
+        handler: DynamicHandler,
+        *,
+        pattern: str | re.Pattern[str] | None = None,
+        component_type: ComponentType | None = None,
+    ) -> None:
+        """Registers a handler for every component whose ``custom_id`` starts with a prefix.
+
+        Unlike :meth:`add_view`, this does not keep a :class:`~discord.ui.View`
+        in memory for every message the components are attached to. The state of
+        each message can instead be kept in the ``component_state_store`` passed
+        to the client, and is only loaded when the handler asks for it, so it
+        survives restarts. Components that belong to a view that is listening
+        are still dispatched to that view.
+
+        The handler is called with the :class:`Interaction`, the match of
+        ``pattern`` (or ``None`` if there is no pattern) and a
+        :class:`~discord.ui.ComponentState`. When several prefixes match, the
+        longest one is used. Handlers with the same prefix are tried in the
+        order they were added.
+
+        .. versionadded:: 2.7
+
+        Example
+        -------
+
+        .. code-block:: python3
+
+            async def counter(interaction, match, state):
+                count = (await state.load() or 0) + 1
+                await state.save(count)
+                await interaction.response.send_message(f"Clicked {count} times")
+
+            client.add_dynamic_handler("counter:", counter)
+
+        Parameters
+        ----------
+        prefix: :class:`str`
+            The prefix of the ``custom_id`` of the components to handle.
+        handler: Callable[[:class:`Interaction`, Optional[:class:`re.Match`], :class:`~discord.ui.ComponentState`], Awaitable[Any]]
+            The coroutine function handling the components.
+        pattern: Optional[Union[:class:`str`, :class:`re.Pattern`]]
+            A regular expression the whole ``custom_id`` must match, for example
+            to extract an ID from it.
+        component_type: Optional[:class:`ComponentType`]
+            Only handle components of this type.
+
+        Raises
+        ------
+        TypeError
+            The handler is not a coroutine function.
+        ValueError
+            The prefix is empty.
+        """
+        if not asyncio.iscoroutinefunction(handler):
+            raise TypeError("handler must be a coroutine function")
+        if not prefix:
+            raise ValueError("prefix must not be empty")
+
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern)
+
+        self._connection._dynamic_router.add(
+            _DynamicRoute(
+                prefix,
+                pattern,
+                handler,
+                component_type and component_type.value,
+            )
+        )
+
+    def remove_dynamic_handler(
+        self, prefix: str, handler: DynamicHandler | None = None
+    ) -> None:
+        """Removes the handlers registered with :meth:`add_dynamic_handler` for a prefix.
+
+        .. versionadded:: 2.7
+
+        Parameters
+        ----------
+        prefix: :class:`str`
+            The prefix the handler was registered with.
+        handler: Optional[Callable[..., Awaitable[Any]]]
+            The handler to remove. If not given, every handler of the prefix is removed.
+        """
+        self._connection._dynamic_router.remove(prefix, handler)
+
+    def dynamic_handler(
+        self,
+        prefix: str,
+        *,
+        pattern: str | re.Pattern[str] | None = None,
+        component_type: ComponentType | None = None,
+    ) -> Callable[[DynamicHandler], DynamicHandler]:
+        """A decorator that registers a handler with :meth:`add_dynamic_handler`.
+
+        .. versionadded:: 2.7
+
+        Example
+        -------
+
+        .. code-block:: python3
+
+            @client.dynamic_handler("ticket:", pattern=r"ticket:(?P<id>[0-9]+)")
+            async def ticket(interaction, match, state):
+                await interaction.response.send_message(f"Ticket {match['id']}")
+        """
+
+        def decorator(handler: DynamicHandler) -> DynamicHandler:
+            self.add_dynamic_handler(
+                prefix, handler, pattern=pattern, component_type=component_type
+            )
+            return handler
+
+        return decorator
+
     @property
     def persistent_views(self) -> Sequence[View]:
         """A sequence of persistent views added to the client.
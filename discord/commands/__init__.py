@@ -27,3 +27,4 @@ from .context import *
 from .core import *
 from .options import *
 from .permissions import *
+from .sync import *
@@ -346,6 +346,19 @@ class ApplicationCommand(_BaseCommand, Generic[CogT, P, T]):
 
                     raise CommandOnCooldown(bucket, retry_after, self._buckets.type)  # type: ignore
 
+    async def _prepare_shared_cooldowns(self, ctx: ApplicationContext):
+        # _prepare_cooldowns for buckets kept by a CooldownBackend, which has to be
+        # awaited; without a backend the synchronous version is used as before
+        if not self._buckets.valid or self._buckets.backend is None:
+            return self._prepare_cooldowns(ctx)
+
+        current = datetime.datetime.now().timestamp()
+        bucket, retry_after = await self._buckets._update_shared_rate_limit(ctx, current)  # type: ignore # ctx instead of non-existent message
+        if bucket is not None and retry_after:
+            from ..ext.commands.errors import CommandOnCooldown
+
+            raise CommandOnCooldown(bucket, retry_after, self._buckets.type)  # type: ignore
+
     async def prepare(self, ctx: ApplicationContext) -> None:
         # This should be same across all 3 types
         ctx.command = self
@@ -360,7 +373,7 @@ class ApplicationCommand(_BaseCommand, Generic[CogT, P, T]):
             await self._max_concurrency.acquire(ctx)  # type: ignore # ctx instead of non-existent message
 
         try:
-            self._prepare_cooldowns(ctx)
+            await self._prepare_shared_cooldowns(ctx)
             await self.call_before_hooks(ctx)
         except:
             if self._max_concurrency is not None:
@@ -402,6 +415,7 @@ class ApplicationCommand(_BaseCommand, Generic[CogT, P, T]):
         if self._buckets.valid:
             bucket = self._buckets.get_bucket(ctx)  # type: ignore # ctx instead of non-existent message
             bucket.reset()
+            self._buckets._reset_shared(ctx)  # type: ignore
 
     def get_cooldown_retry_after(self, ctx: ApplicationContext) -> float:
         """Retrieves the amount of seconds before this command can be tried again.
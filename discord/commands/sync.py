@@ -0,0 +1,179 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+from typing import TYPE_CHECKING, Any, Iterable
+
+if TYPE_CHECKING:
+    from .core import ApplicationCommand
+
+__all__ = (
+    "CommandSyncStore",
+    "JSONCommandSyncStore",
+)
+
+
+def _commands_hash(commands: Iterable[ApplicationCommand]) -> str:
+    payloads = sorted(
+        (cmd.to_dict() for cmd in commands),
+        key=lambda d: (d.get("type", 1), d["name"]),
+    )
+    raw = json.dumps(payloads, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class CommandSyncStore:
+    """Stores what was last synced for each scope of application commands, so
+    that :meth:`Bot.sync_commands` can skip scopes that have not changed.
+
+    A scope is either the global commands of an application or its commands in
+    a single guild. Each entry is a mapping with a ``hash`` key containing the
+    hash of the local command payloads, and a ``commands`` key containing the
+    IDs, names, types and guild IDs of the commands Discord returned.
+
+    Subclass this and implement :meth:`get` and :meth:`set` to store the entries
+    elsewhere, such as in a database.
+
+    .. versionadded:: 2.7
+    """
+
+    async def get(
+        self, application_id: int, guild_id: int | None
+    ) -> dict[str, Any] | None:
+        """|coro|
+
+        Returns the stored entry for a scope, or ``None`` if there is none.
+
+        Parameters
+        ----------
+        application_id: :class:`int`
+            The ID of the application the commands belong to.
+        guild_id: Optional[:class:`int`]
+            The ID of the guild, or ``None`` for global commands.
+        """
+        raise NotImplementedError
+
+    async def set(
+        self, application_id: int, guild_id: int | None, entry: dict[str, Any]
+    ) -> None:
+        """|coro|
+
+        Stores the entry for a scope, replacing any existing one.
+
+        Parameters
+        ----------
+        application_id: :class:`int`
+            The ID of the application the commands belong to.
+        guild_id: Optional[:class:`int`]
+            The ID of the guild, or ``None`` for global commands.
+        entry: Dict[:class:`str`, Any]
+            The entry to store.
+        """
+        raise NotImplementedError
+
+    async def clear(self) -> None:
+        """|coro|
+
+        Removes every stored entry, forcing the next sync to check all scopes
+        with Discord. The default implementation does nothing.
+        """
+
+
+class JSONCommandSyncStore(CommandSyncStore):
+    """A :class:`CommandSyncStore` that keeps its entries in a JSON file.
+
+    The file is read once and rewritten whenever an entry changes.
+
+    .. versionadded:: 2.7
+
+    Parameters
+    ----------
+    path: Union[:class:`str`, :class:`os.PathLike`]
+        The path of the file. It is created if it does not exist.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path: str = os.fspath(path)
+        self._entries: dict[str, dict[str, Any]] | None = None
+        self._lock: asyncio.Lock | None = None
+
+    @staticmethod
+    def _key(application_id: int, guild_id: int | None) -> str:
+        return f"{application_id}:{guild_id or 'global'}"
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        try:
+            with open(self.path, encoding="utf-8") as fp:
+                data = json.load(fp)
+        except (FileNotFoundError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _write(self, entries: dict[str, dict[str, Any]]) -> None:
+        # write to a temporary file first so a crash can't leave half a file behind
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fp:
+            json.dump(entries, fp, separators=(",", ":"))
+        os.replace(tmp, self.path)
+
+    @property
+    def _io_lock(self) -> asyncio.Lock:
+        # created lazily so it is bound to the running loop
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def _load(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            loop = asyncio.get_running_loop()
+            self._entries = await loop.run_in_executor(None, self._read)
+        return self._entries
+
+    async def get(
+        self, application_id: int, guild_id: int | None
+    ) -> dict[str, Any] | None:
+        async with self._io_lock:
+            entries = await self._load()
+            return entries.get(self._key(application_id, guild_id))
+
+    async def set(
+        self, application_id: int, guild_id: int | None, entry: dict[str, Any]
+    ) -> None:
+        async with self._io_lock:
+            entries = await self._load()
+            entries[self._key(application_id, guild_id)] = entry
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._write, dict(entries))
+
+    async def clear(self) -> None:
+        async with self._io_lock:
+            self._entries = {}
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._write, {})
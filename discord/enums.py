@@ -82,6 +82,8 @@ __all__ = (
     "ThreadArchiveDuration",
     "SubscriptionStatus",
     "SeparatorSpacingSize",
+    "EventOverflowPolicy",
+    "EventParseMode",
 )
 
 
@@ -1109,6 +1111,28 @@ class SeparatorSpacingSize(Enum):
         return self.value
 
 
+class EventOverflowPolicy(Enum):
+    """What an :class:`EventExecutor` does once an event's queue is full."""
+
+    drop = "drop"
+    block = "block"
+    spill = "spill"
+
+    def __str__(self):
+        return self.name
+
+
+class EventParseMode(Enum):
+    """How :class:`Client` handles a gateway event."""
+
+    full = "full"
+    raw = "raw"
+    ignore = "ignore"
+
+    def __str__(self):
+        return self.name
+
+
 T = TypeVar("T")
 
 
@@ -0,0 +1,294 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Coroutine
+
+from .enums import EventOverflowPolicy
+
+if TYPE_CHECKING:
+    EventJob = tuple[Callable[..., Coroutine[Any, Any, Any]], tuple, dict]
+
+__all__ = (
+    "EventExecutor",
+    "EventStats",
+)
+
+_log = logging.getLogger(__name__)
+
+
+class EventStats:
+    """Statistics about how the handlers of one event are executed.
+
+    These are returned by :meth:`EventExecutor.stats`.
+
+    .. versionadded:: 2.7
+
+    Attributes
+    ----------
+    queued: :class:`int`
+        The number of handler calls currently waiting to run, including the
+        overflow queue.
+    running: :class:`int`
+        The number of handler calls currently running.
+    processed: :class:`int`
+        The number of handler calls that finished running.
+    dropped: :class:`int`
+        The number of handler calls that were dropped because the queue was full.
+    overflowed: :class:`int`
+        The number of handler calls that were put in the overflow queue.
+    total_latency: :class:`float`
+        The total time in seconds spent running handlers.
+    max_latency: :class:`float`
+        The longest time in seconds a single handler call took.
+    """
+
+    __slots__ = (
+        "queued",
+        "running",
+        "processed",
+        "dropped",
+        "overflowed",
+        "total_latency",
+        "max_latency",
+    )
+
+    def __init__(self) -> None:
+        self.queued: int = 0
+        self.running: int = 0
+        self.processed: int = 0
+        self.dropped: int = 0
+        self.overflowed: int = 0
+        self.total_latency: float = 0.0
+        self.max_latency: float = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"<EventStats queued={self.queued} running={self.running}"
+            f" processed={self.processed} dropped={self.dropped}"
+            f" average_latency={self.average_latency:.4f}>"
+        )
+
+    @property
+    def average_latency(self) -> float:
+        """The average time in seconds a handler call took."""
+        if not self.processed:
+            return 0.0
+        return self.total_latency / self.processed
+
+    def _copy(self) -> EventStats:
+        stats = EventStats()
+        for attr in self.__slots__:
+            setattr(stats, attr, getattr(self, attr))
+        return stats
+
+
+class _EventQueue:
+    __slots__ = ("jobs", "overflow", "workers", "stats")
+
+    def __init__(self) -> None:
+        self.jobs: deque[EventJob] = deque()
+        self.overflow: deque[EventJob] = deque()
+        self.workers: int = 0
+        self.stats: EventStats = EventStats()
+
+
+class EventExecutor:
+    """Runs event handlers on a bounded pool of workers per event.
+
+    By default, :class:`Client` starts a new task for every handler of every
+    event. When an executor is passed as ``event_executor`` instead, each
+    event gets at most ``workers`` tasks that run its handlers one after the
+    other, and at most ``max_queue`` handler calls wait for a free worker.
+    What happens beyond that is decided by ``overflow``.
+
+    .. versionadded:: 2.7
+
+    Parameters
+    ----------
+    workers: :class:`int`
+        The maximum number of handlers running concurrently for a single event.
+        Defaults to ``16``.
+    max_queue: :class:`int`
+        The maximum number of handler calls waiting for a worker, per event.
+        Defaults to ``1000``.
+    overflow: :class:`EventOverflowPolicy`
+        What to do with handler calls once the queue is full. Defaults to
+        :attr:`EventOverflowPolicy.drop`.
+
+        With :attr:`EventOverflowPolicy.block`, the gateway stops reading
+        until the queue has room again. That includes the acknowledgements of
+        its heartbeats, so if the queue stays full for longer than the
+        heartbeat timeout the connection is considered dead and reconnected.
+        Use this policy only with handlers that reliably finish quickly.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int = 16,
+        max_queue: int = 1000,
+        overflow: EventOverflowPolicy = EventOverflowPolicy.drop,
+    ) -> None:
+        if workers <= 0:
+            raise ValueError("workers must be greater than 0")
+        if max_queue < 0:
+            raise ValueError("max_queue cannot be negative")
+        if not isinstance(overflow, EventOverflowPolicy):
+            raise TypeError(
+                f"overflow must be EventOverflowPolicy not {overflow.__class__!r}"
+            )
+
+        self.workers: int = workers
+        self.max_queue: int = max_queue
+        self.overflow: EventOverflowPolicy = overflow
+        self._queues: dict[str, _EventQueue] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._blocked: int = 0
+        self._capacity: asyncio.Event | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"<EventExecutor workers={self.workers} max_queue={self.max_queue}"
+            f" overflow={self.overflow}>"
+        )
+
+    def stats(self) -> dict[str, EventStats]:
+        """Returns a snapshot of the statistics of every event handled so far.
+
+        Returns
+        -------
+        Dict[:class:`str`, :class:`EventStats`]
+            A mapping of the event's method name (e.g. ``on_message``) to
+            its statistics.
+        """
+        return {name: queue.stats._copy() for name, queue in self._queues.items()}
+
+    def submit(
+        self,
+        event_name: str,
+        coro: Callable[..., Coroutine[Any, Any, Any]],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Queues ``coro(*args, **kwargs)`` to run on the workers of ``event_name``."""
+        try:
+            queue = self._queues[event_name]
+        except KeyError:
+            queue = self._queues[event_name] = _EventQueue()
+
+        job = (coro, args, kwargs)
+        stats = queue.stats
+        if len(queue.jobs) < self.max_queue or queue.workers < self.workers:
+            queue.jobs.append(job)
+        elif self.overflow is EventOverflowPolicy.drop:
+            stats.dropped += 1
+            _log.debug("Event queue for %s is full, dropping handler.", event_name)
+            return
+        else:
+            if not queue.overflow and self.overflow is EventOverflowPolicy.block:
+                self._block()
+            queue.overflow.append(job)
+            stats.overflowed += 1
+
+        stats.queued += 1
+        if queue.workers < self.workers:
+            queue.workers += 1
+            task = asyncio.create_task(
+                self._worker(event_name, queue), name=f"pycord: {event_name} worker"
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _worker(self, event_name: str, queue: _EventQueue) -> None:
+        stats = queue.stats
+        try:
+            while queue.jobs:
+                coro, args, kwargs = queue.jobs.popleft()
+                if queue.overflow:
+                    queue.jobs.append(queue.overflow.popleft())
+                    if (
+                        not queue.overflow
+                        and self.overflow is EventOverflowPolicy.block
+                    ):
+                        self._unblock()
+
+                stats.queued -= 1
+                stats.running += 1
+                start = time.perf_counter()
+                try:
+                    await coro(*args, **kwargs)
+                except Exception:
+                    _log.exception("Unhandled exception in %s handler.", event_name)
+                finally:
+                    elapsed = time.perf_counter() - start
+                    stats.running -= 1
+                    stats.processed += 1
+                    stats.total_latency += elapsed
+                    if elapsed > stats.max_latency:
+                        stats.max_latency = elapsed
+        finally:
+            queue.workers -= 1
+
+    def _block(self) -> None:
+        self._blocked += 1
+        if self._capacity is None:
+            self._capacity = asyncio.Event()
+        self._capacity.clear()
+
+    def _unblock(self) -> None:
+        self._blocked -= 1
+        if not self._blocked and self._capacity is not None:
+            self._capacity.set()
+
+    def is_blocked(self) -> bool:
+        """Whether an event queue is full and the gateway should stop reading."""
+        return self._blocked > 0
+
+    async def wait(self) -> None:
+        """|coro|
+
+        Waits until no event queue is blocking the gateway anymore.
+        """
+        if self._blocked and self._capacity is not None:
+            await self._capacity.wait()
+
+    def cancel(self) -> None:
+        """Cancels all running workers and clears the queues."""
+        for task in self._tasks:
+            task.cancel()
+        for queue in self._queues.values():
+            queue.jobs.clear()
+            queue.overflow.clear()
+            queue.stats.queued = 0
+        self._blocked = 0
+        if self._capacity is not None:
+            self._capacity.set()
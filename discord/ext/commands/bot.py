@@ -41,6 +41,7 @@ from .view import StringView
 
 if TYPE_CHECKING:
     from discord.message import Message
+    from discord.types.message import Message as MessagePayload
 
     from ._types import CoroFunc
 
@@ -109,6 +110,62 @@ def _is_submodule(parent: str, child: str) -> bool:
     return parent == child or child.startswith(f"{parent}.")
 
 
+class _PrefixMatcher:
+    """A trie of command prefixes.
+
+    Matching walks the message content at most as far as the longest prefix,
+    however many prefixes there are. When several prefixes match, the one
+    that comes first in ``prefixes`` wins, like with :meth:`str.startswith`
+    on each of them in order.
+    """
+
+    __slots__ = ("prefixes", "first_chars", "_root", "_depth")
+
+    def __init__(self, prefixes: str | list[str]) -> None:
+        if isinstance(prefixes, str):
+            prefixes = [prefixes]
+
+        self.prefixes: list[str] = prefixes
+        # char: child node, and None: index of the prefix ending at this node
+        self._root: dict[str | None, Any] = {}
+        self._depth: int = 0
+        for index, prefix in enumerate(prefixes):
+            if not isinstance(prefix, str):
+                raise TypeError(
+                    "Iterable command_prefix or list returned from get_prefix"
+                    f" must contain only strings, not {prefix.__class__.__name__}"
+                )
+
+            node = self._root
+            for char in prefix:
+                node = node.setdefault(char, {})
+            node.setdefault(None, index)
+            self._depth = max(self._depth, len(prefix))
+
+        #: The characters a message must start with to possibly match, or
+        #: ``None`` if an empty prefix matches every message.
+        self.first_chars: frozenset[str] | None = (
+            None if None in self._root else frozenset(self._root)
+        )
+
+    def match(self, content: str) -> str | None:
+        node = self._root
+        best: int | None = node.get(None)
+        for char in content[: self._depth]:
+            if best == 0:
+                break
+            node = node.get(char)
+            if node is None:
+                break
+            index = node.get(None)
+            if index is not None and (best is None or index < best):
+                best = index
+
+        if best is None:
+            return None
+        return self.prefixes[best]
+
+
 class BotBase(GroupMixin, discord.cog.CogMixin):
     _help_command = None
     _supports_prefixed_commands = True
@@ -127,11 +184,22 @@ class BotBase(GroupMixin, discord.cog.CogMixin):
         **options,
     ):
         super().__init__(**options)
+        # prefixes returned by get_prefix: their compiled matcher
+        self._prefix_matchers: collections.OrderedDict[
+            str | tuple[str, ...], _PrefixMatcher
+        ] = collections.OrderedDict()
+        self.prefix_cache_size: int | None = options.get("prefix_cache_size")
+        # guild ID, or None for DMs: the matcher of the prefixes resolved for it
+        self._guild_prefixes: collections.OrderedDict[int | None, _PrefixMatcher] = (
+            collections.OrderedDict()
+        )
         self.command_prefix = command_prefix
         self.help_command = (
             DefaultHelpCommand() if help_command is MISSING else help_command
         )
         self.strip_after_prefix = options.get("strip_after_prefix", False)
+        if options.get("skip_non_command_messages", False):
+            self._connection._message_filter = self._is_command_payload
 
     @discord.utils.copy_doc(discord.Client.close)
     async def close(self) -> None:
@@ -209,6 +277,131 @@ class BotBase(GroupMixin, discord.cog.CogMixin):
 
     # command processing
 
+    @property
+    def command_prefix(
+        self,
+    ) -> (
+        str
+        | Iterable[str]
+        | Callable[
+            [Bot | AutoShardedBot, Message],
+            str | Iterable[str] | Coroutine[Any, Any, str | Iterable[str]],
+        ]
+    ):
+        return self._command_prefix
+
+    @command_prefix.setter
+    def command_prefix(self, value) -> None:
+        self._command_prefix = value
+        self.invalidate_prefix_cache()
+
+    def invalidate_prefix_cache(
+        self, guild: discord.abc.Snowflake | None = None
+    ) -> None:
+        """Forgets the prefixes cached for a guild, so that they are resolved
+        again through :meth:`get_prefix` for its next message.
+
+        Only needed when ``prefix_cache_size`` is set and the prefixes of a guild
+        change, for example when a guild changes its prefix in a database.
+        Setting :attr:`command_prefix` clears the whole cache.
+
+        .. versionadded:: 2.7
+
+        Parameters
+        ----------
+        guild: Optional[:class:`~discord.abc.Snowflake`]
+            The guild whose prefixes to forget. If not given, the prefixes of
+            every guild and of direct messages are forgotten.
+        """
+        if guild is None:
+            self._guild_prefixes.clear()
+            self._prefix_matchers.clear()
+        else:
+            self._guild_prefixes.pop(guild.id, None)
+
+    def _compile_prefix(self, prefix: str | list[str]) -> _PrefixMatcher:
+        if isinstance(prefix, str):
+            key = prefix
+        else:
+            try:
+                prefix = list(prefix)
+            except TypeError:
+                raise TypeError(
+                    "get_prefix must return either a string or a list of string, "
+                    f"not {prefix.__class__.__name__}"
+                ) from None
+
+            key = tuple(prefix)
+            try:
+                hash(key)
+            except TypeError:
+                # an unhashable item, _PrefixMatcher raises the appropriate error
+                return _PrefixMatcher(prefix)
+
+        matchers = self._prefix_matchers
+        matcher = matchers.get(key)
+        if matcher is None:
+            matcher = matchers[key] = _PrefixMatcher(prefix)
+            if len(matchers) > 128:
+                matchers.popitem(last=False)
+        else:
+            matchers.move_to_end(key)
+        return matcher
+
+    async def _get_prefix_matcher(self, message: Message) -> _PrefixMatcher:
+        if not self.prefix_cache_size:
+            return self._compile_prefix(await self.get_prefix(message))
+
+        guild_id = message.guild and message.guild.id
+        cache = self._guild_prefixes
+        matcher = cache.get(guild_id)
+        if matcher is not None:
+            cache.move_to_end(guild_id)
+            return matcher
+
+        matcher = cache[guild_id] = self._compile_prefix(await self.get_prefix(message))
+        while len(cache) > self.prefix_cache_size:
+            cache.popitem(last=False)
+        return matcher
+
+    def _known_prefix_matcher(self, guild_id: int | None) -> _PrefixMatcher | None:
+        # the matcher of a message's prefixes if it is known without calling get_prefix
+        if type(self).get_context is not BotBase.get_context:
+            # an overridden get_context may accept messages without these prefixes
+            return None
+
+        if self.prefix_cache_size:
+            matcher = self._guild_prefixes.get(guild_id)
+            if matcher is not None:
+                return matcher
+
+        prefix = self._command_prefix
+        if callable(prefix) or type(self).get_prefix is not BotBase.get_prefix:
+            return None
+
+        try:
+            return self._compile_prefix(prefix)
+        except TypeError:
+            # let get_prefix raise the error for the message
+            return None
+
+    def _may_be_command(self, content: str, guild_id: int | None) -> bool:
+        matcher = self._known_prefix_matcher(guild_id)
+        if matcher is None:
+            return True
+
+        first_chars = matcher.first_chars
+        if first_chars is not None and content[:1] not in first_chars:
+            return False
+        return matcher.match(content) is not None
+
+    def _is_command_payload(self, data: MessagePayload) -> bool:
+        if data["author"].get("bot") or data.get("webhook_id"):
+            return False
+        return self._may_be_command(
+            data.get("content", ""), discord.utils._get_as_snowflake(data, "guild_id")
+        )
+
     async def get_prefix(self, message: Message) -> list[str] | str:
         """|coro|
 
@@ -287,47 +480,19 @@ class BotBase(GroupMixin, discord.cog.CogMixin):
         if message.author.id == self.user.id:  # type: ignore
             return ctx
 
-        prefix = await self.get_prefix(message)
-        invoked_prefix = prefix
-
-        if isinstance(prefix, str):
-            if not view.skip_string(prefix):
-                return ctx
-        else:
-            try:
-                # if the context class' __init__ consumes something from the view this
-                # will be wrong.  That seems unreasonable though.
-                if message.content.startswith(tuple(prefix)):
-                    invoked_prefix = discord.utils.find(view.skip_string, prefix)
-                else:
-                    return ctx
-
-            except TypeError:
-                if not isinstance(prefix, list):
-                    raise TypeError(
-                        "get_prefix must return either a string or a list of string, "
-                        f"not {prefix.__class__.__name__}"
-                    )
-
-                # It's possible a bad command_prefix got us here.
-                for value in prefix:
-                    if not isinstance(value, str):
-                        raise TypeError(
-                            "Iterable command_prefix or list returned from get_prefix"
-                            " must contain only strings, not"
-                            f" {value.__class__.__name__}"
-                        )
-
-                # Getting here shouldn't happen
-                raise
+        # if the context class' __init__ consumes something from the view this
+        # will be wrong.  That seems unreasonable though.
+        matcher = await self._get_prefix_matcher(message)
+        invoked_prefix = matcher.match(message.content)
+        if invoked_prefix is None or not view.skip_string(invoked_prefix):
+            return ctx
 
         if self.strip_after_prefix:
             view.skip_ws()
 
         invoker = view.get_word()
         ctx.invoked_with = invoker
-        # type-checker fails to narrow invoked_prefix type.
-        ctx.prefix = invoked_prefix  # type: ignore
+        ctx.prefix = invoked_prefix
         ctx.command = self.prefixed_commands.get(invoker)
         return ctx
 
@@ -382,6 +547,10 @@ class BotBase(GroupMixin, discord.cog.CogMixin):
         if message.author.bot:
             return
 
+        guild_id = message.guild and message.guild.id
+        if not self._may_be_command(message.content, guild_id):
+            return
+
         ctx = await self.get_context(message)
         await self.invoke(ctx)
 
@@ -448,6 +617,38 @@ class Bot(BotBase, discord.Bot):
         the ``command_prefix`` is set to ``!``. Defaults to ``False``.
 
         .. versionadded:: 1.7
+    prefix_cache_size: Optional[:class:`int`]
+        The number of guilds whose prefixes are cached, so that :meth:`.get_prefix`
+        is only called for the first message of a guild instead of for every message.
+        This assumes the prefixes only depend on the guild of the message, with
+        direct messages sharing a single entry. Use :meth:`.invalidate_prefix_cache`
+        when the prefixes of a guild change. Defaults to ``None``, which disables
+        the cache.
+
+        .. versionadded:: 2.7
+    skip_non_command_messages: :class:`bool`
+        Whether to drop messages that cannot invoke a command as soon as they are
+        received, before a :class:`discord.Message` is created for them. Messages
+        sent by bots and webhooks, and messages that don't start with one of the
+        prefixes, are not cached and don't trigger :func:`discord.on_message`.
+        This saves time and memory for bots that only use messages for commands.
+
+        Prefixes returned by a callable :attr:`command_prefix` (such as
+        :func:`.when_mentioned`) or an overridden :meth:`.get_prefix` can only be
+        checked once they are in the cache enabled by ``prefix_cache_size``.
+        If :meth:`.get_context` is overridden, only messages sent by bots and
+        webhooks are dropped. Defaults to ``False``.
+
+        .. warning::
+
+            Dropped messages are not seen by anything: besides
+            :func:`discord.on_message`, no other listener and no
+            :meth:`~discord.Client.wait_for` for ``"message"`` receives them.
+            Their authors and polls are not cached either, so votes on a poll
+            in such a message only dispatch :func:`discord.on_raw_poll_vote_add`
+            and :func:`discord.on_raw_poll_vote_remove`.
+
+        .. versionadded:: 2.7
     """
 
 
@@ -26,9 +26,12 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
+import logging
 import time
-from collections import deque
-from typing import TYPE_CHECKING, Any, Callable, Deque, TypeVar
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING, Any, Callable, Deque, Iterator, TypeVar
 
 import discord.abc
 from discord.enums import Enum
@@ -42,11 +45,14 @@ if TYPE_CHECKING:
 __all__ = (
     "BucketType",
     "Cooldown",
+    "CooldownBackend",
     "CooldownMapping",
     "DynamicCooldownMapping",
     "MaxConcurrency",
 )
 
+_log = logging.getLogger(__name__)
+
 C = TypeVar("C", bound="CooldownMapping")
 MC = TypeVar("MC", bound="MaxConcurrency")
 
@@ -204,22 +210,108 @@ class Cooldown:
         )
 
 
+class CooldownBackend:
+    """The base class for cooldown storage shared between processes.
+
+    By default every process keeps its own cooldowns, so a bot whose shards
+    run in several processes lets a user use a command ``rate`` times per
+    process. Passing a backend to :func:`.cooldown` or :func:`.dynamic_cooldown`
+    makes the command ask the backend instead, for example a Redis server
+    every process connects to.
+
+    Buckets are identified by a namespace, which is unique per command, and
+    the key returned by the command's :class:`.BucketType` or callable.
+
+    ``max_size`` only bounds the buckets kept in this process, the backend is
+    responsible for expiring its own buckets, for example once ``cooldown.per``
+    seconds have passed since they were last used.
+
+    .. versionadded:: 2.7
+
+    .. note::
+
+        :meth:`.Command.is_on_cooldown` and :meth:`.Command.get_cooldown_retry_after`
+        only look at the cooldowns of this process.
+    """
+
+    async def update_rate_limit(
+        self, namespace: str, key: Any, cooldown: Cooldown, current: float
+    ) -> float | None:
+        """|coro|
+
+        Uses a token of a bucket, creating the bucket if needed.
+
+        Parameters
+        ----------
+        namespace: :class:`str`
+            The namespace of the command the bucket belongs to.
+        key: Any
+            The key of the bucket.
+        cooldown: :class:`.Cooldown`
+            The rate and period of the bucket.
+        current: :class:`float`
+            The time in seconds since Unix epoch to update the rate limit at.
+
+        Returns
+        -------
+        Optional[:class:`float`]
+            The retry-after time in seconds if rate limited.
+        """
+        raise NotImplementedError
+
+    async def reset(self, namespace: str, key: Any) -> None:
+        """|coro|
+
+        Resets a bucket to its initial state.
+
+        Parameters
+        ----------
+        namespace: :class:`str`
+            The namespace of the command the bucket belongs to.
+        key: Any
+            The key of the bucket.
+        """
+        raise NotImplementedError
+
+
 class CooldownMapping:
     def __init__(
         self,
         original: Cooldown | None,
         type: Callable[[Message], Any],
+        *,
+        max_size: int | None = None,
+        backend: CooldownBackend | None = None,
+        namespace: str | None = None,
     ) -> None:
         if not callable(type):
             raise TypeError("Cooldown type must be a BucketType or callable")
 
-        self._cache: dict[Any, Cooldown] = {}
+        # ordered from least to most recently used, for max_size
+        self._cache: OrderedDict[Any, Cooldown] = OrderedDict()
+        # (expiry, counter, key, bucket) for every bucket in the cache
+        self._expiry: list[tuple[float, int, Any, Cooldown]] = []
+        self._counter: Iterator[int] = itertools.count()
         self._cooldown: Cooldown | None = original
         self._type: Callable[[Message], Any] = type
+        self.max_size: int | None = max_size
+        self.backend: CooldownBackend | None = backend
+        self.namespace: str | None = namespace
+
+    def _copy_options(self) -> dict[str, Any]:
+        return {
+            "max_size": self.max_size,
+            "backend": self.backend,
+            "namespace": self.namespace,
+        }
+
+    def _copy_cache(self, other: CooldownMapping) -> None:
+        self._cache = other._cache.copy()
+        self._expiry = other._expiry.copy()
 
     def copy(self) -> CooldownMapping:
-        ret = CooldownMapping(self._cooldown, self._type)
-        ret._cache = self._cache.copy()
+        ret = CooldownMapping(self._cooldown, self._type, **self._copy_options())
+        ret._copy_cache(self)
         return ret
 
     @property
@@ -231,8 +323,8 @@ class CooldownMapping:
         return self._type
 
     @classmethod
-    def from_cooldown(cls: type[C], rate, per, type) -> C:
-        return cls(Cooldown(rate, per), type)
+    def from_cooldown(cls: type[C], rate, per, type, **kwargs: Any) -> C:
+        return cls(Cooldown(rate, per), type, **kwargs)
 
     def _bucket_key(self, msg: Message) -> Any:
         return self._type(msg)
@@ -240,11 +332,31 @@ class CooldownMapping:
     def _verify_cache_integrity(self, current: float | None = None) -> None:
         # we want to delete all cache objects that haven't been used
         # in a cooldown window. e.g. if we have a  command that has a
-        # cooldown of 60s, and it has not been used in 60s then that key should be deleted
+        # cooldown of 60s, and it has not been used in 60s then that key should be deleted.
+        # The heap only holds the expiry a bucket had when it was pushed, buckets
+        # used since are pushed again with their new expiry when they come up.
         current = current or time.time()
-        dead_keys = [k for k, v in self._cache.items() if current > v._last + v.per]
-        for k in dead_keys:
-            del self._cache[k]
+        cache = self._cache
+        heap = self._expiry
+        while heap and heap[0][0] < current:
+            _, _, key, bucket = heapq.heappop(heap)
+            if cache.get(key) is not bucket:
+                # dropped by max_size or replaced since
+                continue
+
+            expiry = bucket._last + bucket.per
+            if current > expiry:
+                del cache[key]
+            else:
+                heapq.heappush(heap, (expiry, next(self._counter), key, bucket))
+
+    def _compact_expiry(self) -> None:
+        # buckets dropped by max_size leave their entries behind until they expire
+        cache = self._cache
+        self._expiry = [
+            entry for entry in self._expiry if cache.get(entry[2]) is entry[3]
+        ]
+        heapq.heapify(self._expiry)
 
     def create_bucket(self, message: Message) -> Cooldown:
         return self._cooldown.copy()  # type: ignore
@@ -255,12 +367,21 @@ class CooldownMapping:
 
         self._verify_cache_integrity(current)
         key = self._bucket_key(message)
-        if key not in self._cache:
+        cache = self._cache
+        try:
+            bucket = cache[key]
+        except KeyError:
             bucket = self.create_bucket(message)
             if bucket is not None:
-                self._cache[key] = bucket
+                cache[key] = bucket
+                expiry = max(bucket._last, current or time.time()) + bucket.per
+                heapq.heappush(self._expiry, (expiry, next(self._counter), key, bucket))
+                if self.max_size is not None and len(cache) > self.max_size:
+                    cache.popitem(last=False)
+                    if len(self._expiry) > 2 * len(cache) + 16:
+                        self._compact_expiry()
         else:
-            bucket = self._cache[key]
+            cache.move_to_end(key)
 
         return bucket
 
@@ -270,23 +391,66 @@ class CooldownMapping:
         bucket = self.get_bucket(message, current)
         return bucket.update_rate_limit(current)
 
+    async def _update_shared_rate_limit(
+        self, message: Message, current: float
+    ) -> tuple[Cooldown | None, float | None]:
+        # the local bucket is still updated, within max_size, so that is_on_cooldown
+        # and get_cooldown_retry_after see this process' uses, but the backend decides
+        bucket = self.get_bucket(message, current)
+        if bucket is None:
+            return None, None
+
+        bucket.update_rate_limit(current)
+        key = self._bucket_key(message)
+        retry_after = await self.backend.update_rate_limit(  # type: ignore
+            self.namespace or "", key, bucket, current
+        )
+        return bucket, retry_after
+
+    def _reset_shared(self, message: Message) -> None:
+        if self.backend is None:
+            return
+
+        key = self._bucket_key(message)
+        task = asyncio.ensure_future(self.backend.reset(self.namespace or "", key))
+        task.add_done_callback(_log_reset_failure)
+
+
+def _log_reset_failure(task: asyncio.Future[None]) -> None:
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        _log.error("Failed to reset a shared cooldown", exc_info=exc)
+
 
 class DynamicCooldownMapping(CooldownMapping):
     def __init__(
-        self, factory: Callable[[Message], Cooldown], type: Callable[[Message], Any]
+        self,
+        factory: Callable[[Message], Cooldown],
+        type: Callable[[Message], Any],
+        **kwargs: Any,
     ) -> None:
-        super().__init__(None, type)
+        super().__init__(None, type, **kwargs)
         self._factory: Callable[[Message], Cooldown] = factory
 
     def copy(self) -> DynamicCooldownMapping:
-        ret = DynamicCooldownMapping(self._factory, self._type)
-        ret._cache = self._cache.copy()
+        ret = DynamicCooldownMapping(self._factory, self._type, **self._copy_options())
+        ret._copy_cache(self)
         return ret
 
     @property
     def valid(self) -> bool:
         return True
 
+    def _compact_expiry(self) -> None:
+        # buckets dropped by max_size leave their entries behind until they expire
+        cache = self._cache
+        self._expiry = [
+            entry for entry in self._expiry if cache.get(entry[2]) is entry[3]
+        ]
+        heapq.heapify(self._expiry)
+
     def create_bucket(self, message: Message) -> Cooldown:
         return self._factory(message)
 
@@ -60,6 +60,7 @@ from .converter import Greedy, get_converter, run_converters
 from .cooldowns import (
     BucketType,
     Cooldown,
+    CooldownBackend,
     CooldownMapping,
     DynamicCooldownMapping,
     MaxConcurrency,
@@ -860,6 +861,20 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
                 if retry_after:
                     raise CommandOnCooldown(bucket, retry_after, self._buckets.type)  # type: ignore
 
+    async def _prepare_shared_cooldowns(self, ctx: Context) -> None:
+        # _prepare_cooldowns for buckets kept by a CooldownBackend, which has to be
+        # awaited; without a backend the synchronous version is used as before
+        if not self._buckets.valid or self._buckets.backend is None:
+            return self._prepare_cooldowns(ctx)
+
+        dt = ctx.message.edited_at or ctx.message.created_at
+        current = dt.replace(tzinfo=datetime.timezone.utc).timestamp()
+        bucket, retry_after = await self._buckets._update_shared_rate_limit(
+            ctx.message, current
+        )
+        if bucket is not None and retry_after:
+            raise CommandOnCooldown(bucket, retry_after, self._buckets.type)  # type: ignore
+
     async def prepare(self, ctx: Context) -> None:
         ctx.command = self
 
@@ -875,9 +890,9 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
         try:
             if self.cooldown_after_parsing:
                 await self._parse_arguments(ctx)
-                self._prepare_cooldowns(ctx)
+                await self._prepare_shared_cooldowns(ctx)
             else:
-                self._prepare_cooldowns(ctx)
+                await self._prepare_shared_cooldowns(ctx)
                 await self._parse_arguments(ctx)
 
             await self.call_before_hooks(ctx)
@@ -922,6 +937,7 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
         if self._buckets.valid:
             bucket = self._buckets.get_bucket(ctx.message)
             bucket.reset()
+            self._buckets._reset_shared(ctx.message)
 
     def get_cooldown_retry_after(self, ctx: Context) -> float:
         """Retrieves the amount of seconds before this command can be tried again.
@@ -2311,10 +2327,21 @@ def is_nsfw() -> Callable[[T], T]:
     return check(pred)
 
 
+def _cooldown_namespace(func: Command | CoroFunc) -> str:
+    # stable across processes, so a shared backend sees the same command everywhere
+    callback = (
+        func.callback if isinstance(func, (Command, ApplicationCommand)) else func
+    )
+    return f"{callback.__module__}.{callback.__qualname__}"
+
+
 def cooldown(
     rate: int,
     per: float,
     type: BucketType | Callable[[Message], Any] = BucketType.default,
+    *,
+    max_size: int | None = None,
+    backend: CooldownBackend | None = None,
 ) -> Callable[[T], T]:
     """A decorator that adds a cooldown to a command
 
@@ -2340,13 +2367,30 @@ def cooldown(
 
         .. versionchanged:: 1.7
             Callables are now supported for custom bucket types.
+    max_size: Optional[:class:`int`]
+        The maximum number of buckets kept, the least recently used ones are
+        dropped first. Defaults to no limit.
+
+        .. versionadded:: 2.7
+    backend: Optional[:class:`.CooldownBackend`]
+        Where to keep the cooldowns so they are shared between processes.
+        Defaults to keeping them in this process.
+
+        .. versionadded:: 2.7
     """
 
     def decorator(func: Command | CoroFunc) -> Command | CoroFunc:
+        mapping = CooldownMapping(
+            Cooldown(rate, per),
+            type,
+            max_size=max_size,
+            backend=backend,
+            namespace=_cooldown_namespace(func),
+        )
         if isinstance(func, (Command, ApplicationCommand)):
-            func._buckets = CooldownMapping(Cooldown(rate, per), type)
+            func._buckets = mapping
         else:
-            func.__commands_cooldown__ = CooldownMapping(Cooldown(rate, per), type)
+            func.__commands_cooldown__ = mapping
         return func
 
     return decorator  # type: ignore
@@ -2355,6 +2399,9 @@ def cooldown(
 def dynamic_cooldown(
     cooldown: BucketType | Callable[[Message], Any],
     type: BucketType = BucketType.default,
+    *,
+    max_size: int | None = None,
+    backend: CooldownBackend | None = None,
 ) -> Callable[[T], T]:
     """A decorator that adds a dynamic cooldown to a command
 
@@ -2383,15 +2430,30 @@ def dynamic_cooldown(
         apply to this invocation or ``None`` if the cooldown should be bypassed.
     type: :class:`.BucketType`
         The type of cooldown to have.
+    max_size: Optional[:class:`int`]
+        Identical to the ``max_size`` parameter for :func:`.cooldown`.
+
+        .. versionadded:: 2.7
+    backend: Optional[:class:`.CooldownBackend`]
+        Identical to the ``backend`` parameter for :func:`.cooldown`.
+
+        .. versionadded:: 2.7
     """
     if not callable(cooldown):
         raise TypeError("A callable must be provided")
 
     def decorator(func: Command | CoroFunc) -> Command | CoroFunc:
+        mapping = DynamicCooldownMapping(
+            cooldown,
+            type,
+            max_size=max_size,
+            backend=backend,
+            namespace=_cooldown_namespace(func),
+        )
         if isinstance(func, Command):
-            func._buckets = DynamicCooldownMapping(cooldown, type)
+            func._buckets = mapping
         else:
-            func.__commands_cooldown__ = DynamicCooldownMapping(cooldown, type)
+            func.__commands_cooldown__ = mapping
         return func
 
     return decorator  # type: ignore
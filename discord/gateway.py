@@ -44,6 +44,14 @@ from .activity import BaseActivity
 from .enums import SpeakingState
 from .errors import ConnectionClosed, InvalidArgument
 
+try:
+    from compression import zstd as _zstd  # Python 3.14+
+except ImportError:
+    try:
+        import zstandard as _zstd
+    except ImportError:
+        _zstd = None
+
 _log = logging.getLogger(__name__)
 
 __all__ = (
@@ -70,6 +78,59 @@ class WebSocketClosure(Exception):
 
 EventListener = namedtuple("EventListener", "predicate event result future")
 
+#: The transport compressions supported by :class:`DiscordWebSocket`.
+GATEWAY_COMPRESSIONS = ("zlib-stream", "zstd-stream")
+
+
+class _ZlibStreamInflator:
+    __slots__ = ("_zlib", "_buffer")
+
+    def __init__(self):
+        self._zlib = zlib.decompressobj()
+        self._buffer = bytearray()
+
+    def feed(self, data):
+        # returns the compressed payload once a full message has been received
+        self._buffer.extend(data)
+        if len(data) < 4 or data[-4:] != b"\x00\x00\xff\xff":
+            return None
+        buffer = self._buffer
+        self._buffer = bytearray()
+        return buffer
+
+    def inflate(self, data):
+        return self._zlib.decompress(data).decode("utf-8")
+
+
+class _ZstdStreamInflator:
+    __slots__ = ("_zstd",)
+
+    def __init__(self):
+        if _zstd is None:
+            raise RuntimeError(
+                "zstandard is required for the zstd-stream gateway compression"
+            )
+        if hasattr(_zstd.ZstdDecompressor, "decompressobj"):
+            # zstandard
+            self._zstd = _zstd.ZstdDecompressor().decompressobj()
+        else:
+            self._zstd = _zstd.ZstdDecompressor()
+
+    def feed(self, data):
+        # every message is flushed on its own
+        return data
+
+    def inflate(self, data):
+        return self._zstd.decompress(data).decode("utf-8")
+
+
+def _get_inflator(compression):
+    if compression == "zstd-stream":
+        return _ZstdStreamInflator()
+    # zlib is also used to handle the uncompressed transport, where no binary
+    # messages are received at all
+    return _ZlibStreamInflator()
+
 
 class GatewayRatelimiter:
     def __init__(self, count=110, per=60.0):
@@ -105,6 +166,13 @@ class GatewayRatelimiter:
 
         return 0.0
 
+    def reserve_delay(self, reserve: int) -> float:
+        # how long to wait until more than `reserve` sends are left in the window
+        current = time.time()
+        if current > self.window + self.per or self.remaining > reserve:
+            return 0.0
+        return self.per - (current - self.window)
+
     async def block(self):
         async with self.lock:
             delta = self.get_delay()
@@ -231,6 +299,9 @@ class VoiceKeepAliveHandler(KeepAliveHandler):
         self._last_recv = ack_time
         self.latency = ack_time - self._last_send
         self.recent_ack_latencies.append(self.latency)
+        metrics = getattr(self.ws._connection, "metrics", None)
+        if metrics is not None:
+            metrics.observe("ws_latency", self.latency)
 
 
 class DiscordClientWebSocketResponse(aiohttp.ClientWebSocketResponse):
@@ -298,8 +369,8 @@ class DiscordWebSocket:
 
         # an empty dispatcher to prevent crashes
         self._dispatch = lambda *args: None
-        # generic event listeners
-        self._dispatch_listeners = []
+        # generic event listeners, keyed by event name
+        self._dispatch_listeners = {}
         # the keep alive
         self._keep_alive = None
         self.thread_id = threading.get_ident()
@@ -308,8 +379,11 @@ class DiscordWebSocket:
         self.session_id = None
         self.sequence = None
         self.resume_gateway_url = None
-        self._zlib = zlib.decompressobj()
-        self._buffer = bytearray()
+        self._inflator = _ZlibStreamInflator()
+        # compressed messages at least this large are inflated and parsed
+        # in a worker thread, None to always do it on the event loop
+        self._offload_threshold = None
+        self._event_executor = None
         self._close_code = None
         self._rate_limiter = GatewayRatelimiter()
 
@@ -342,9 +416,18 @@ class DiscordWebSocket:
 
         This is for internal use only.
         """
-        gateway = gateway or await client.http.get_gateway()
+        compression = client._gateway_compression
+        if gateway is None:
+            gateway = await client.http.get_gateway(compress=compression)
+        elif "?" not in gateway:
+            # resume_gateway_url comes without any query parameters
+            gateway = client.http.format_gateway_url(gateway, compress=compression)
+
         socket = await client.http.ws_connect(gateway)
         ws = cls(socket, loop=client.loop)
+        ws._inflator = _get_inflator(compression)
+        ws._offload_threshold = client._gateway_offload_threshold
+        ws._event_executor = client._event_executor
 
         # dynamically add attributes needed
         ws.token = client.http.token
@@ -403,9 +486,19 @@ class DiscordWebSocket:
         entry = EventListener(
             event=event, predicate=predicate, result=result, future=future
         )
-        self._dispatch_listeners.append(entry)
+        self._dispatch_listeners.setdefault(event, {})[future] = entry
+        future.add_done_callback(lambda fut: self._remove_dispatch_listener(event, fut))
         return future
 
+    def _remove_dispatch_listener(self, event, future):
+        listeners = self._dispatch_listeners.get(event)
+        if listeners is None:
+            return
+
+        listeners.pop(future, None)
+        if not listeners:
+            del self._dispatch_listeners[event]
+
     async def identify(self):
         """Sends the IDENTIFY packet."""
         payload = {
@@ -458,18 +551,29 @@ class DiscordWebSocket:
         await self.send_as_json(payload)
         _log.info("Shard ID %s has sent the RESUME payload.", self.shard_id)
 
+    def _inflate_and_parse(self, data):
+        msg = self._inflator.inflate(data)
+        return msg, utils._from_json(msg)
+
     async def received_message(self, msg, /):
+        parsed = None
         if type(msg) is bytes:
-            self._buffer.extend(msg)
-
-            if len(msg) < 4 or msg[-4:] != b"\x00\x00\xff\xff":
+            data = self._inflator.feed(msg)
+            if data is None:
                 return
-            msg = self._zlib.decompress(self._buffer)
-            msg = msg.decode("utf-8")
-            self._buffer = bytearray()
+
+            threshold = self._offload_threshold
+            if threshold is not None and len(data) >= threshold:
+                # messages are received one at a time, so awaiting here keeps
+                # the event order while the loop is free to do other work
+                msg, parsed = await self.loop.run_in_executor(
+                    None, self._inflate_and_parse, data
+                )
+            else:
+                msg = self._inflator.inflate(data)
 
         self.log_receive(msg)
-        msg = utils._from_json(msg)
+        msg = utils._from_json(msg) if parsed is None else parsed
 
         _log.debug("For Shard ID %s: WebSocket Event: %s", self.shard_id, msg)
         event = msg.get("t")
@@ -561,30 +665,23 @@ class DiscordWebSocket:
         else:
             func(data)
 
-        # remove the dispatched listeners
-        removed = []
-        for index, entry in enumerate(self._dispatch_listeners):
-            if entry.event != event:
-                continue
+        listeners = self._dispatch_listeners.get(event)
+        if not listeners:
+            return
 
-            future = entry.future
-            if future.cancelled():
-                removed.append(index)
+        # finished futures remove themselves through a done callback
+        for future, entry in list(listeners.items()):
+            if future.done():
                 continue
 
             try:
                 valid = entry.predicate(data)
             except Exception as exc:
                 future.set_exception(exc)
-                removed.append(index)
             else:
                 if valid:
                     ret = data if entry.result is None else entry.result(data)
                     future.set_result(ret)
-                    removed.append(index)
-
-        for index in reversed(removed):
-            del self._dispatch_listeners[index]
 
     @property
     def latency(self) -> float:
@@ -615,6 +712,11 @@ class DiscordWebSocket:
         ConnectionClosed
             The websocket connection was terminated for unhandled reasons.
         """
+        executor = self._event_executor
+        if executor is not None and executor.is_blocked():
+            # apply back pressure until the event handlers catch up
+            await executor.wait()
+
         try:
             msg = await self.socket.receive(timeout=self._max_heartbeat_timeout)
             if msg.type is aiohttp.WSMsgType.TEXT:
@@ -964,6 +1066,7 @@ class DiscordVoiceWebSocket:
     async def load_secret_key(self, data):
         _log.info("received secret key for voice connection")
         self.secret_key = self._connection.secret_key = data.get("secret_key")
+        self._connection._bind_crypto()
         await self.speak()
         await self.speak(False)
 
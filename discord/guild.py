@@ -74,7 +74,7 @@ from .iterators import (
     EntitlementIterator,
     MemberIterator,
 )
-from .member import Member, VoiceState
+from .member import CompactMemberStore, Member, VoiceState
 from .mixins import Hashable
 from .monetization import Entitlement
 from .onboarding import Onboarding
@@ -106,10 +106,14 @@ if TYPE_CHECKING:
     from .permissions import Permissions
     from .state import ConnectionState
     from .template import Template
+    from .types.channel import GuildChannel as GuildChannelPayload
+    from .types.channel import StageInstance as StageInstancePayload
     from .types.guild import Ban as BanPayload
     from .types.guild import Guild as GuildPayload
     from .types.guild import GuildFeature, MFALevel
     from .types.member import Member as MemberPayload
+    from .types.role import Role as RolePayload
+    from .types.scheduled_events import ScheduledEvent as ScheduledEventPayload
     from .types.threads import Thread as ThreadPayload
     from .types.voice import GuildVoiceState
     from .voice_client import VoiceClient
@@ -286,6 +290,7 @@ class Guild(Hashable):
         "_threads",
         "approximate_member_count",
         "approximate_presence_count",
+        "_lazy",
     )
 
     _PREMIUM_GUILD_LIMITS: ClassVar[dict[int | None, _GuildLimit]] = {
@@ -302,14 +307,111 @@ class Guild(Hashable):
         # the attr doesn't exist? it has something to do with the order
         # of the attr in __slots__
 
+        self._lazy: dict[str, Any] = {}
         self._channels: dict[int, GuildChannel] = {}
-        self._members: dict[int, Member] = {}
+        self._members: dict[int, Member] | CompactMemberStore = (
+            CompactMemberStore(self) if state.compact_member_cache else {}
+        )
         self._scheduled_events: dict[int, ScheduledEvent] = {}
         self._voice_states: dict[int, VoiceState] = {}
         self._threads: dict[int, Thread] = {}
         self._state: ConnectionState = state
         self._from_data(data)
 
+    def __getattr__(self, name: str) -> Any:
+        # only reached for attributes that haven't been set, which is
+        # how sections of a lazily loaded guild get built on first use
+        if name == "_lazy":
+            raise AttributeError(name)
+
+        try:
+            data = self._lazy.pop(name)
+        except KeyError:
+            raise AttributeError(
+                f"{self.__class__.__name__!r} object has no attribute {name!r}"
+            ) from None
+
+        try:
+            getattr(self, f"_hydrate_{name.lstrip('_')}")(data)
+        except AttributeError as exc:
+            # an AttributeError escaping __getattr__ would read as if the guild
+            # had no such attribute, hiding what actually went wrong
+            self._lazy[name] = data
+            raise RuntimeError(f"Failed to load {name!r} of guild {self.id}") from exc
+        return object.__getattribute__(self, name)
+
+    def __copy__(self) -> Guild:
+        # the default copy reads every slot, which would load every lazy section
+        cls = self.__class__
+        copy = cls.__new__(cls)
+        for klass in cls.__mro__:
+            for slot in getattr(klass, "__slots__", ()):
+                try:
+                    value = object.__getattribute__(self, slot)
+                except AttributeError:
+                    continue
+                object.__setattr__(copy, slot, value)
+        copy._lazy = self._lazy.copy()
+        return copy
+
+    def _defer(self, name: str, data: Any) -> None:
+        # forget what was built before, it's rebuilt from data on the next access
+        try:
+            delattr(self, name)
+        except AttributeError:
+            pass
+        self._lazy[name] = data
+
+    def _hydrate_roles(self, data: list[RolePayload]) -> None:
+        state = self._state
+        self._roles: dict[int, Role] = {}
+        for r in data:
+            role = Role(guild=self, data=r, state=state)
+            self._roles[role.id] = role
+
+    def _hydrate_stage_instances(self, data: list[StageInstancePayload]) -> None:
+        state = self._state
+        self._stage_instances: dict[int, StageInstance] = {}
+        for s in data:
+            stage_instance = StageInstance(guild=self, data=s, state=state)
+            self._stage_instances[stage_instance.id] = stage_instance
+
+    def _hydrate_scheduled_events(self, data: list[ScheduledEventPayload]) -> None:
+        self._scheduled_events = {}
+        events = []
+        for event in data:
+            creator = (
+                None
+                if not event.get("creator", None)
+                else self.get_member(event.get("creator_id"))
+            )
+            events.append(
+                ScheduledEvent(
+                    state=self._state, guild=self, creator=creator, data=event
+                )
+            )
+        self._scheduled_events_from_list(events)
+
+    def _hydrate_channels(self, data: list[GuildChannelPayload]) -> None:
+        self._channels = {}
+        for c in data:
+            factory, ch_type = _guild_channel_factory(c["type"])
+            if factory:
+                self._add_channel(factory(guild=self, data=c, state=self._state))  # type: ignore
+
+    def _hydrate_threads(self, data: list[ThreadPayload]) -> None:
+        self._threads = {}
+        for thread in data:
+            self._add_thread(Thread(guild=self, state=self._state, data=thread))
+
+    def _hydrate_voice_states(self, data: list[GuildVoiceState]) -> None:
+        self._voice_states = {}
+        for obj in data:
+            self._update_voice_state(obj, int(obj["channel_id"]))
+
+    def _hydrate_afk_channel(self, channel_id: int | None) -> None:
+        self.afk_channel: VoiceChannel | None = self.get_channel(channel_id)  # type: ignore
+
     def _add_channel(self, channel: GuildChannel, /) -> None:
         self._channels[channel.id] = channel
 
@@ -469,11 +571,12 @@ class Guild(Hashable):
         self._banner: str | None = guild.get("banner")
         self.unavailable: bool = guild.get("unavailable", False)
         self.id: int = int(guild["id"])
-        self._roles: dict[int, Role] = {}
         state = self._state  # speed up attribute access
-        for r in guild.get("roles", []):
-            role = Role(guild=self, data=r, state=state)
-            self._roles[role.id] = role
+        lazy = state.lazy_guilds
+        if lazy:
+            self._defer("_roles", guild.get("roles", []))
+        else:
+            self._hydrate_roles(guild.get("roles", []))
 
         self.mfa_level: MFALevel = guild.get("mfa_level")
         self.emojis: tuple[GuildEmoji, ...] = tuple(
@@ -511,10 +614,10 @@ class Guild(Hashable):
         self.approximate_presence_count = guild.get("approximate_presence_count")
         self.approximate_member_count = guild.get("approximate_member_count")
 
-        self._stage_instances: dict[int, StageInstance] = {}
-        for s in guild.get("stage_instances", []):
-            stage_instance = StageInstance(guild=self, data=s, state=state)
-            self._stage_instances[stage_instance.id] = stage_instance
+        if lazy:
+            self._defer("_stage_instances", guild.get("stage_instances", []))
+        else:
+            self._hydrate_stage_instances(guild.get("stage_instances", []))
 
         cache_joined = self._state.member_cache_flags.joined
         self_id = self._state.self_id
@@ -523,19 +626,10 @@ class Guild(Hashable):
             if cache_joined or member.id == self_id:
                 self._add_member(member)
 
-        events = []
-        for event in guild.get("guild_scheduled_events", []):
-            creator = (
-                None
-                if not event.get("creator", None)
-                else self.get_member(event.get("creator_id"))
-            )
-            events.append(
-                ScheduledEvent(
-                    state=self._state, guild=self, creator=creator, data=event
-                )
-            )
-        self._scheduled_events_from_list(events)
+        if lazy:
+            self._defer("_scheduled_events", guild.get("guild_scheduled_events", []))
+        else:
+            self._hydrate_scheduled_events(guild.get("guild_scheduled_events", []))
 
         self._sync(guild)
         self._large: bool | None = (
@@ -543,12 +637,15 @@ class Guild(Hashable):
         )
 
         self.owner_id: int | None = utils._get_as_snowflake(guild, "owner_id")
-        self.afk_channel: VoiceChannel | None = self.get_channel(
-            utils._get_as_snowflake(guild, "afk_channel_id")
-        )  # type: ignore
-
-        for obj in guild.get("voice_states", []):
-            self._update_voice_state(obj, int(obj["channel_id"]))
+        afk_channel_id = utils._get_as_snowflake(guild, "afk_channel_id")
+        if lazy:
+            self._defer("afk_channel", afk_channel_id)
+            if "voice_states" in guild:
+                self._defer("_voice_states", guild["voice_states"])
+        else:
+            self._hydrate_afk_channel(afk_channel_id)
+            for obj in guild.get("voice_states", []):
+                self._update_voice_state(obj, int(obj["channel_id"]))
 
     # TODO: refactor/remove?
     def _sync(self, data: GuildPayload) -> None:
@@ -564,17 +661,24 @@ class Guild(Hashable):
             if member is not None:
                 member._presence_update(presence, empty_tuple)  # type: ignore
 
+        lazy = self._state.lazy_guilds
         if "channels" in data:
             channels = data["channels"]
-            for c in channels:
-                factory, ch_type = _guild_channel_factory(c["type"])
-                if factory:
-                    self._add_channel(factory(guild=self, data=c, state=self._state))  # type: ignore
+            if lazy:
+                self._defer("_channels", channels)
+            else:
+                for c in channels:
+                    factory, ch_type = _guild_channel_factory(c["type"])
+                    if factory:
+                        self._add_channel(factory(guild=self, data=c, state=self._state))  # type: ignore
 
         if "threads" in data:
             threads = data["threads"]
-            for thread in threads:
-                self._add_thread(Thread(guild=self, state=self._state, data=thread))
+            if lazy:
+                self._defer("_threads", threads)
+            else:
+                for thread in threads:
+                    self._add_thread(Thread(guild=self, state=self._state, data=thread))
 
     @property
     def channels(self) -> list[GuildChannel]:
@@ -3636,7 +3740,10 @@ class Guild(Hashable):
             raise ClientException("Intents.members must be enabled to use this.")
 
         if not self._state.is_guild_evicted(self):
-            return await self._state.chunk_guild(self, cache=cache)
+            # explicit requests go ahead of the ones made at startup
+            return await self._state.chunk_guild(
+                self, cache=cache, priority=float("inf")
+            )
 
     async def query_members(
         self,
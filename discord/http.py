@@ -27,8 +27,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import sys
-import weakref
+import time
+from collections import deque
 from typing import TYPE_CHECKING, Any, Coroutine, Iterable, Sequence, TypeVar
 from urllib.parse import quote as _uriquote
 
@@ -48,6 +50,11 @@ from .file import VoiceMessage
 from .gateway import DiscordClientWebSocketResponse
 from .utils import MISSING, warn_deprecated
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 _log = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
@@ -87,7 +94,6 @@ if TYPE_CHECKING:
 
     T = TypeVar("T")
     BE = TypeVar("BE", bound=BaseException)
-    MU = TypeVar("MU", bound="MaybeUnlock")
     Response = Coroutine[Any, Any, T]
 
 API_VERSION: int = 10
@@ -136,26 +142,288 @@ class Route:
         # the bucket is just method + path w/ major parameters
         return f"{self.channel_id}:{self.guild_id}:{self.path}"
 
+    @property
+    def key(self) -> str:
+        # the key Discord's bucket hashes are discovered for
+        return f"{self.method} {self.path}"
 
-class MaybeUnlock:
-    def __init__(self, lock: asyncio.Lock) -> None:
-        self.lock: asyncio.Lock = lock
-        self._unlock: bool = True
+    @property
+    def major_parameters(self) -> str:
+        return f"{self.channel_id}:{self.guild_id}:{self.webhook_id}"
 
-    def __enter__(self: MU) -> MU:
-        return self
+    @property
+    def is_global(self) -> bool:
+        # interaction endpoints are not bound to the global rate limit
+        return not (
+            self.path.startswith("/interactions/") or self.webhook_token is not None
+        )
+
+
+class RateLimit:
+    """Tracks the state of a single Discord rate limit bucket.
+
+    Requests are allowed to run concurrently up to the remaining budget
+    reported by Discord. Until the bucket has been discovered through the
+    ``X-RateLimit-*`` headers, requests are sent one at a time.
+    """
+
+    __slots__ = (
+        "loop",
+        "limit",
+        "remaining",
+        "outgoing",
+        "reset_at",
+        "last_used",
+        "_waiters",
+        "_reset_handle",
+    )
 
-    def defer(self) -> None:
-        self._unlock = False
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop: asyncio.AbstractEventLoop = loop
+        self.limit: int = 1
+        self.remaining: int = 1
+        self.outgoing: int = 0
+        self.reset_at: float = 0.0
+        self.last_used: float = loop.time()
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._reset_handle: asyncio.TimerHandle | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"<RateLimit limit={self.limit} remaining={self.remaining}"
+            f" outgoing={self.outgoing} reset_at={self.reset_at}>"
+        )
+
+    def _refresh(self, now: float) -> None:
+        if self.reset_at and now >= self.reset_at:
+            self.remaining = self.limit
+            self.reset_at = 0.0
+
+    def _available(self) -> int:
+        return self.remaining - self.outgoing
+
+    def _wake(self) -> None:
+        available = self._available()
+        while self._waiters and available > 0:
+            future = self._waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                available -= 1
+
+        if self._waiters and self.reset_at and self._reset_handle is None:
+            # make sure the remaining waiters are woken up once the window resets
+            self._reset_handle = self.loop.call_at(self.reset_at, self._on_reset)
+
+    def _on_reset(self) -> None:
+        self._reset_handle = None
+        self._refresh(self.loop.time())
+        self._wake()
+
+    def is_idle(self, now: float) -> bool:
+        return not self.outgoing and not self._waiters and now >= self.reset_at
+
+    async def acquire(self) -> None:
+        loop = self.loop
+        while True:
+            now = loop.time()
+            self._refresh(now)
+            if self._available() > 0:
+                self.outgoing += 1
+                self.last_used = now
+                return
+
+            future = loop.create_future()
+            self._waiters.append(future)
+            timeout = self.reset_at - now if self.reset_at else None
+            try:
+                await asyncio.wait((future,), timeout=timeout)
+            finally:
+                if not future.done():
+                    future.cancel()
+                    try:
+                        self._waiters.remove(future)
+                    except ValueError:
+                        pass
+
+    def release(self) -> None:
+        self.outgoing -= 1
+        self._refresh(self.loop.time())
+        self._wake()
+
+    def update(self, response: aiohttp.ClientResponse, *, use_clock: bool) -> None:
+        headers = response.headers
+        remaining = headers.get("X-Ratelimit-Remaining")
+        limit = headers.get("X-Ratelimit-Limit")
+        if remaining is None or limit is None:
+            return
+
+        reset_at = self.loop.time() + utils._parse_ratelimit_header(
+            response, use_clock=use_clock
+        )
+        self.limit = int(limit)
+        # responses for the same window can arrive out of order, so only
+        # trust a higher remaining count once the window has moved on
+        if not self.reset_at or reset_at > self.reset_at + 0.5:
+            self.remaining = int(remaining)
+        else:
+            self.remaining = min(self.remaining, int(remaining))
+        self.reset_at = reset_at
 
-    def __exit__(
-        self,
-        exc_type: type[BE] | None,
-        exc: BE | None,
-        traceback: TracebackType | None,
-    ) -> None:
-        if self._unlock:
-            self.lock.release()
+    def exhaust(self, retry_after: float) -> None:
+        self.remaining = 0
+        self.reset_at = max(self.reset_at, self.loop.time() + retry_after)
+
+
+class GlobalRateLimit:
+    """The base class for a pre-emptive global rate limit.
+
+    Before every request that counts towards Discord's global rate limit,
+    :class:`HTTPClient` awaits :meth:`acquire`. Subclasses decide where the
+    shared budget lives, so that several processes running shards of the same
+    bot can draw from a single budget.
+
+    The budget is tracked as a generic cell rate: requests are spaced
+    ``per / rate`` seconds apart, with bursts of up to ``rate`` requests.
+
+    .. versionadded:: 2.7
+
+    Parameters
+    ----------
+    rate: :class:`int`
+        The number of requests allowed every ``per`` seconds. Defaults to ``50``.
+    per: :class:`float`
+        The length of the window in seconds. Defaults to ``1.0``.
+    """
+
+    def __init__(self, rate: int = 50, per: float = 1.0) -> None:
+        if rate <= 0 or per <= 0:
+            raise ValueError("rate and per must be greater than 0")
+        self.rate: int = rate
+        self.per: float = per
+
+    def _reserve(self, tat: float, now: float) -> tuple[float, float]:
+        # returns the new theoretical arrival time and how long to wait
+        interval = self.per / self.rate
+        tat = max(tat, now)
+        delay = max(0.0, tat - (self.per - interval) - now)
+        return tat + interval, delay
+
+    async def acquire(self) -> None:
+        """|coro|
+
+        Waits until a request may be sent without exceeding the global rate limit.
+        """
+        raise NotImplementedError
+
+    async def pause(self, retry_after: float) -> None:
+        """|coro|
+
+        Called when Discord reports that the global rate limit has been hit anyway,
+        so that no request is sent by anyone sharing this budget for ``retry_after``
+        seconds. Does nothing by default.
+        """
+
+    async def close(self) -> None:
+        """|coro|
+
+        Releases any resources held by the rate limit.
+        """
+
+
+class LocalGlobalRateLimit(GlobalRateLimit):
+    """A :class:`GlobalRateLimit` whose budget is only shared within this process.
+
+    This is the default used by :class:`Client`.
+
+    .. versionadded:: 2.7
+    """
+
+    def __init__(self, rate: int = 50, per: float = 1.0) -> None:
+        super().__init__(rate, per)
+        self._tat: float = 0.0
+
+    async def acquire(self) -> None:
+        self._tat, delay = self._reserve(self._tat, time.monotonic())
+        if delay:
+            await asyncio.sleep(delay)
+
+    async def pause(self, retry_after: float) -> None:
+        interval = self.per / self.rate
+        resume = time.monotonic() + retry_after + self.per - interval
+        self._tat = max(self._tat, resume)
+
+
+class FileLockGlobalRateLimit(GlobalRateLimit):
+    """A :class:`GlobalRateLimit` shared between processes through a locked file.
+
+    Every process using the same ``path`` draws from the same budget. The file
+    is locked with :func:`fcntl.flock`, so this is only available on Unix-like
+    systems and the file should live on a local filesystem.
+
+    .. versionadded:: 2.7
+
+    Parameters
+    ----------
+    path: :class:`str`
+        The path of the file holding the shared state. It is created if it does
+        not exist.
+    rate: :class:`int`
+        The number of requests allowed every ``per`` seconds. Defaults to ``50``.
+    per: :class:`float`
+        The length of the window in seconds. Defaults to ``1.0``.
+    """
+
+    def __init__(self, path: str, rate: int = 50, per: float = 1.0) -> None:
+        if fcntl is None:
+            raise RuntimeError(
+                "FileLockGlobalRateLimit is not supported on this platform"
+            )
+        super().__init__(rate, per)
+        self.path: str = path
+        self._fd: int | None = None
+
+    def _update(self, resume: float | None = None) -> float:
+        if self._fd is None:
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+
+        fd = self._fd
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            raw = os.pread(fd, 32, 0)
+            try:
+                tat = float(raw)
+            except ValueError:
+                tat = 0.0
+
+            # wall clock time, since it has to be comparable across processes
+            now = time.time()
+            if resume is None:
+                tat, delay = self._reserve(tat, now)
+            else:
+                interval = self.per / self.rate
+                tat = max(tat, now + resume + self.per - interval)
+                delay = 0.0
+
+            os.ftruncate(fd, 0)
+            os.pwrite(fd, repr(tat).encode(), 0)
+            return delay
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+    async def acquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        delay = await loop.run_in_executor(None, self._update)
+        if delay:
+            await asyncio.sleep(delay)
+
+    async def pause(self, retry_after: float) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._update, retry_after)
+
+    async def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
 
 
 # For some reason, the Discord voice websocket expects this header to be
@@ -174,15 +442,22 @@ class HTTPClient:
         proxy_auth: aiohttp.BasicAuth | None = None,
         loop: asyncio.AbstractEventLoop | None = None,
         unsync_clock: bool = True,
+        global_ratelimit: GlobalRateLimit | None = MISSING,
     ) -> None:
         self.loop: asyncio.AbstractEventLoop = (
             asyncio.get_event_loop() if loop is None else loop
         )
         self.connector = connector
         self.__session: aiohttp.ClientSession = MISSING  # filled in static_login
-        self._locks: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        # route key -> X-RateLimit-Bucket hash
+        self._bucket_hashes: dict[str, str] = {}
+        self._buckets: dict[str, RateLimit] = {}
+        self._last_bucket_sweep: float = self.loop.time()
         self._global_over: asyncio.Event = asyncio.Event()
         self._global_over.set()
+        if global_ratelimit is MISSING:
+            global_ratelimit = LocalGlobalRateLimit()
+        self.global_ratelimit: GlobalRateLimit | None = global_ratelimit
         self.token: str | None = None
         self.bot_token: bool = False
         self.proxy: str | None = proxy
@@ -218,6 +493,46 @@ class HTTPClient:
 
         return await self.__session.ws_connect(url, **kwargs)
 
+    def _get_bucket_key(self, route: Route) -> str:
+        bucket_hash = self._bucket_hashes.get(route.key)
+        if bucket_hash is None:
+            # not discovered yet, fall back to the route itself
+            return f"{route.key}:{route.major_parameters}"
+        return f"{bucket_hash}:{route.major_parameters}"
+
+    def _get_ratelimit(self, key: str) -> RateLimit:
+        now = self.loop.time()
+        if now - self._last_bucket_sweep > 60.0:
+            self._evict_idle_buckets(now)
+
+        try:
+            return self._buckets[key]
+        except KeyError:
+            self._buckets[key] = ratelimit = RateLimit(self.loop)
+            return ratelimit
+
+    def _evict_idle_buckets(self, now: float) -> None:
+        self._last_bucket_sweep = now
+        expired = [
+            key
+            for key, ratelimit in self._buckets.items()
+            if ratelimit.is_idle(now) and now - ratelimit.last_used > 300.0
+        ]
+        for key in expired:
+            del self._buckets[key]
+
+    def _discover_bucket(
+        self, route: Route, key: str, ratelimit: RateLimit, bucket_hash: str | None
+    ) -> None:
+        if bucket_hash is None:
+            return
+
+        self._bucket_hashes[route.key] = bucket_hash
+        new_key = f"{bucket_hash}:{route.major_parameters}"
+        if new_key != key:
+            # later requests share the state of this bucket under its real hash
+            self._buckets.setdefault(new_key, ratelimit)
+
     async def request(
         self,
         route: Route,
@@ -226,16 +541,9 @@ class HTTPClient:
         form: Iterable[dict[str, Any]] | None = None,
         **kwargs: Any,
     ) -> Any:
-        bucket = route.bucket
         method = route.method
         url = route.url
 
-        lock = self._locks.get(bucket)
-        if lock is None:
-            lock = asyncio.Lock()
-            if bucket is not None:
-                self._locks[bucket] = lock
-
         # header creation
         headers: dict[str, str] = {
             "User-Agent": self.user_agent,
@@ -266,15 +574,21 @@ class HTTPClient:
         if self.proxy_auth is not None:
             kwargs["proxy_auth"] = self.proxy_auth
 
-        if not self._global_over.is_set():
-            # wait until the global lock is complete
-            await self._global_over.wait()
-
+        global_ratelimit = self.global_ratelimit if route.is_global else None
         response: aiohttp.ClientResponse | None = None
         data: dict[str, Any] | str | None = None
-        await lock.acquire()
-        with MaybeUnlock(lock) as maybe_lock:
-            for tries in range(5):
+        for tries in range(5):
+            if not self._global_over.is_set():
+                # wait until the global lock is complete
+                await self._global_over.wait()
+
+            bucket = self._get_bucket_key(route)
+            ratelimit = self._get_ratelimit(bucket)
+            await ratelimit.acquire()
+            try:
+                if global_ratelimit is not None:
+                    await global_ratelimit.acquire()
+
                 if files:
                     for f in files:
                         f.reset(seek=tries)
@@ -301,22 +615,24 @@ class HTTPClient:
                         data = await json_or_text(response)
 
                         # check if we have rate limit header information
-                        remaining = response.headers.get("X-Ratelimit-Remaining")
-                        if remaining == "0" and response.status != 429:
-                            # we've depleted our current bucket
-                            delta = utils._parse_ratelimit_header(
-                                response, use_clock=self.use_clock
-                            )
-                            _log.debug(
-                                (
-                                    "A rate limit bucket has been exhausted (bucket:"
-                                    " %s, retry: %s)."
-                                ),
-                                bucket,
-                                delta,
-                            )
-                            maybe_lock.defer()
-                            self.loop.call_later(delta, lock.release)
+                        self._discover_bucket(
+                            route,
+                            bucket,
+                            ratelimit,
+                            response.headers.get("X-Ratelimit-Bucket"),
+                        )
+                        if response.status != 429:
+                            ratelimit.update(response, use_clock=self.use_clock)
+                            if ratelimit.remaining == 0:
+                                # we've depleted our current bucket
+                                _log.debug(
+                                    (
+                                        "A rate limit bucket has been exhausted"
+                                        " (bucket: %s, retry: %s)."
+                                    ),
+                                    bucket,
+                                    ratelimit.reset_at - self.loop.time(),
+                                )
 
                         # the request was successful so just return the text/json
                         if 300 > response.status >= 200:
@@ -334,31 +650,33 @@ class HTTPClient:
                                 ' Handled under the bucket "%s"'
                             )
 
-                            # sleep a bit
                             retry_after: float = data["retry_after"]
                             _log.warning(fmt, retry_after, bucket)
 
                             # check if it's a global rate limit
                             is_global = data.get("global", False)
-                            if is_global:
-                                _log.warning(
-                                    (
-                                        "Global rate limit has been hit. Retrying in"
-                                        " %.2f seconds."
-                                    ),
-                                    retry_after,
-                                )
-                                self._global_over.clear()
+                            if not is_global:
+                                # every request in this bucket waits for the reset
+                                ratelimit.exhaust(retry_after)
+                                continue
 
+                            _log.warning(
+                                (
+                                    "Global rate limit has been hit. Retrying in"
+                                    " %.2f seconds."
+                                ),
+                                retry_after,
+                            )
+                            self._global_over.clear()
+                            if self.global_ratelimit is not None:
+                                await self.global_ratelimit.pause(retry_after)
                             await asyncio.sleep(retry_after)
                             _log.debug("Done sleeping for the rate limit. Retrying...")
 
                             # release the global lock now that the
                             # global rate limit has passed
-                            if is_global:
-                                self._global_over.set()
-                                _log.debug("Global rate limit is now over.")
-
+                            self._global_over.set()
+                            _log.debug("Global rate limit is now over.")
                             continue
 
                         # we've received a 500, 502, 503, or 504, unconditional retry
@@ -383,15 +701,17 @@ class HTTPClient:
                         await asyncio.sleep(1 + tries * 2)
                         continue
                     raise
+            finally:
+                ratelimit.release()
 
-            if response is not None:
-                # We've run out of retries, raise.
-                if response.status >= 500:
-                    raise DiscordServerError(response, data)
+        if response is not None:
+            # We've run out of retries, raise.
+            if response.status >= 500:
+                raise DiscordServerError(response, data)
 
-                raise HTTPException(response, data)
+            raise HTTPException(response, data)
 
-            raise RuntimeError("Unreachable code in HTTP handling")
+        raise RuntimeError("Unreachable code in HTTP handling")
 
     async def get_from_cdn(self, url: str) -> bytes:
         async with self.__session.get(url) as resp:
@@ -409,6 +729,8 @@ class HTTPClient:
     async def close(self) -> None:
         if self.__session:
             await self.__session.close()
+        if self.global_ratelimit is not None:
+            await self.global_ratelimit.close()
 
     # login management
 
@@ -3218,30 +3540,48 @@ class HTTPClient:
             )
         )
 
-    async def get_gateway(self, *, encoding: str = "json", zlib: bool = True) -> str:
+    def format_gateway_url(
+        self, url: str, *, encoding: str = "json", compress: str | None = None
+    ) -> str:
+        value = f"{url}?encoding={encoding}&v={API_VERSION}"
+        if compress:
+            value += f"&compress={compress}"
+        return value
+
+    async def get_gateway(
+        self,
+        *,
+        encoding: str = "json",
+        zlib: bool = True,
+        compress: str | None = MISSING,
+    ) -> str:
         try:
             data = await self.request(Route("GET", "/gateway"))
         except HTTPException as exc:
             raise GatewayNotFound() from exc
-        if zlib:
-            value = "{0}?encoding={1}&v={2}&compress=zlib-stream"
-        else:
-            value = "{0}?encoding={1}&v={2}"
-        return value.format(data["url"], encoding, API_VERSION)
+        if compress is MISSING:
+            compress = "zlib-stream" if zlib else None
+        return self.format_gateway_url(
+            data["url"], encoding=encoding, compress=compress
+        )
 
     async def get_bot_gateway(
-        self, *, encoding: str = "json", zlib: bool = True
+        self,
+        *,
+        encoding: str = "json",
+        zlib: bool = True,
+        compress: str | None = MISSING,
     ) -> tuple[int, str]:
         try:
             data = await self.request(Route("GET", "/gateway/bot"))
         except HTTPException as exc:
             raise GatewayNotFound() from exc
 
-        if zlib:
-            value = "{0}?encoding={1}&v={2}&compress=zlib-stream"
-        else:
-            value = "{0}?encoding={1}&v={2}"
-        return data["shards"], value.format(data["url"], encoding, API_VERSION)
+        if compress is MISSING:
+            compress = "zlib-stream" if zlib else None
+        return data["shards"], self.format_gateway_url(
+            data["url"], encoding=encoding, compress=compress
+        )
 
     def get_user(self, user_id: Snowflake) -> Response[user.User]:
         return self.request(Route("GET", "/users/{user_id}", user_id=user_id))
@@ -29,8 +29,11 @@ import datetime
 import inspect
 import itertools
 import sys
+import weakref
+from array import array
+from collections import OrderedDict
 from operator import attrgetter
-from typing import TYPE_CHECKING, Any, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Iterator, TypeVar, Union
 
 import discord.abc
 
@@ -1155,3 +1158,250 @@ class Member(discord.abc.Messageable, _UserTag):
             The role or ``None`` if not found in the member's roles.
         """
         return self.guild.get_role(role_id) if self._roles.has(role_id) else None
+
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class _Interned:
+    # tuples can't be weakly referenced, so interned tuples are wrapped
+    __slots__ = ("value", "__weakref__")
+
+    def __init__(self, value: tuple) -> None:
+        self.value: tuple = value
+
+
+# shared between every store, most members have one of a few role and status
+# combinations; a combination is forgotten once no member has it anymore
+_interned: weakref.WeakValueDictionary[tuple, _Interned] = weakref.WeakValueDictionary()
+
+
+def _intern(value: tuple) -> _Interned:
+    interned = _interned.get(value)
+    if interned is None:
+        interned = _interned[value] = _Interned(value)
+    return interned
+
+
+def _to_micros(dt: datetime.datetime | None) -> int:
+    if dt is None:
+        return -1
+    delta = dt - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _from_micros(value: int) -> datetime.datetime | None:
+    if value < 0:
+        return None
+    return _EPOCH + datetime.timedelta(microseconds=value)
+
+
+class CompactMemberStore:
+    """A memory efficient replacement for the member mapping of a :class:`Guild`.
+
+    Members are stored column by column, with timestamps packed into arrays and
+    role and status combinations interned, instead of as one :class:`Member`
+    object each. :class:`Member` objects are created when they are accessed.
+
+    The most recently accessed members are kept as objects, so that updates made
+    to them by the library are preserved, and are packed again once they are
+    evicted. Members returned by iterating over the store that were not recently
+    accessed are temporary copies.
+
+    This means that outside of the most recently accessed members, two lookups
+    of the same member can return different objects, so members should be
+    compared with ``==`` rather than ``is``, and attributes set on a
+    :class:`Member` object by the user are lost once it is no longer
+    referenced.
+
+    This implements the subset of the :class:`dict` interface used by
+    :class:`Guild`.
+    """
+
+    __slots__ = (
+        "guild",
+        "hot_size",
+        "_index",
+        "_ids",
+        "_users",
+        "_joined_at",
+        "_premium_since",
+        "_timed_out_until",
+        "_roles",
+        "_nicks",
+        "_avatars",
+        "_banners",
+        "_flags",
+        "_pending",
+        "_activities",
+        "_client_status",
+        "_hot",
+    )
+
+    def __init__(self, guild: Guild, *, hot_size: int = 256) -> None:
+        self.guild: Guild = guild
+        self.hot_size: int = hot_size
+        self._hot: OrderedDict[int, Member] = OrderedDict()
+        self.clear()
+
+    def __repr__(self) -> str:
+        return f"<CompactMemberStore guild_id={self.guild.id} len={len(self)}>"
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, user_id: object) -> bool:
+        return user_id in self._index
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._index)
+
+    def __getitem__(self, user_id: int) -> Member:
+        member = self.get(user_id)
+        if member is None:
+            raise KeyError(user_id)
+        return member
+
+    def __setitem__(self, user_id: int, member: Member) -> None:
+        self._pack(member)
+        self._remember(member)
+
+    def clear(self) -> None:
+        self._index: dict[int, int] = {}
+        self._ids: array[int] = array("Q")
+        self._users: list[User] = []
+        self._joined_at: array[int] = array("q")
+        self._premium_since: array[int] = array("q")
+        self._timed_out_until: array[int] = array("q")
+        self._roles: list[_Interned] = []
+        self._nicks: list[str | None] = []
+        self._avatars: list[str | None] = []
+        self._banners: list[str | None] = []
+        self._flags: array[int] = array("Q")
+        self._pending: array[int] = array("b")
+        self._activities: list[tuple[ActivityTypes, ...]] = []
+        self._client_status: list[_Interned] = []
+        self._hot.clear()
+
+    def keys(self) -> Iterator[int]:
+        return iter(self._index)
+
+    def get(self, user_id: int, default: Any = None) -> Any:
+        hot = self._hot
+        try:
+            member = hot[user_id]
+        except KeyError:
+            pass
+        else:
+            hot.move_to_end(user_id)
+            return member
+
+        row = self._index.get(user_id)
+        if row is None:
+            return default
+
+        member = self._unpack(row)
+        self._remember(member)
+        return member
+
+    def pop(self, user_id: int, default: Any = None) -> Any:
+        member = self._hot.pop(user_id, None)
+        row = self._index.pop(user_id, None)
+        if row is None:
+            return default if member is None else member
+
+        if member is None:
+            member = self._unpack(row)
+        self._remove_row(row)
+        return member
+
+    def values(self) -> Iterator[Member]:
+        hot = self._hot
+        for user_id, row in self._index.items():
+            member = hot.get(user_id)
+            yield self._unpack(row) if member is None else member
+
+    def items(self) -> Iterator[tuple[int, Member]]:
+        for member in self.values():
+            yield member.id, member
+
+    def _remember(self, member: Member) -> None:
+        hot = self._hot
+        hot[member.id] = member
+        hot.move_to_end(member.id)
+        if len(hot) > self.hot_size:
+            _, evicted = hot.popitem(last=False)
+            # write back whatever changed while it was in use
+            self._pack(evicted)
+
+    def _columns(self) -> tuple[Any, ...]:
+        return (
+            self._ids,
+            self._users,
+            self._joined_at,
+            self._premium_since,
+            self._timed_out_until,
+            self._roles,
+            self._nicks,
+            self._avatars,
+            self._banners,
+            self._flags,
+            self._pending,
+            self._activities,
+            self._client_status,
+        )
+
+    def _pack(self, member: Member) -> None:
+        values = (
+            member.id,
+            member._user,
+            _to_micros(member.joined_at),
+            _to_micros(member.premium_since),
+            _to_micros(member.communication_disabled_until),
+            _intern(tuple(member._roles)),
+            member.nick,
+            member._avatar,
+            member._banner,
+            member.flags.value,
+            member.pending,
+            member.activities,
+            _intern(tuple(member._client_status.items())),
+        )
+        columns = self._columns()
+        row = self._index.get(member.id)
+        if row is None:
+            self._index[member.id] = len(self._ids)
+            for column, value in zip(columns, values):
+                column.append(value)
+        else:
+            for column, value in zip(columns, values):
+                column[row] = value
+
+    def _remove_row(self, row: int) -> None:
+        # move the last row into the hole so the columns stay dense
+        last = len(self._ids) - 1
+        columns = self._columns()
+        if row != last:
+            self._index[self._ids[last]] = row
+            for column in columns:
+                column[row] = column[last]
+        for column in columns:
+            column.pop()
+
+    def _unpack(self, row: int) -> Member:
+        member = Member.__new__(Member)
+        member._state = self.guild._state
+        member.guild = self.guild
+        member._user = self._users[row]
+        member.joined_at = _from_micros(self._joined_at[row])
+        member.premium_since = _from_micros(self._premium_since[row])
+        member.communication_disabled_until = _from_micros(self._timed_out_until[row])
+        member._roles = utils.SnowflakeList(self._roles[row].value, is_sorted=True)
+        member.nick = self._nicks[row]
+        member._avatar = self._avatars[row]
+        member._banner = self._banners[row]
+        member.flags = MemberFlags._from_value(self._flags[row])
+        member.pending = bool(self._pending[row])
+        member.activities = self._activities[row]
+        member._client_status = dict(self._client_status[row].value)
+        return member
@@ -25,6 +25,7 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import mmap
 import struct
 from typing import IO, TYPE_CHECKING, ClassVar, Generator
 
@@ -54,10 +55,23 @@ class OggPage:
         pagenum: int
         crc: int
         segnum: int
+        segtable: bytes | memoryview
+        data: bytes | memoryview
+
+    __slots__ = (
+        "flag",
+        "gran_pos",
+        "serial",
+        "pagenum",
+        "crc",
+        "segnum",
+        "segtable",
+        "data",
+    )
 
     def __init__(self, stream: IO[bytes]) -> None:
         try:
-            header = stream.read(struct.calcsize(self._header.format))
+            header = stream.read(self._header.size)
 
             (
                 self.flag,
@@ -68,13 +82,44 @@ class OggPage:
                 self.segnum,
             ) = self._header.unpack(header)
 
-            self.segtable: bytes = stream.read(self.segnum)
-            bodylen = sum(struct.unpack("B" * self.segnum, self.segtable))
-            self.data: bytes = stream.read(bodylen)
+            self.segtable = stream.read(self.segnum)
+            bodylen = sum(self.segtable)
+            self.data = stream.read(bodylen)
         except Exception:
             raise OggError("bad data stream") from None
 
-    def iter_packets(self) -> Generator[tuple[bytes, bool]]:
+    @classmethod
+    def from_buffer(cls, buffer: memoryview, offset: int) -> tuple[OggPage, int]:
+        """Parses the page starting at ``offset`` without copying, returning it
+        along with the offset of the next page.
+        """
+        if buffer[offset : offset + 4] != b"OggS":
+            raise OggError("invalid header magic")
+
+        self = cls.__new__(cls)
+        try:
+            (
+                self.flag,
+                self.gran_pos,
+                self.serial,
+                self.pagenum,
+                self.crc,
+                self.segnum,
+            ) = cls._header.unpack_from(buffer, offset + 4)
+        except struct.error:
+            raise OggError("bad data stream") from None
+
+        start = offset + 4 + cls._header.size
+        self.segtable = buffer[start : start + self.segnum]
+        start += self.segnum
+        end = start + sum(self.segtable)
+        if end > len(buffer):
+            raise OggError("bad data stream")
+
+        self.data = buffer[start:end]
+        return self, end
+
+    def iter_packets(self) -> Generator[tuple[bytes | memoryview, bool]]:
         packetlen = offset = 0
         partial = True
 
@@ -94,8 +139,22 @@ class OggPage:
 
 
 class OggStream:
-    def __init__(self, stream: IO[bytes]) -> None:
-        self.stream: IO[bytes] = stream
+    """Iterates over the packets of an Ogg stream.
+
+    The stream can either be a file object, which is read page by page, or
+    a bytes-like object such as an :class:`mmap.mmap`, in which case packets
+    that fit in one page are returned as :class:`memoryview` slices of it.
+    """
+
+    def __init__(
+        self, stream: IO[bytes] | bytes | bytearray | memoryview | mmap.mmap
+    ) -> None:
+        self.stream: IO[bytes] | None = None
+        self._buffer: memoryview | None = None
+        if isinstance(stream, (bytes, bytearray, memoryview, mmap.mmap)):
+            self._buffer = memoryview(stream)
+        else:
+            self.stream = stream
 
     def _next_page(self) -> OggPage | None:
         head = self.stream.read(4)
@@ -107,16 +166,36 @@ class OggStream:
             raise OggError("invalid header magic")
 
     def _iter_pages(self) -> Generator[OggPage]:
+        buffer = self._buffer
+        if buffer is not None:
+            offset = 0
+            end = len(buffer)
+            while offset < end:
+                page, offset = OggPage.from_buffer(buffer, offset)
+                yield page
+            return
+
         page = self._next_page()
         while page:
             yield page
             page = self._next_page()
 
-    def iter_packets(self) -> Generator[bytes]:
-        partial = b""
+    def iter_packets(self) -> Generator[bytes | memoryview]:
+        parts = []
         for page in self._iter_pages():
             for data, complete in page.iter_packets():
-                partial += data
-                if complete:
-                    yield partial
-                    partial = b""
+                if not complete:
+                    parts.append(data)
+                elif parts:
+                    # the packet continued from a previous page
+                    parts.append(data)
+                    yield b"".join(parts)
+                    parts = []
+                else:
+                    yield data
+
+    def close(self) -> None:
+        """Releases the buffer the stream was created with, if any."""
+        if self._buffer is not None:
+            self._buffer.release()
+            self._buffer = None
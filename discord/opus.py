@@ -28,10 +28,11 @@ from __future__ import annotations
 import array
 import ctypes
 import ctypes.util
-import gc
+import heapq
 import logging
 import math
 import os.path
+import queue
 import struct
 import sys
 import threading
@@ -40,6 +41,7 @@ from typing import TYPE_CHECKING, Any, Callable, Literal, TypedDict, TypeVar
 
 from .errors import DiscordException
 from .sinks import RawData
+from .voice_metrics import VoiceMetrics
 
 if TYPE_CHECKING:
     T = TypeVar("T")
@@ -65,6 +67,7 @@ __all__ = (
     "Encoder",
     "Decoder",
     "DecodeManager",
+    "DecodeStats",
     "OpusError",
     "OpusNotLoaded",
 )
@@ -518,58 +521,318 @@ class Decoder(_OpusStruct):
         return array.array("h", pcm[: ret * channel_count]).tobytes()
 
 
+class _JitterBuffer:
+    """Reorders the packets of a single SSRC by RTP sequence number."""
+
+    __slots__ = ("depth", "_heap", "_packets", "_highest", "_released")
+
+    def __init__(self, depth: int):
+        self.depth: int = depth
+        self._heap: list[int] = []
+        self._packets: dict[int, RawData] = {}
+        self._highest: int | None = None
+        self._released: int | None = None
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def _unwrap(self, sequence: int) -> int:
+        # extend the 16 bit sequence so it keeps increasing after wrapping around
+        if self._highest is None:
+            self._highest = sequence
+            return sequence
+
+        delta = (sequence - self._highest) & 0xFFFF
+        if delta >= 0x8000:
+            delta -= 0x10000
+        extended = self._highest + delta
+        if extended > self._highest:
+            self._highest = extended
+        return extended
+
+    def _pop(self) -> RawData:
+        sequence = heapq.heappop(self._heap)
+        self._released = sequence
+        return self._packets.pop(sequence)
+
+    def push(self, data: RawData) -> list[RawData] | None:
+        sequence = self._unwrap(data.sequence)
+        if (
+            self._released is not None and sequence <= self._released
+        ) or sequence in self._packets:
+            # too late or a duplicate
+            return None
+
+        heapq.heappush(self._heap, sequence)
+        self._packets[sequence] = data
+        ready = []
+        while len(self._heap) > self.depth:
+            ready.append(self._pop())
+        return ready
+
+    def pop_stale(self, deadline: float) -> list[RawData]:
+        ready = []
+        while self._heap and self._packets[self._heap[0]].receive_time <= deadline:
+            ready.append(self._pop())
+        return ready
+
+    def flush(self) -> list[RawData]:
+        return [self._pop() for _ in range(len(self._heap))]
+
+
+class DecodeStats:
+    """Statistics about one decode worker of a :class:`DecodeManager`.
+
+    .. versionadded:: 2.7
+
+    Attributes
+    ----------
+    queued: :class:`int`
+        The number of packets waiting to be decoded.
+    decoded: :class:`int`
+        The number of packets that were decoded.
+    dropped: :class:`int`
+        The number of packets that were dropped because the queue was full.
+    late: :class:`int`
+        The number of packets that were dropped because they arrived after
+        later packets of the same speaker had already been decoded.
+    total_lag: :class:`float`
+        The total time in seconds between packets being received and decoded.
+    max_lag: :class:`float`
+        The longest time in seconds between a packet being received and decoded.
+    """
+
+    __slots__ = (
+        "queued",
+        "decoded",
+        "dropped",
+        "late",
+        "total_lag",
+        "max_lag",
+    )
+
+    def __init__(self) -> None:
+        self.queued: int = 0
+        self.decoded: int = 0
+        self.dropped: int = 0
+        self.late: int = 0
+        self.total_lag: float = 0.0
+        self.max_lag: float = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"<DecodeStats queued={self.queued} decoded={self.decoded}"
+            f" dropped={self.dropped} late={self.late}"
+            f" average_lag={self.average_lag:.4f}>"
+        )
+
+    @property
+    def average_lag(self) -> float:
+        """The average time in seconds between a packet being received and decoded."""
+        if not self.decoded:
+            return 0.0
+        return self.total_lag / self.decoded
+
+    def _copy(self) -> DecodeStats:
+        stats = DecodeStats()
+        for attr in self.__slots__:
+            setattr(stats, attr, getattr(self, attr))
+        return stats
+
+
+class _DecodeWorker(threading.Thread):
+    def __init__(self, manager: DecodeManager, index: int):
+        super().__init__(daemon=True, name=f"DecodeManager-{index}")
+        self.manager: DecodeManager = manager
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.decoders: dict[int, Decoder] = {}
+        self.buffers: dict[int, _JitterBuffer] = {}
+        self.stats: DecodeStats = DecodeStats()
+
+    def put(self, item: tuple[Any, float]) -> bool:
+        if self.queue.qsize() >= self.manager.max_queue:
+            self.stats.dropped += 1
+            return False
+        self.queue.put(item)
+        return True
+
+    def get_decoder(self, ssrc: int) -> Decoder:
+        decoder = self.decoders.get(ssrc)
+        if decoder is None:
+            decoder = self.decoders[ssrc] = Decoder()
+        return decoder
+
+    def _decode(self, data: RawData) -> None:
+        try:
+            if data.decrypted_data is None:
+                return
+            data.decoded_data = self.get_decoder(data.ssrc).decode(data.decrypted_data)
+        except OpusError:
+            self.manager.metrics.increment("decode_failures")
+            _log.debug("Error occurred while decoding opus frame.", exc_info=True)
+            return
+
+        stats = self.stats
+        lag = time.perf_counter() - data.receive_time
+        self.manager.metrics.observe("decode_lag", lag)
+        stats.decoded += 1
+        stats.total_lag += lag
+        if lag > stats.max_lag:
+            stats.max_lag = lag
+
+        self.manager.client.recv_decoded_audio(data)
+
+    def run(self) -> None:
+        manager = self.manager
+        get = self.queue.get
+        buffers = self.buffers
+        delay = manager._jitter_delay
+        while True:
+            # only wake up periodically while there are packets waiting
+            # in a jitter buffer, otherwise block until one arrives
+            timeout = delay if any(buffers.values()) else None
+            try:
+                item = get(timeout=timeout)
+            except queue.Empty:
+                item = ()
+
+            if item is None:
+                break
+
+            if item:
+                data = manager._unpack(*item)
+                if data is not None:
+                    buffer = buffers.get(data.ssrc)
+                    if buffer is None:
+                        buffer = buffers[data.ssrc] = _JitterBuffer(
+                            manager.jitter_buffer
+                        )
+                    ready = buffer.push(data)
+                    if ready is None:
+                        self.stats.late += 1
+                    else:
+                        for packet in ready:
+                            self._decode(packet)
+
+            deadline = time.perf_counter() - delay
+            for buffer in buffers.values():
+                for packet in buffer.pop_stale(deadline):
+                    self._decode(packet)
+
+        for buffer in buffers.values():
+            for packet in buffer.flush():
+                self._decode(packet)
+
+        buffers.clear()
+        self.decoders.clear()
+
+
 class DecodeManager(threading.Thread, _OpusStruct):
-    def __init__(self, client):
+    """Decrypts and decodes received voice packets in background threads.
+
+    Speakers are spread over ``workers`` decode threads by SSRC, so the
+    packets of one speaker are always decoded by the same thread and in order.
+    libopus releases the GIL while decoding, so several workers can use
+    several cores.
+
+    Each worker has a bounded queue; packets that arrive while it is full are
+    dropped. Before decoding, the packets of each SSRC go through a small
+    jitter buffer that restores their order, holding at most ``jitter_buffer``
+    packets or ``jitter_buffer * 20`` milliseconds worth of audio.
+    """
+
+    def __init__(
+        self,
+        client,
+        *,
+        max_queue: int = 1024,
+        jitter_buffer: int = 3,
+        workers: int = 1,
+    ):
         super().__init__(daemon=True, name="DecodeManager")
 
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
         self.client = client
-        self.decode_queue = []
+        self.metrics: VoiceMetrics = getattr(client, "metrics", None) or VoiceMetrics()
+        self.max_queue: int = max_queue
+        self.jitter_buffer: int = jitter_buffer
+        self._jitter_delay: float = jitter_buffer * self.FRAME_LENGTH / 1000
+        self._workers: list[_DecodeWorker] = [
+            _DecodeWorker(self, i) for i in range(workers)
+        ]
 
-        self.decoder = {}
+    def _worker_for(self, ssrc: int) -> _DecodeWorker:
+        return self._workers[ssrc % len(self._workers)]
 
-        self._end_thread = threading.Event()
+    def feed(self, packet: bytes, receive_time: float) -> bool:
+        """Queues a received packet that hasn't been decrypted yet.
+
+        Returns ``False`` if the packet was dropped because the queue is full.
+        """
+        ssrc = int.from_bytes(packet[8:12], "big")
+        return self._worker_for(ssrc).put((packet, receive_time))
 
     def decode(self, opus_frame):
         if not isinstance(opus_frame, RawData):
             raise TypeError("opus_frame should be a RawData object.")
-        self.decode_queue.append(opus_frame)
+        self._worker_for(opus_frame.ssrc).put((opus_frame, opus_frame.receive_time))
 
-    def run(self):
-        while not self._end_thread.is_set():
-            try:
-                data = self.decode_queue.pop(0)
-            except IndexError:
-                time.sleep(0.001)
-                continue
+    def _unpack(self, packet: Any, receive_time: float) -> RawData | None:
+        if isinstance(packet, RawData):
+            return packet
 
-            try:
-                if data.decrypted_data is None:
-                    continue
-                else:
-                    data.decoded_data = self.get_decoder(data.ssrc).decode(
-                        data.decrypted_data
-                    )
-            except OpusError:
-                print("Error occurred while decoding opus frame.")
-                continue
-
-            self.client.recv_decoded_audio(data)
+        try:
+            data = RawData(packet, self.client)
+        except Exception:
+            self.metrics.increment("decrypt_failures")
+            _log.debug(
+                "Dropping voice packet that could not be decrypted.", exc_info=True
+            )
+            return None
+
+        if data.decrypted_data == b"\xf8\xff\xfe":  # Frame of silence
+            return None
+
+        data.receive_time = receive_time
+        return data
+
+    def start(self):
+        for worker in self._workers:
+            worker.start()
+        super().start()
+
+    def run(self):
+        for worker in self._workers:
+            worker.join()
+        self.client._recording_finished()
 
     def stop(self):
-        while self.decoding:
-            time.sleep(0.1)
-            self.decoder = {}
-            gc.collect()
-            print("Decoder Process Killed")
-        self._end_thread.set()
+        # packets queued before this are still decoded
+        for worker in self._workers:
+            worker.queue.put(None)
 
     def get_decoder(self, ssrc):
-        d = self.decoder.get(ssrc)
-        if d is not None:
-            return d
-        self.decoder[ssrc] = Decoder()
-        return self.decoder[ssrc]
+        return self._worker_for(ssrc).get_decoder(ssrc)
+
+    def stats(self) -> list[DecodeStats]:
+        """Returns the statistics of each decode worker.
+
+        .. versionadded:: 2.7
+        """
+        result = []
+        for worker in self._workers:
+            stats = worker.stats._copy()
+            stats.queued = worker.queue.qsize()
+            result.append(stats)
+        return result
+
+    @property
+    def dropped(self) -> int:
+        """The number of packets dropped because a queue was full."""
+        return sum(worker.stats.dropped for worker in self._workers)
 
     @property
     def decoding(self):
-        return bool(self.decode_queue)
+        return any(not worker.queue.empty() for worker in self._workers)
@@ -30,6 +30,8 @@ import asyncio
 import io
 import json
 import logging
+import mmap
+import os
 import re
 import shlex
 import subprocess
@@ -37,13 +39,16 @@ import sys
 import threading
 import time
 import traceback
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from math import floor
 from typing import IO, TYPE_CHECKING, Any, Callable, Generic, TypeVar
 
 from .errors import ClientException
-from .oggparse import OggStream
+from .oggparse import OggError, OggStream
 from .opus import Encoder as OpusEncoder
 from .utils import MISSING
+from .voice_metrics import VoiceMetrics
 
 if TYPE_CHECKING:
     from .voice_client import VoiceClient
@@ -60,11 +65,17 @@ __all__ = (
     "FFmpegAudio",
     "FFmpegPCMAudio",
     "FFmpegOpusAudio",
+    "OggOpusFileAudio",
     "PCMVolumeTransformer",
+    "BroadcastAudio",
+    "BroadcastSubscriber",
+    "AudioScheduler",
 )
 
 CREATE_NO_WINDOW: int
 
+OPUS_SILENCE = b"\xf8\xff\xfe"
+
 if sys.platform != "win32":
     CREATE_NO_WINDOW = 0
 else:
@@ -385,6 +396,12 @@ class FFmpegOpusAudio(FFmpegAudio):
         The subprocess failed to be created.
     """
 
+    #: The maximum number of results kept by :meth:`probe`.
+    #:
+    #: .. versionadded:: 2.7
+    probe_cache_size: int = 256
+    _probe_cache: OrderedDict[Any, tuple[str | None, int | None]] = OrderedDict()
+
     def __init__(
         self,
         source: str | io.BufferedIOBase,
@@ -453,6 +470,7 @@ class FFmpegOpusAudio(FFmpegAudio):
         source: str,
         *,
         method: str | Callable[[str, str], tuple[str | None, int | None]] | None = None,
+        timeout: float = 20.0,
         **kwargs: Any,
     ) -> FT:
         """|coro|
@@ -470,6 +488,10 @@ class FFmpegOpusAudio(FFmpegAudio):
             (or avconv).  As a callable, it must take two string arguments, ``source`` and
             ``executable``.  Both parameters are the same values passed to this factory function.
             ``executable`` will default to ``ffmpeg`` if not provided as a keyword argument.
+        timeout: :class:`float`
+            Identical to the ``timeout`` parameter for :meth:`FFmpegOpusAudio.probe`.
+
+            .. versionadded:: 2.7
         kwargs
             The remaining parameters to be passed to the :class:`FFmpegOpusAudio` constructor,
             excluding ``bitrate`` and ``codec``.
@@ -511,7 +533,9 @@ class FFmpegOpusAudio(FFmpegAudio):
         """
 
         executable = kwargs.get("executable")
-        codec, bitrate = await cls.probe(source, method=method, executable=executable)
+        codec, bitrate = await cls.probe(
+            source, method=method, executable=executable, timeout=timeout
+        )
         # only re-encode if the source isn't already opus, else directly copy the source audio stream
         codec = "copy" if codec in ("opus", "libopus") else "libopus"
         return cls(source, bitrate=bitrate, codec=codec, **kwargs)  # type: ignore
@@ -523,11 +547,18 @@ class FFmpegOpusAudio(FFmpegAudio):
         *,
         method: str | Callable[[str, str], tuple[str | None, int | None]] | None = None,
         executable: str | None = None,
+        timeout: float = 20.0,
+        cache: bool = True,
     ) -> tuple[str | None, int | None]:
         """|coro|
 
         Probes the input source for bitrate and codec information.
 
+        Successful results are cached, keyed by the source and, for local files,
+        their modification time and size, so probing the same unchanged source
+        again returns immediately. The cache holds up to :attr:`probe_cache_size`
+        results, least recently used ones are evicted first.
+
         Parameters
         ----------
         source
@@ -536,10 +567,19 @@ class FFmpegOpusAudio(FFmpegAudio):
             Identical to the ``method`` parameter for :meth:`FFmpegOpusAudio.from_probe`.
         executable: :class:`str`
             Identical to the ``executable`` parameter for :class:`FFmpegOpusAudio`.
+        timeout: :class:`float`
+            How long to wait for the probe process in seconds before giving up.
+            Defaults to 20.
+
+            .. versionadded:: 2.7
+        cache: :class:`bool`
+            Whether to use and update the probe cache. Defaults to ``True``.
+
+            .. versionadded:: 2.7
 
         Returns
         -------
-        Optional[Tuple[Optional[:class:`str`], Optional[:class:`int`]]]
+        Tuple[Optional[:class:`str`], Optional[:class:`int`]]
             A 2-tuple with the codec and bitrate of the input source.
 
         Raises
@@ -552,18 +592,27 @@ class FFmpegOpusAudio(FFmpegAudio):
 
         method = method or "native"
         executable = executable or "ffmpeg"
-        probefunc = fallback = None
+        probers = {
+            "native": cls._probe_codec_native,
+            "fallback": cls._probe_codec_fallback,
+        }
 
         if isinstance(method, str):
-            probefunc = getattr(cls, f"_probe_codec_{method}", None)
+            probefunc = probers.get(method)
             if probefunc is None:
                 raise AttributeError(f"Invalid probe method {method!r}")
 
-            if probefunc is cls._probe_codec_native:
-                fallback = cls._probe_codec_fallback
+            fallback = cls._probe_codec_fallback if method == "native" else None
 
         elif callable(method):
-            probefunc = method
+            loop = asyncio.get_running_loop()
+
+            async def probefunc(source, executable, *, timeout):
+                return await asyncio.wait_for(
+                    loop.run_in_executor(None, lambda: method(source, executable)),
+                    timeout,
+                )
+
             fallback = cls._probe_codec_fallback
         else:
             raise TypeError(
@@ -571,40 +620,68 @@ class FFmpegOpusAudio(FFmpegAudio):
                 f"not '{method.__class__.__name__}'"
             )
 
+        key = None
+        if cache:
+            key = (source, executable, method, cls._probe_cache_stat(source))
+            try:
+                cls._probe_cache.move_to_end(key)
+                return cls._probe_cache[key]
+            except KeyError:
+                pass
+
         codec = bitrate = None
-        loop = asyncio.get_event_loop()
         try:
-            codec, bitrate = await loop.run_in_executor(None, lambda: probefunc(source, executable))  # type: ignore
+            codec, bitrate = await probefunc(source, executable, timeout=timeout)
         except Exception:
             if not fallback:
                 _log.exception("Probe '%s' using '%s' failed", method, executable)
-                return  # type: ignore
+                return codec, bitrate
 
             _log.exception(
                 "Probe '%s' using '%s' failed, trying fallback", method, executable
             )
             try:
-                codec, bitrate = await loop.run_in_executor(None, lambda: fallback(source, executable))  # type: ignore
+                codec, bitrate = await fallback(source, executable, timeout=timeout)
             except Exception:
                 _log.exception("Fallback probe using '%s' failed", executable)
             else:
                 _log.info("Fallback probe found codec=%s, bitrate=%s", codec, bitrate)
         else:
             _log.info("Probe found codec=%s, bitrate=%s", codec, bitrate)
-        finally:
-            return codec, bitrate
+
+        if key is not None and codec is not None:
+            cls._probe_cache[key] = (codec, bitrate)
+            while len(cls._probe_cache) > cls.probe_cache_size:
+                cls._probe_cache.popitem(last=False)
+
+        return codec, bitrate
+
+    @classmethod
+    def clear_probe_cache(cls) -> None:
+        """Removes every result from the probe cache.
+
+        .. versionadded:: 2.7
+        """
+        cls._probe_cache.clear()
 
     @staticmethod
-    def _probe_codec_native(
-        source, executable: str = "ffmpeg"
-    ) -> tuple[str | None, int | None]:
+    def _probe_cache_stat(source: str) -> tuple[int, int] | None:
+        # local files are re-probed when they change, anything else is kept as is
+        try:
+            stat = os.stat(source)
+        except (OSError, TypeError, ValueError):
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _native_probe_args(source, executable: str) -> list[str]:
         exe = (
             f"{executable[:2]}probe"
             if executable in {"ffmpeg", "avconv"}
             else executable
         )
 
-        args = [
+        return [
             exe,
             "-v",
             "quiet",
@@ -615,7 +692,9 @@ class FFmpegOpusAudio(FFmpegAudio):
             "a:0",
             source,
         ]
-        output = subprocess.check_output(args, timeout=20)
+
+    @staticmethod
+    def _parse_native_probe(output: bytes) -> tuple[str | None, int | None]:
         codec = bitrate = None
 
         if output:
@@ -629,18 +708,7 @@ class FFmpegOpusAudio(FFmpegAudio):
         return codec, bitrate
 
     @staticmethod
-    def _probe_codec_fallback(
-        source, executable: str = "ffmpeg"
-    ) -> tuple[str | None, int | None]:
-        args = [executable, "-hide_banner", "-i", source]
-        proc = subprocess.Popen(
-            args,
-            creationflags=CREATE_NO_WINDOW,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-        )
-        out, _ = proc.communicate(timeout=20)
-        output = out.decode("utf8")
+    def _parse_fallback_probe(output: str) -> tuple[str | None, int | None]:
         codec = bitrate = None
 
         codec_match = re.search(r"Stream #0.*?Audio: (\w+)", output)
@@ -653,6 +721,36 @@ class FFmpegOpusAudio(FFmpegAudio):
 
         return codec, bitrate
 
+    @staticmethod
+    async def _communicate(args: list[str], timeout: float, **kwargs: Any) -> bytes:
+        proc = await asyncio.create_subprocess_exec(
+            *args, creationflags=CREATE_NO_WINDOW, stdout=subprocess.PIPE, **kwargs
+        )
+        try:
+            out, _ = await asyncio.wait_for(proc.communicate(), timeout)
+        except BaseException:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            raise
+        return out
+
+    @classmethod
+    async def _probe_codec_native(
+        cls, source, executable: str = "ffmpeg", *, timeout: float = 20.0
+    ) -> tuple[str | None, int | None]:
+        args = cls._native_probe_args(source, executable)
+        output = await cls._communicate(args, timeout)
+        return cls._parse_native_probe(output)
+
+    @classmethod
+    async def _probe_codec_fallback(
+        cls, source, executable: str = "ffmpeg", *, timeout: float = 20.0
+    ) -> tuple[str | None, int | None]:
+        args = [executable, "-hide_banner", "-i", source]
+        output = await cls._communicate(args, timeout, stderr=subprocess.STDOUT)
+        return cls._parse_fallback_probe(output.decode("utf8"))
+
     def read(self) -> bytes:
         return next(self._packet_iter, b"")
 
@@ -660,6 +758,69 @@ class FFmpegOpusAudio(FFmpegAudio):
         return True
 
 
+class OggOpusFileAudio(AudioSource):
+    """An audio source that plays a local Ogg Opus file, such as a ``.opus``
+    file, without starting an FFmpeg process.
+
+    The file is memory mapped and its Opus packets are sent as they are,
+    without being decoded or copied. The file must contain a single Opus
+    stream at 48KHz.
+
+    .. versionadded:: 2.7
+
+    Parameters
+    ----------
+    path: Union[:class:`str`, :class:`os.PathLike`]
+        The path of the file.
+
+    Raises
+    ------
+    OggError
+        The file is not an Ogg Opus file.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self._file: IO[bytes] = open(path, "rb")
+        try:
+            self._mmap: mmap.mmap = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        except ValueError:
+            self._file.close()
+            raise OggError("the file is empty") from None
+
+        self._stream: OggStream = OggStream(self._mmap)
+        self._packet_iter = self._stream.iter_packets()
+        try:
+            head = next(self._packet_iter, b"")
+            if head[:8] != b"OpusHead":
+                raise OggError("the file is not an Ogg Opus file")
+        except OggError:
+            self.cleanup()
+            raise
+
+    def read(self) -> bytes:
+        for packet in self._packet_iter:
+            # skip the comment header and any chained stream headers
+            if packet[:8] in (b"OpusTags", b"OpusHead"):
+                continue
+            return packet
+        return b""
+
+    def is_opus(self) -> bool:
+        return True
+
+    def cleanup(self) -> None:
+        self._packet_iter.close()
+        self._stream.close()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # a packet is still referenced, the map is freed along with it
+            pass
+        self._file.close()
+
+
 class PCMVolumeTransformer(AudioSource, Generic[AT]):
     """Transforms a previous :class:`AudioSource` to have volume controls.
 
@@ -718,15 +879,218 @@ class PCMVolumeTransformer(AudioSource, Generic[AT]):
         return samples.tobytes()
 
 
+class BroadcastAudio:
+    """Plays one audio source to many voice clients while reading, and if
+    needed encoding, it only once.
+
+    A background thread reads the source in real time and keeps the last
+    ``buffer`` Opus frames. Each voice client plays its own
+    :class:`BroadcastSubscriber`, obtained from :meth:`subscribe`, which sends
+    those frames with the voice client's own encryption and sequence numbers.
+
+    Subscribers join live. A subscriber that fell behind catches up on the
+    frames that are still buffered, skipping to the oldest buffered frame if
+    needed, while a subscriber that was paused or disconnected jumps back to
+    live when it resumes. When no frame is ready in time, for example because
+    the source stalls, subscribers play silence instead of holding up their
+    player.
+
+    .. versionadded:: 2.7
+
+    Parameters
+    ----------
+    source: :class:`AudioSource`
+        The source to broadcast. It is cleaned up once it is exhausted or the
+        broadcast is closed.
+    buffer: :class:`int`
+        How many frames to keep for subscribers that fall behind.
+        Defaults to 50, one second of audio.
+    """
+
+    RESUME_GAP: float = 0.1
+
+    def __init__(self, source: AudioSource, *, buffer: int = 50) -> None:
+        if not isinstance(source, AudioSource):
+            raise TypeError(f"expected AudioSource not {source.__class__.__name__}.")
+
+        self.source: AudioSource = source
+        self._frames: deque[bytes] = deque(maxlen=buffer)
+        self._count: int = 0
+        self._condition: threading.Condition = threading.Condition()
+        self._subscribers: set[BroadcastSubscriber] = set()
+        self._thread: threading.Thread | None = None
+        self._closed: bool = False
+        self._finished: bool = False
+
+    @property
+    def subscribers(self) -> list[BroadcastSubscriber]:
+        """The subscribers that are currently playing the broadcast."""
+        return list(self._subscribers)
+
+    def is_finished(self) -> bool:
+        """Whether the source is exhausted or the broadcast was closed."""
+        return self._finished
+
+    def subscribe(self) -> BroadcastSubscriber:
+        """Creates a new audio source that plays this broadcast from now on.
+
+        Starts reading the source if it was not started yet.
+        """
+        with self._condition:
+            subscriber = BroadcastSubscriber(self, self._count)
+            self._subscribers.add(subscriber)
+            if self._thread is None and not self._finished:
+                self._thread = threading.Thread(
+                    target=self._run, daemon=True, name="BroadcastAudio"
+                )
+                self._thread.start()
+        return subscriber
+
+    def close(self) -> None:
+        """Stops reading the source. Subscribers finish once they have played the
+        frames that are already buffered.
+        """
+        self._closed = True
+
+    def _run(self) -> None:
+        delay = AudioPlayer.DELAY
+        encoder = None if self.source.is_opus() else OpusEncoder()
+        try:
+            start = time.perf_counter()
+            frames = 0
+            while not self._closed:
+                data = self.source.read()
+                if not data:
+                    break
+                if encoder is not None:
+                    data = encoder.encode(data, encoder.SAMPLES_PER_FRAME)
+
+                with self._condition:
+                    self._frames.append(data)
+                    self._count += 1
+                    self._condition.notify_all()
+
+                frames += 1
+                remaining = start + delay * frames - time.perf_counter()
+                if remaining > 0:
+                    time.sleep(remaining)
+                elif remaining < -delay * 5:
+                    # the source stalled, don't rush to make up for it
+                    start = time.perf_counter()
+                    frames = 0
+        except Exception:
+            _log.exception("Reading the broadcast source failed.")
+        finally:
+            with self._condition:
+                self._finished = True
+                self._condition.notify_all()
+            self.source.cleanup()
+
+    def _read(self, subscriber: BroadcastSubscriber) -> bytes:
+        now = time.perf_counter()
+        # reads this far apart mean the player was paused or disconnected
+        # rather than slow, so it continues live instead of from where it was
+        resumed = now - subscriber._last_read > self.RESUME_GAP
+        deadline = now + AudioPlayer.DELAY
+        with self._condition:
+            while True:
+                oldest = self._count - len(self._frames)
+                if resumed and subscriber._last_read and self._count > oldest:
+                    subscriber.skipped_frames += max(
+                        0, self._count - 1 - subscriber._next
+                    )
+                    subscriber._next = max(subscriber._next, self._count - 1)
+                elif subscriber._next < oldest:
+                    subscriber.skipped_frames += oldest - subscriber._next
+                    subscriber._next = oldest
+
+                if subscriber._next < self._count:
+                    frame = self._frames[subscriber._next - oldest]
+                    subscriber._next += 1
+                    break
+
+                if self._finished or subscriber._closed:
+                    return b""
+
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0 or not self._condition.wait(remaining):
+                    # don't hold up the player (and any player sharing its
+                    # scheduler thread) while the source is behind
+                    frame = OPUS_SILENCE
+                    break
+
+        subscriber._last_read = time.perf_counter()
+        return frame
+
+    def _unsubscribe(self, subscriber: BroadcastSubscriber) -> None:
+        with self._condition:
+            self._subscribers.discard(subscriber)
+            self._condition.notify_all()
+
+
+class BroadcastSubscriber(AudioSource):
+    """An audio source that plays a :class:`BroadcastAudio` to one voice client.
+
+    These are created by :meth:`BroadcastAudio.subscribe`.
+
+    .. versionadded:: 2.7
+
+    Attributes
+    ----------
+    broadcast: :class:`BroadcastAudio`
+        The broadcast being played.
+    skipped_frames: :class:`int`
+        The number of frames that were skipped because this subscriber fell
+        too far behind.
+    """
+
+    def __init__(self, broadcast: BroadcastAudio, start: int) -> None:
+        self.broadcast: BroadcastAudio = broadcast
+        self.skipped_frames: int = 0
+        self._next: int = start
+        self._closed: bool = False
+        self._last_read: float = 0.0
+
+    def read(self) -> bytes:
+        return self.broadcast._read(self)
+
+    def is_opus(self) -> bool:
+        return True
+
+    def cleanup(self) -> None:
+        self._closed = True
+        self.broadcast._unsubscribe(self)
+
+
 class AudioPlayer(threading.Thread):
     DELAY: float = OpusEncoder.FRAME_LENGTH / 1000.0
 
-    def __init__(self, source: AudioSource, client: VoiceClient, *, after=None):
+    def __init__(
+        self,
+        source: AudioSource,
+        client: VoiceClient,
+        *,
+        after=None,
+        scheduler: AudioScheduler | None = None,
+    ):
         threading.Thread.__init__(self)
         self.daemon: bool = True
         self.source: AudioSource = source
         self.client: VoiceClient = client
         self.after: Callable[[Exception | None], Any] | None = after
+        self.scheduler: AudioScheduler | None = scheduler
+        self.loops: int = 0
+        self.metrics: VoiceMetrics = VoiceMetrics(
+            parent=getattr(client, "metrics", None)
+        )
+        self._start: float = 0.0
+        self._first_data: bytes | None = None
+        self._reconnecting: bool = False
+        # with a scheduler: frames read ahead by the scheduler's readers
+        self._buffer: deque[bytes] = deque()
+        self._filling: Future[None] | None = None
+        self._scheduled: bool = False
+        self._done: threading.Event = threading.Event()
 
         self._end: threading.Event = threading.Event()
         self._resumed: threading.Event = threading.Event()
@@ -734,6 +1098,9 @@ class AudioPlayer(threading.Thread):
         self._current_error: Exception | None = None
         self._connected: threading.Event = client._connected
         self._lock: threading.Lock = threading.Lock()
+        # loops, _start and _played_frames_offset, changed by resume() while
+        # a scheduler thread may be sending
+        self._timeline_lock: threading.Lock = threading.Lock()
         self._played_frames_offset: int = 0
 
         if after is not None and not callable(after):
@@ -742,12 +1109,13 @@ class AudioPlayer(threading.Thread):
     def _do_run(self) -> None:
         # attempt to read first audio segment from source before starting
         # some sources can take a few seconds and may cause problems
-        first_data = self.source.read()
+        first_data = self._read()
         self.loops = 0
         self._start = time.perf_counter()
 
         # getattr lookup speed ups
         play_audio = self.client.send_audio_packet
+        metrics = self.metrics
         self._speak(True)
 
         while not self._end.is_set():
@@ -774,17 +1142,181 @@ class AudioPlayer(threading.Thread):
                 first_data = None
             # Else read the next bit from the source
             else:
-                data = self.source.read()
+                data = self._read()
 
             if not data:
                 self.stop()
                 break
 
-            play_audio(data, encode=not self.source.is_opus())
             next_time = self._start + self.DELAY * self.loops
+            if time.perf_counter() - next_time > self.DELAY:
+                metrics.increment("late_frames")
+            play_audio(data, encode=not self.source.is_opus())
+            metrics.increment("frames_sent")
             delay = max(0, self.DELAY + (next_time - time.perf_counter()))
             time.sleep(delay)
 
+    def start(self) -> None:
+        if self.scheduler is None:
+            super().start()
+            return
+
+        if self._scheduled:
+            raise RuntimeError("threads can only be started once")
+        self._scheduled = True
+        # the first read can take a while, so it is done
+        # by a reader instead of holding up the scheduler
+        self.scheduler._readers.submit(self._prepare)
+
+    def is_alive(self) -> bool:
+        if self.scheduler is None:
+            return super().is_alive()
+        return self._scheduled and not self._done.is_set()
+
+    def join(self, timeout: float | None = None) -> None:
+        if self.scheduler is None:
+            return super().join(timeout)
+        if not self._scheduled:
+            raise RuntimeError("cannot join thread before it is started")
+        self._done.wait(timeout)
+
+    def _prepare(self) -> None:
+        try:
+            self._first_data = self._read()
+            if self._first_data:
+                self._fill()
+        except Exception as exc:
+            self._current_error = exc
+            self.stop()
+            self._finish()
+            return
+
+        self._speak(True)
+        with self._timeline_lock:
+            self._start = time.perf_counter()
+        self.scheduler._add(self)
+
+    def _fill(self) -> None:
+        # runs on one of the scheduler's readers, so a source that blocks only
+        # delays its own player
+        limit = self.scheduler.max_catch_up
+        while len(self._buffer) < limit and not self._end.is_set():
+            source = self.source
+            data = self._read()
+            if source is not self.source:
+                # the source was replaced while reading, drop its frame
+                continue
+            self._buffer.append(data)
+            if not data:
+                break
+
+    def _next_frame(self) -> bytes | None:
+        # the next frame to send, or None if it hasn't been read yet
+        if self._first_data is not None:
+            data = self._first_data
+            self._first_data = None
+            return data
+
+        if self._buffer:
+            return self._buffer.popleft()
+        return None
+
+    def _read_ahead(self) -> None:
+        filling = self._filling
+        if filling is not None:
+            if not filling.done():
+                return
+            self._filling = None
+            # re-raise errors of the source on the scheduler thread
+            filling.result()
+
+        buffer = self._buffer
+        if self._end.is_set() or (buffer and not buffer[-1]):
+            # finished, or the end of the source is already buffered
+            return
+        if len(buffer) < self.scheduler.max_catch_up:
+            self._filling = self.scheduler._readers.submit(self._fill)
+
+    def _send_due(self, now: float) -> bool:
+        # called by the scheduler every tick, returns False once finished
+        if self._end.is_set():
+            return False
+
+        if not self._resumed.is_set():
+            return True
+
+        if not self._connected.is_set():
+            self._reconnecting = True
+            return True
+
+        with self._timeline_lock:
+            running = self._send_frames(now)
+        if running:
+            self._read_ahead()
+        return running
+
+    def _send_frames(self, now: float) -> bool:
+        if self._reconnecting:
+            self._reconnecting = False
+            self._played_frames_offset += self.loops
+            self.loops = 0
+            self._start = now
+
+        sent = 0
+        delay = self.DELAY
+        while self._start + delay * self.loops <= now:
+            if sent == self.scheduler.max_catch_up:
+                # too far behind to catch up, start counting from now
+                self._played_frames_offset += self.loops
+                self.loops = 0
+                self._start = now
+                break
+
+            data = self._next_frame()
+            if data is None:
+                # not read yet, it's sent late once it is
+                break
+
+            if not data:
+                self.stop()
+                return False
+
+            if now - (self._start + delay * self.loops) > delay:
+                self.metrics.increment("late_frames")
+
+            self.client.send_audio_packet(data, encode=not self.source.is_opus())
+            self.metrics.increment("frames_sent")
+            self.loops += 1
+            sent += 1
+
+        return True
+
+    def _read(self) -> bytes:
+        start = time.perf_counter()
+        data = self.source.read()
+        self.metrics.observe("read_time", time.perf_counter() - start)
+        return data
+
+    @property
+    def late_frames(self) -> int:
+        return self.metrics["late_frames"]
+
+    def _finish(self) -> None:
+        filling = self._filling
+        if filling is not None:
+            # don't clean the source up while a reader is still using it, unless
+            # it is stuck, in which case cleaning up may be what unblocks it
+            try:
+                filling.result(timeout=1)
+            except Exception:
+                pass
+
+        try:
+            self.source.cleanup()
+        finally:
+            self._done.set()
+            self._call_after()
+
     def run(self) -> None:
         try:
             self._do_run()
@@ -792,8 +1324,7 @@ class AudioPlayer(threading.Thread):
             self._current_error = exc
             self.stop()
         finally:
-            self.source.cleanup()
-            self._call_after()
+            self._finish()
 
     def _call_after(self) -> None:
         error = self._current_error
@@ -822,9 +1353,10 @@ class AudioPlayer(threading.Thread):
             self._speak(False)
 
     def resume(self, *, update_speaking: bool = True) -> None:
-        self._played_frames_offset += self.loops
-        self.loops = 0
-        self._start = time.perf_counter()
+        with self._timeline_lock:
+            self._played_frames_offset += self.loops
+            self.loops = 0
+            self._start = time.perf_counter()
         self._resumed.set()
         if update_speaking:
             self._speak(True)
@@ -839,6 +1371,7 @@ class AudioPlayer(threading.Thread):
         with self._lock:
             self.pause(update_speaking=False)
             self.source = source
+            self._buffer.clear()
             self.resume(update_speaking=False)
 
     def _speak(self, speaking: bool) -> None:
@@ -852,3 +1385,115 @@ class AudioPlayer(threading.Thread):
     def played_frames(self) -> int:
         """Gets the number of 20ms frames played since the start of the audio file."""
         return self._played_frames_offset + self.loops
+
+
+class _SchedulerThread(threading.Thread):
+    def __init__(self, scheduler: AudioScheduler, index: int):
+        super().__init__(daemon=True, name=f"AudioScheduler-{index}")
+        self.scheduler: AudioScheduler = scheduler
+        self.players: list[AudioPlayer] = []
+        self._wakeup: threading.Condition = threading.Condition()
+
+    def add(self, player: AudioPlayer) -> None:
+        with self._wakeup:
+            self.players.append(player)
+            self._wakeup.notify()
+
+    def _finish(self, player: AudioPlayer) -> None:
+        with self._wakeup:
+            self.players.remove(player)
+        # cleanup and the after callback may block, so they get their own thread
+        threading.Thread(
+            target=player._finish, daemon=True, name=f"{player.name}-finish"
+        ).start()
+
+    def run(self) -> None:
+        delay = AudioPlayer.DELAY
+        next_tick = time.perf_counter()
+        while True:
+            with self._wakeup:
+                while not self.players:
+                    self._wakeup.wait()
+                    next_tick = time.perf_counter()
+                players = self.players.copy()
+
+            now = time.perf_counter()
+            for player in players:
+                try:
+                    running = player._send_due(now)
+                except Exception as exc:
+                    player._current_error = exc
+                    player.stop()
+                    running = False
+
+                if not running:
+                    self._finish(player)
+
+            next_tick += delay
+            remaining = next_tick - time.perf_counter()
+            if remaining > 0:
+                time.sleep(remaining)
+            elif remaining < -delay:
+                # the players catch up on their own, don't try to replay missed ticks
+                next_tick = time.perf_counter()
+
+
+class AudioScheduler:
+    """Sends the audio of many voice clients from a small, fixed number of
+    threads instead of one thread per voice client.
+
+    Every 20 milliseconds each thread sends the frames that are due for the
+    players assigned to it. Each player keeps its own timeline, so a player that
+    fell behind sends the frames it missed in the next tick, up to
+    ``max_catch_up`` frames, and frames that were sent late are counted in
+    :attr:`VoiceClient.late_frames`.
+
+    Pass the same scheduler to :meth:`VoiceClient.play` for every voice client
+    that should share it.
+
+    .. versionadded:: 2.7
+
+    Parameters
+    ----------
+    threads: :class:`int`
+        The number of threads to spread the players over. Encoding PCM audio is
+        the expensive part, so more threads help when many PCM sources play at
+        once. Defaults to 1.
+    max_catch_up: :class:`int`
+        The maximum number of frames a player sends in one tick to catch up.
+        Players further behind skip ahead instead. Defaults to 5.
+    readers: :class:`int`
+        The number of threads reading from the audio sources. Sources are read
+        ahead by up to ``max_catch_up`` frames on these threads rather than on
+        the sending threads, so a source that blocks only delays its own player.
+        Defaults to 4.
+    """
+
+    def __init__(self, *, threads: int = 1, max_catch_up: int = 5, readers: int = 4):
+        if threads < 1:
+            raise ValueError("threads must be at least 1")
+        if readers < 1:
+            raise ValueError("readers must be at least 1")
+        if max_catch_up < 1:
+            raise ValueError("max_catch_up must be at least 1")
+
+        self.max_catch_up: int = max_catch_up
+        self._threads: list[_SchedulerThread] = [
+            _SchedulerThread(self, i) for i in range(threads)
+        ]
+        self._readers: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=readers, thread_name_prefix="AudioScheduler-reader"
+        )
+        self._lock: threading.Lock = threading.Lock()
+
+    def _add(self, player: AudioPlayer) -> None:
+        with self._lock:
+            thread = min(self._threads, key=lambda t: len(t.players))
+            if not thread.is_alive():
+                thread.start()
+        thread.add(player)
+
+    @property
+    def players(self) -> list[AudioPlayer]:
+        """The players currently being serviced."""
+        return [player for thread in self._threads for player in thread.players]
@@ -442,9 +442,11 @@ class AutoShardedClient(Client):
 
     async def launch_shards(self) -> None:
         if self.shard_count is None:
-            self.shard_count, gateway = await self.http.get_bot_gateway()
+            self.shard_count, gateway = await self.http.get_bot_gateway(
+                compress=self._gateway_compression
+            )
         else:
-            gateway = await self.http.get_gateway()
+            gateway = await self.http.get_gateway(compress=self._gateway_compression)
 
         self._connection.shard_count = self.shard_count
 
@@ -494,6 +496,9 @@ class AutoShardedClient(Client):
             except Exception:
                 pass
 
+        if self._event_executor is not None:
+            self._event_executor.cancel()
+
         to_close = [
             asyncio.ensure_future(shard.close(), loop=self.loop)
             for shard in self.__shards.values()
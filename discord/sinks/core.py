@@ -97,35 +97,49 @@ class Filters:
         self.vc.stop_recording()
 
 
+_RTP_HEADER = struct.Struct(">xxHII")
+
+
 class RawData:
     """Handles raw data from Discord so that it can be decrypted and decoded to be used.
 
     .. versionadded:: 2.0
     """
 
+    __slots__ = (
+        "data",
+        "client",
+        "sequence",
+        "timestamp",
+        "ssrc",
+        "header",
+        "decrypted_data",
+        "decoded_data",
+        "user_id",
+        "receive_time",
+    )
+
     def __init__(self, data, client):
-        self.data = bytearray(data)
+        # views into the received packet, nothing is copied until decryption
+        packet = memoryview(data)
         self.client = client
 
-        unpacker = struct.Struct(">xxHII")
-        self.sequence, self.timestamp, self.ssrc = unpacker.unpack_from(self.data[:12])
+        self.sequence, self.timestamp, self.ssrc = _RTP_HEADER.unpack_from(packet)
 
         # RFC3550 5.1: RTP Fixed Header Fields
-        if self.client.mode.endswith("_rtpsize"):
+        if client.mode.endswith("_rtpsize"):
             # If It Has CSRC Chunks
-            cutoff = 12 + (data[0] & 0b00_0_0_1111) * 4
+            cutoff = 12 + (packet[0] & 0b00_0_0_1111) * 4
             # If It Has A Extension
-            if data[0] & 0b00_0_1_0000:
+            if packet[0] & 0b00_0_1_0000:
                 cutoff += 4
         else:
             cutoff = 12
 
-        self.header = data[:cutoff]
-        self.data = self.data[cutoff:]
+        self.header = packet[:cutoff]
+        self.data = packet[cutoff:]
 
-        self.decrypted_data = getattr(self.client, f"_decrypt_{self.client.mode}")(
-            self.header, self.data
-        )
+        self.decrypted_data = client._decrypt(self.header, self.data)
         self.decoded_data = None
 
         self.user_id = None
@@ -87,3 +87,10 @@ class MKASinkError(SinkException):
 
     .. versionadded:: 2.0
     """
+
+
+class StreamingSinkError(SinkException):
+    """Exception thrown when an exception occurs with :class:`StreamingSink`
+
+    .. versionadded:: 2.7
+    """
@@ -0,0 +1,375 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import queue
+import struct
+import subprocess
+import tempfile
+import threading
+import zlib
+from typing import IO
+
+from .core import CREATE_NO_WINDOW, AudioData, Filters, Sink
+from .errors import StreamingSinkError
+
+__all__ = (
+    "StreamingSink",
+    "StreamingAudioData",
+)
+
+_log = logging.getLogger(__name__)
+
+_FFMPEG_FORMATS = {
+    "m4a": "ipod",
+    "mka": "matroska",
+    "mkv": "matroska",
+}
+
+
+# every byte value with its bits in reverse order
+_BIT_REVERSE = bytes(int(f"{i:08b}"[::-1], 2) for i in range(256))
+_OGG_PAGE_HEADER = struct.Struct("<4sBBqIIIB")
+
+
+def _ogg_crc(data: bytes) -> int:
+    # Ogg uses the same polynomial as zlib, but unreflected and without
+    # inverting the CRC, so reverse the bits going in and out of zlib
+    crc = zlib.crc32(data.translate(_BIT_REVERSE), 0xFFFFFFFF) ^ 0xFFFFFFFF
+    return int.from_bytes(crc.to_bytes(4, "little").translate(_BIT_REVERSE), "big")
+
+
+class _OggOpusWriter:
+    """Encodes PCM with libopus and writes it to an Ogg Opus file as it arrives."""
+
+    # a page is written after this many packets, about a second of audio
+    PACKETS_PER_PAGE = 50
+
+    def __init__(self, file: IO[bytes], serial: int):
+        from .. import opus  # circular import
+
+        self.file: IO[bytes] = file
+        self.serial: int = serial
+        self.encoder = opus.Encoder()
+        self.frame_size: int = opus.Encoder.FRAME_SIZE
+        self.samples_per_frame: int = opus.Encoder.SAMPLES_PER_FRAME
+        self._pcm: bytearray = bytearray()
+        self._packets: list[bytes] = []
+        self._segments: int = 0
+        self._sequence: int = 0
+        self._granule: int = 0
+
+        head = struct.pack(
+            "<8sBBHIhB",
+            b"OpusHead",
+            1,
+            opus.Encoder.CHANNELS,
+            312,  # pre-skip, the encoder's default look-ahead
+            opus.Encoder.SAMPLING_RATE,
+            0,
+            0,
+        )
+        vendor = b"pycord"
+        tags = b"OpusTags" + struct.pack("<I", len(vendor)) + vendor + b"\x00" * 4
+        self._write_page([head], 0, header_type=0x02)
+        self._write_page([tags], 0)
+
+    def _write_page(
+        self, packets: list[bytes], granule: int, *, header_type: int = 0
+    ) -> None:
+        lacing = bytearray()
+        for packet in packets:
+            size = len(packet)
+            lacing.extend(b"\xff" * (size // 255))
+            lacing.append(size % 255)
+
+        header = _OGG_PAGE_HEADER.pack(
+            b"OggS",
+            0,
+            header_type,
+            granule,
+            self.serial,
+            self._sequence,
+            0,
+            len(lacing),
+        )
+        page = bytearray(header)
+        page += lacing
+        for packet in packets:
+            page += packet
+        struct.pack_into("<I", page, 22, _ogg_crc(page))
+        self.file.write(page)
+        self._sequence += 1
+
+    def _flush(self, *, last: bool = False) -> None:
+        if self._packets or last:
+            self._write_page(
+                self._packets, self._granule, header_type=0x04 if last else 0
+            )
+            self._packets = []
+            self._segments = 0
+
+    def write(self, data: bytes) -> None:
+        pcm = self._pcm
+        pcm += data
+        frame_size = self.frame_size
+        offset = 0
+        while len(pcm) - offset >= frame_size:
+            frame = bytes(pcm[offset : offset + frame_size])
+            offset += frame_size
+            packet = self.encoder.encode(frame, self.samples_per_frame)
+            segments = len(packet) // 255 + 1
+            # a page holds at most 255 lacing values
+            if self._segments + segments > 255:
+                self._flush()
+            self._packets.append(packet)
+            self._segments += segments
+            self._granule += self.samples_per_frame
+            if len(self._packets) >= self.PACKETS_PER_PAGE:
+                self._flush()
+        del pcm[:offset]
+
+    def close(self) -> None:
+        if self._pcm:
+            self.write(b"\x00" * (self.frame_size - len(self._pcm)))
+        self._flush(last=True)
+
+
+class StreamingAudioData(AudioData):
+    """Audio data of one user that is encoded while it is being recorded.
+
+    Unlike :class:`AudioData`, the recorded PCM is never kept in memory: it is
+    passed straight to an encoder which writes to a file on disk. Once
+    recording stops, :attr:`file` is that file, opened for reading.
+
+    .. versionadded:: 2.7
+
+    Attributes
+    ----------
+    dropped_frames: :class:`int`
+        The number of frames dropped because ffmpeg fell more than
+        ``MAX_PENDING`` frames behind.
+    """
+
+    # audio waiting to be piped into ffmpeg, about 10 seconds
+    MAX_PENDING = 500
+
+    def __init__(self, sink: StreamingSink, user: int):
+        super().__init__(None)
+        self.sink: StreamingSink = sink
+        self.path: str | None = None
+        self._process: subprocess.Popen | None = None
+        self._writer: _OggOpusWriter | None = None
+        self._pending: queue.Queue[bytes | None] | None = None
+        self._pipe: threading.Thread | None = None
+        self.dropped_frames: int = 0
+
+        if sink.directory is not None:
+            os.makedirs(sink.directory, exist_ok=True)
+            self.path = os.path.join(sink.directory, f"{user}.{sink.encoding}")
+        else:
+            fd, self.path = tempfile.mkstemp(suffix=f".{sink.encoding}")
+            os.close(fd)
+
+        if sink.encoding == "opus":
+            self.file = open(self.path, "w+b")
+            self._writer = _OggOpusWriter(self.file, user & 0xFFFFFFFF)
+            return
+
+        args = [
+            sink.executable,
+            "-y",
+            "-f",
+            "s16le",
+            "-ar",
+            "48000",
+            "-loglevel",
+            "error",
+            "-ac",
+            "2",
+            "-i",
+            "-",
+            "-f",
+            _FFMPEG_FORMATS.get(sink.encoding, sink.encoding),
+            self.path,
+        ]
+        try:
+            self._process = subprocess.Popen(
+                args, creationflags=CREATE_NO_WINDOW, stdin=subprocess.PIPE
+            )
+        except FileNotFoundError:
+            raise StreamingSinkError(f"{sink.executable} was not found.") from None
+        except subprocess.SubprocessError as exc:
+            raise StreamingSinkError(
+                "Popen failed: {0.__class__.__name__}: {0}".format(exc)
+            ) from exc
+
+        # a full pipe blocks the writer, so don't let that hold up decoding
+        self._pending = queue.Queue(self.MAX_PENDING)
+        self._pipe = threading.Thread(
+            target=self._pipe_audio, name=f"StreamingSink-{user}", daemon=True
+        )
+        self._pipe.start()
+
+    def _pipe_audio(self) -> None:
+        stdin = self._process.stdin
+        pending = self._pending
+        while (data := pending.get()) is not None:
+            try:
+                stdin.write(data)
+            except (BrokenPipeError, ValueError):
+                _log.warning(
+                    "%s stopped accepting audio for %s.",
+                    self.sink.executable,
+                    self.path,
+                )
+                # keep emptying the queue so cleanup doesn't block on it
+                while pending.get() is not None:
+                    pass
+                return
+
+    def write(self, data):
+        """Encodes audio data.
+
+        Raises
+        ------
+        SinkException
+            The AudioData is already finished writing.
+        """
+        if self.finished:
+            raise StreamingSinkError("The AudioData is already finished writing.")
+
+        if self._writer is not None:
+            self._writer.write(data)
+            return
+
+        try:
+            self._pending.put_nowait(data)
+        except queue.Full:
+            # waiting would hold up decoding for every user
+            if not self.dropped_frames:
+                _log.warning(
+                    "%s is falling behind, dropping audio for %s.",
+                    self.sink.executable,
+                    self.path,
+                )
+            self.dropped_frames += 1
+
+    def cleanup(self):
+        """Finishes encoding and opens the encoded file for reading.
+
+        Raises
+        ------
+        SinkException
+            The AudioData is already finished writing.
+        """
+        if self.finished:
+            raise StreamingSinkError("The AudioData is already finished writing.")
+
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            self.file.flush()
+        else:
+            self._pending.put(None)
+            self._pipe.join()
+            with contextlib.suppress(BrokenPipeError):
+                self._process.stdin.close()
+            if self._process.wait() != 0:
+                raise StreamingSinkError(
+                    f"{self.sink.executable} exited with code {self._process.returncode}."
+                )
+            self.file = open(self.path, "rb")
+
+        if self.sink.directory is None:
+            # the open file keeps the data around until it is closed
+            with contextlib.suppress(OSError):
+                os.remove(self.path)
+            self.path = None
+
+        self.file.seek(0)
+        self.finished = True
+
+
+class StreamingSink(Sink):
+    """A sink that encodes audio while it is being recorded, so memory usage
+    stays constant however long the recording is, and the files are ready as
+    soon as recording stops.
+
+    Each user's audio is either piped into its own long-running ``ffmpeg``
+    process, or, for the ``opus`` encoding, encoded with libopus and written to
+    an Ogg Opus file directly, which does not need ffmpeg.
+
+    Audio is piped into ffmpeg by a thread of its own, so a slow ffmpeg does
+    not hold up decoding. If ffmpeg falls more than about 10 seconds behind,
+    audio is dropped instead and counted in
+    :attr:`StreamingAudioData.dropped_frames`.
+
+    .. versionadded:: 2.7
+
+    Parameters
+    ----------
+    encoding: :class:`str`
+        The file format to encode to, such as ``ogg``, ``mp3``, ``mp4``,
+        ``m4a``, ``mka``, ``mkv`` or ``opus``. Defaults to ``opus``.
+    directory: Optional[:class:`str`]
+        The directory to keep the files in, named after the user ID and encoding.
+        If not given, temporary files are used which are deleted once closed.
+    executable: :class:`str`
+        The ffmpeg executable to use. Defaults to ``ffmpeg``.
+    filters: Optional[:class:`dict`]
+        The filters to apply, see :class:`Filters`.
+    """
+
+    def __init__(
+        self,
+        *,
+        encoding: str = "opus",
+        directory: str | os.PathLike[str] | None = None,
+        executable: str = "ffmpeg",
+        filters=None,
+    ):
+        super().__init__(filters=filters)
+        self.encoding: str = encoding
+        self.directory: str | None = (
+            os.fspath(directory) if directory is not None else None
+        )
+        self.executable: str = executable
+
+    @Filters.container
+    def write(self, data, user):
+        audio = self.audio_data.get(user)
+        if audio is None:
+            audio = self.audio_data[user] = StreamingAudioData(self, user)
+        audio.write(data)
+
+    def format_audio(self, audio):
+        """Called once the audio of a user is finished. The audio is already
+        encoded, so this does nothing else.
+        """
+        audio.on_format(self.encoding)
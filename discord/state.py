@@ -27,17 +27,20 @@ from __future__ import annotations
 
 import asyncio
 import copy
+import heapq
 import inspect
 import itertools
 import logging
 import os
-from collections import OrderedDict, deque
+from collections import OrderedDict
+from collections.abc import Sequence as _SequenceABC
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Coroutine,
-    Deque,
+    Iterable,
+    Iterator,
     Sequence,
     TypeVar,
     Union,
@@ -50,7 +53,14 @@ from .automod import AutoModRule
 from .channel import *
 from .channel import _channel_factory
 from .emoji import AppEmoji, GuildEmoji
-from .enums import ChannelType, InteractionType, ScheduledEventStatus, Status, try_enum
+from .enums import (
+    ChannelType,
+    EventParseMode,
+    InteractionType,
+    ScheduledEventStatus,
+    Status,
+    try_enum,
+)
 from .flags import ApplicationFlags, Intents, MemberCacheFlags
 from .guild import Guild
 from .integrations import _integration_factory
@@ -69,6 +79,7 @@ from .scheduled_events import ScheduledEvent
 from .stage_instance import StageInstance
 from .sticker import GuildSticker
 from .threads import Thread, ThreadMember
+from .ui.dynamic import ComponentStateStore, _DynamicRouter
 from .ui.modal import Modal, ModalStore
 from .ui.view import View, ViewStore
 from .user import ClientUser, User
@@ -111,6 +122,7 @@ class ChunkRequest:
         self.nonce: str = os.urandom(16).hex()
         self.buffer: list[Member] = []
         self.waiters: list[asyncio.Future[list[Member]]] = []
+        self.finished: bool = False
 
     def add_members(self, members: list[Member]) -> None:
         self.buffer.extend(members)
@@ -138,14 +150,278 @@ class ChunkRequest:
         return future
 
     def done(self) -> None:
+        self.finished = True
         for future in self.waiters:
             if not future.done():
                 future.set_result(self.buffer)
 
 
+def _default_chunk_priority(guild: Guild) -> float:
+    # larger guilds take the most chunks, so they are requested first
+    return guild._member_count or 0
+
+
+class ChunkScheduler:
+    """Sends the chunk requests of every shard in order of priority.
+
+    Requests are queued per shard and sent as soon as the shard's gateway
+    rate limit allows, without waiting for earlier guilds to finish. At most
+    ``concurrency`` requests per shard wait for their chunks at once, and
+    ``RESERVE`` sends of each rate limit window are left for everything else.
+
+    A request that is not answered within ``timeout`` seconds is given up:
+    its waiters get the members received so far, and the guild is no longer
+    counted towards the progress of the shard.
+    """
+
+    RESERVE: int = 10
+
+    def __init__(
+        self,
+        state: ConnectionState,
+        *,
+        concurrency: int = 8,
+        priority: Callable[[Guild], float] | None = None,
+        timeout: float | None = 60.0,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("chunk_concurrency must be at least 1")
+        if timeout is not None and timeout <= 0:
+            raise ValueError("chunk_timeout must be greater than 0")
+
+        self.state: ConnectionState = state
+        self.concurrency: int = concurrency
+        self.timeout: float | None = timeout
+        self.priority: Callable[[Guild], float] = priority or _default_chunk_priority
+        self._counter: Iterator[int] = itertools.count()
+        self._queues: dict[int | None, list[tuple[float, int, int, ChunkRequest]]] = {}
+        self._slots: dict[int | None, asyncio.Semaphore] = {}
+        self._workers: dict[int | None, asyncio.Task] = {}
+        self._progress: dict[int | None, list[int]] = {}
+
+    def schedule(
+        self, guild: Guild, request: ChunkRequest, *, priority: float | None = None
+    ) -> None:
+        shard_id = guild.shard_id
+        if priority is None:
+            priority = self.priority(guild)
+
+        queue = self._queues.setdefault(shard_id, [])
+        heapq.heappush(queue, (-priority, next(self._counter), guild.id, request))
+
+        progress = self._progress.setdefault(shard_id, [0, 0])
+        progress[1] += 1
+
+        if shard_id not in self._workers:
+            self._workers[shard_id] = asyncio.create_task(self._run(shard_id))
+
+    def progress(self, shard_id: int | None) -> tuple[int, int]:
+        """Returns how many of the guilds scheduled on a shard are chunked."""
+        done, total = self._progress.get(shard_id, (0, 0))
+        return done, total
+
+    def _completed(self, shard_id: int | None, *, abandoned: bool = False) -> None:
+        progress = self._progress[shard_id]
+        if abandoned:
+            progress[1] -= 1
+        else:
+            progress[0] += 1
+        done, total = progress
+        self.state.dispatch("chunk_progress", shard_id, done, total)
+        if done >= total:
+            _log.info("Shard ID %s finished chunking %d guilds.", shard_id, total)
+            del self._progress[shard_id]
+
+    async def _run(self, shard_id: int | None) -> None:
+        queue = self._queues[shard_id]
+        slots = self._slots.get(shard_id)
+        if slots is None:
+            slots = self._slots[shard_id] = asyncio.Semaphore(self.concurrency)
+
+        try:
+            while queue:
+                await slots.acquire()
+                if not queue:
+                    slots.release()
+                    break
+
+                _, _, guild_id, request = heapq.heappop(queue)
+                if request.finished:
+                    slots.release()
+                    continue
+
+                await self._wait_for_budget(guild_id)
+                try:
+                    await self.state.chunker(guild_id, nonce=request.nonce)
+                except Exception:
+                    _log.exception(
+                        "Failed to request chunks for guild ID %s.", guild_id
+                    )
+                    # don't leave anyone waiting for chunks that will never come
+                    self.state._chunk_requests.pop(guild_id, None)
+                    request.done()
+                    self._release(shard_id, slots)
+                    continue
+
+                self._watch(shard_id, slots, request)
+        finally:
+            del self._workers[shard_id]
+
+    def _watch(
+        self, shard_id: int | None, slots: asyncio.Semaphore, request: ChunkRequest
+    ) -> None:
+        if request.finished:
+            self._release(shard_id, slots)
+            return
+
+        future = request.get_future()
+        handle = None
+        if self.timeout is not None:
+            handle = self.state.loop.call_later(
+                self.timeout, self._abandon, shard_id, slots, request, future
+            )
+
+        def callback(_: asyncio.Future) -> None:
+            if handle is not None:
+                handle.cancel()
+            if not future.cancelled():
+                self._release(shard_id, slots)
+
+        future.add_done_callback(callback)
+
+    def _abandon(
+        self,
+        shard_id: int | None,
+        slots: asyncio.Semaphore,
+        request: ChunkRequest,
+        future: asyncio.Future[list[Member]],
+    ) -> None:
+        if future.done():
+            return
+
+        _log.warning(
+            "Guild ID %s did not finish sending its members within %.1f seconds, "
+            "giving up on it after %d members.",
+            request.guild_id,
+            self.timeout,
+            len(request.buffer),
+        )
+        future.cancel()
+        requests = self.state._chunk_requests
+        for key, pending in list(requests.items()):
+            if pending is request:
+                del requests[key]
+        request.done()
+        self._release(shard_id, slots, abandoned=True)
+
+    def _release(
+        self, shard_id: int | None, slots: asyncio.Semaphore, *, abandoned: bool = False
+    ) -> None:
+        slots.release()
+        self._completed(shard_id, abandoned=abandoned)
+
+    async def _wait_for_budget(self, guild_id: int) -> None:
+        ws = self.state._get_websocket(guild_id)
+        limiter = getattr(ws, "_rate_limiter", None)
+        if limiter is None:
+            return
+
+        delay = limiter.reserve_delay(self.RESERVE)
+        while delay:
+            await asyncio.sleep(delay)
+            delay = limiter.reserve_delay(self.RESERVE)
+
+
+class MessageCache(_SequenceABC):
+    """A bounded, insertion ordered message cache with an ID index.
+
+    Iteration, ``len``, ``append`` and ``remove`` behave like a
+    ``deque(maxlen=max_messages)``, but lookups and removals by message ID are
+    O(1) instead of requiring a linear scan. The oldest message is evicted
+    first once ``maxlen`` is exceeded, and the index is kept in sync with
+    evictions.
+    """
+
+    __slots__ = ("maxlen", "_store")
+
+    def __init__(
+        self, iterable: Iterable[Message] = (), maxlen: int | None = None
+    ) -> None:
+        self.maxlen: int | None = maxlen
+        self._store: OrderedDict[int, Message] = OrderedDict()
+        for message in iterable:
+            self.append(message)
+
+    def __repr__(self) -> str:
+        return f"<MessageCache maxlen={self.maxlen} len={len(self._store)}>"
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __iter__(self) -> Iterator[Message]:
+        return iter(self._store.values())
+
+    def __reversed__(self) -> Iterator[Message]:
+        return reversed(self._store.values())
+
+    def __contains__(self, item: Any) -> bool:
+        message_id = getattr(item, "id", None)
+        return self._store.get(message_id) is item  # type: ignore
+
+    def __getitem__(self, idx):
+        size = len(self._store)
+        if isinstance(idx, slice):
+            return list(self._store.values())[idx]
+
+        if idx < 0:
+            idx += size
+        if not 0 <= idx < size:
+            raise IndexError("message cache index out of range")
+
+        # walk from whichever end is closer
+        if idx < size // 2:
+            return next(itertools.islice(self._store.values(), idx, None))
+        return next(
+            itertools.islice(reversed(self._store.values()), size - idx - 1, None)
+        )
+
+    def append(self, message: Message) -> None:
+        store = self._store
+        message_id = message.id
+        if message_id in store:
+            store.move_to_end(message_id)
+        store[message_id] = message
+
+        if self.maxlen is not None:
+            while len(store) > self.maxlen:
+                store.popitem(last=False)
+
+    def get(self, message_id: int | None) -> Message | None:
+        return self._store.get(message_id)  # type: ignore
+
+    def pop(self, message_id: int | None) -> Message | None:
+        return self._store.pop(message_id, None)  # type: ignore
+
+    def remove(self, message: Message) -> None:
+        if self._store.get(message.id) is not message:
+            raise ValueError("message is not in the cache")
+        del self._store[message.id]
+
+    def clear(self) -> None:
+        self._store.clear()
+
+
 _log = logging.getLogger(__name__)
 
 
+# events the state cannot be built without
+_REQUIRED_EVENTS = frozenset(("READY", "RESUMED", "GUILD_CREATE"))
+
+
+def _ignore_event(data: Any) -> None:
+    return
+
+
 async def logging_coroutine(coroutine: Coroutine[Any, Any, T], *, info: str) -> None:
     try:
         await coroutine
@@ -197,6 +473,20 @@ class ConnectionState:
 
         self.allowed_mentions: AllowedMentions | None = allowed_mentions
         self._chunk_requests: dict[int | str, ChunkRequest] = {}
+        self._chunk_scheduler: ChunkScheduler = ChunkScheduler(
+            self,
+            concurrency=options.get("chunk_concurrency", 8),
+            priority=options.get("chunk_priority"),
+            timeout=options.get("chunk_timeout", 60.0),
+        )
+        # guilds from READY that haven't been received through GUILD_CREATE yet
+        self._ready_pending: set[int] = set()
+        self._dynamic_router: _DynamicRouter = _DynamicRouter()
+        # decides from the raw payload whether a MESSAGE_CREATE becomes a Message
+        self._message_filter: Callable[[MessagePayload], bool] | None = None
+        self.component_state_store: ComponentStateStore | None = options.get(
+            "component_state_store"
+        )
 
         activity = options.get("activity", None)
         if activity:
@@ -243,6 +533,8 @@ class ConnectionState:
             cache_flags._verify_intents(intents)
 
         self.member_cache_flags: MemberCacheFlags = cache_flags
+        self.compact_member_cache: bool = options.get("compact_member_cache", False)
+        self.lazy_guilds: bool = options.get("lazy_guilds", False)
         self._activity: ActivityPayload | None = activity
         self._status: str | None = status
         self._intents: Intents = intents
@@ -254,9 +546,33 @@ class ConnectionState:
         self.cache_app_emojis: bool = options.get("cache_app_emojis", False)
 
         self.parsers = parsers = {}
+        raw_parsers = {}
         for attr, func in inspect.getmembers(self):
             if attr.startswith("parse_"):
                 parsers[attr[6:].upper()] = func
+            elif attr.startswith("raw_parse_"):
+                raw_parsers[attr[10:].upper()] = func
+
+        event_parsing = options.get("event_parsing") or {}
+        for event, mode in event_parsing.items():
+            event = event.upper()
+            if not isinstance(mode, EventParseMode):
+                raise TypeError(
+                    f"event_parsing values must be EventParseMode not {type(mode)!r}"
+                )
+            if mode is EventParseMode.full:
+                continue
+            if event in _REQUIRED_EVENTS:
+                raise ValueError(f"{event} events must be parsed fully")
+            if mode is EventParseMode.ignore:
+                parsers[event] = _ignore_event
+            else:
+                try:
+                    parsers[event] = raw_parsers[event]
+                except KeyError:
+                    raise ValueError(
+                        f"{event} events cannot be parsed raw only"
+                    ) from None
 
         self.clear()
 
@@ -289,9 +605,9 @@ class ConnectionState:
         # extra dict to look up private channels by user id
         self._private_channels_by_user: dict[int, DMChannel] = {}
         if self.max_messages is not None:
-            self._messages: Deque[Message] | None = deque(maxlen=self.max_messages)
+            self._messages: MessageCache | None = MessageCache(maxlen=self.max_messages)
         else:
-            self._messages: Deque[Message] | None = None
+            self._messages: MessageCache | None = None
 
     def process_chunk_requests(
         self, guild_id: int, nonce: str | None, members: list[Member], complete: bool
@@ -514,11 +830,7 @@ class ConnectionState:
                 self._private_channels_by_user.pop(recipient.id, None)
 
     def _get_message(self, msg_id: int | None) -> Message | None:
-        return (
-            utils.find(lambda m: m.id == msg_id, reversed(self._messages))
-            if self._messages
-            else None
-        )
+        return self._messages.get(msg_id) if self._messages else None
 
     def _add_guild_from_data(self, data: GuildPayload) -> Guild:
         guild = Guild(data=data, state=self)
@@ -609,7 +921,7 @@ class ConnectionState:
                 self.maybe_store_app_emoji(self.application_id, e)
         try:
             states = []
-            while True:
+            while self._ready_pending or not self._ready_state.empty():
                 # this snippet of code is basically waiting N seconds
                 # until the last GUILD_CREATE was sent
                 try:
@@ -665,6 +977,7 @@ class ConnectionState:
         self.clear(views=False)
         self.user = ClientUser(state=self, data=data["user"])
         self.store_user(data["user"])
+        self._ready_pending = {int(guild["id"]) for guild in data["guilds"]}
 
         if self.application_id is None:
             try:
@@ -732,11 +1045,6 @@ class ConnectionState:
 
     def parse_message_create(self, data) -> None:
         channel, _ = self._get_guild_channel(data)
-        # channel would be the correct type here
-        message = Message(channel=channel, data=data, state=self)  # type: ignore
-        self.dispatch("message", message)
-        if self._messages is not None:
-            self._messages.append(message)
         # we ensure that the channel is either a TextChannel, VoiceChannel, StageChannel, or Thread
         if channel and channel.__class__ in (
             TextChannel,
@@ -744,7 +1052,16 @@ class ConnectionState:
             StageChannel,
             Thread,
         ):
-            channel.last_message_id = message.id  # type: ignore
+            channel.last_message_id = int(data["id"])  # type: ignore
+
+        if self._message_filter is not None and not self._message_filter(data):
+            return
+
+        # channel would be the correct type here
+        message = Message(channel=channel, data=data, state=self)  # type: ignore
+        self.dispatch("message", message)
+        if self._messages is not None:
+            self._messages.append(message)
 
     def parse_message_delete(self, data) -> None:
         raw = RawMessageDeleteEvent(data)
@@ -759,8 +1076,11 @@ class ConnectionState:
         raw = RawBulkMessageDeleteEvent(data)
         if self._messages:
             found_messages = [
-                message for message in self._messages if message.id in raw.message_ids
+                message
+                for message in map(self._messages.get, raw.message_ids)
+                if message is not None
             ]
+            found_messages.sort(key=lambda m: m.id)
         else:
             found_messages = []
         raw.cached_messages = found_messages
@@ -769,7 +1089,7 @@ class ConnectionState:
             self.dispatch("bulk_message_delete", found_messages)
             for msg in found_messages:
                 # self._messages won't be None here
-                self._messages.remove(msg)  # type: ignore
+                self._messages.pop(msg.id)  # type: ignore
 
     def parse_message_update(self, data) -> None:
         raw = RawMessageUpdateEvent(data)
@@ -1394,7 +1714,7 @@ class ConnectionState:
     def is_guild_evicted(self, guild) -> bool:
         return guild.id not in self._guilds
 
-    async def chunk_guild(self, guild, *, wait=True, cache=None):
+    async def chunk_guild(self, guild, *, wait=True, cache=None, priority=None):
         # Note: This method makes an API call without timeout, and should be used in
         #       conjunction with `asyncio.wait_for(..., timeout=...)`.
         cache = cache or self.member_cache_flags.joined
@@ -1403,7 +1723,7 @@ class ConnectionState:
             self._chunk_requests[guild.id] = request = ChunkRequest(
                 guild.id, self.loop, self._get_guild, cache=cache
             )
-            await self.chunker(guild.id, nonce=request.nonce)
+            self._chunk_scheduler.schedule(guild, request, priority=priority)
 
         if wait:
             return await request.wait()
@@ -1431,6 +1751,7 @@ class ConnectionState:
         try:
             # Notify the on_ready state, if any, that this guild is complete.
             self._ready_state.put_nowait(guild)
+            self._ready_pending.discard(guild.id)
         except AttributeError:
             pass
         else:
@@ -1478,7 +1799,7 @@ class ConnectionState:
 
         # do a cleanup of the messages cache
         if self._messages is not None:
-            self._messages: Deque[Message] | None = deque(
+            self._messages: MessageCache | None = MessageCache(
                 (msg for msg in self._messages if msg.guild != guild),
                 maxlen=self.max_messages,
             )
@@ -1943,6 +2264,95 @@ class ConnectionState:
             if user is not None:
                 self.dispatch("typing", channel, user, raw.when)
 
+    # raw only parsers, these dispatch the raw event without touching the cache
+
+    # the raw parsers of delete events still remove what they delete from the
+    # cache, as nothing else would and it costs no more than a lookup
+
+    def raw_parse_message_delete(self, data) -> None:
+        raw = RawMessageDeleteEvent(data)
+        if self._messages is not None:
+            raw.cached_message = self._messages.pop(raw.message_id)
+        self.dispatch("raw_message_delete", raw)
+
+    def raw_parse_message_delete_bulk(self, data) -> None:
+        raw = RawBulkMessageDeleteEvent(data)
+        if self._messages:
+            raw.cached_messages = sorted(
+                filter(None, map(self._messages.pop, raw.message_ids)),
+                key=lambda m: m.id,
+            )
+        self.dispatch("raw_bulk_message_delete", raw)
+
+    def raw_parse_message_update(self, data) -> None:
+        raw = RawMessageUpdateEvent(data)
+        self.dispatch("raw_message_edit", raw)
+        if "components" in data and self._view_store.is_message_tracked(raw.message_id):
+            self._view_store.update_from_message(raw.message_id, data["components"])
+
+    def _raw_reaction_emoji(self, data) -> PartialEmoji:
+        emoji = data["emoji"]
+        return PartialEmoji.with_state(
+            self,
+            id=utils._get_as_snowflake(emoji, "id"),
+            animated=emoji.get("animated", False),
+            name=emoji["name"],
+        )
+
+    def raw_parse_message_reaction_add(self, data) -> None:
+        emoji = self._raw_reaction_emoji(data)
+        raw = RawReactionActionEvent(data, emoji, "REACTION_ADD")
+        self.dispatch("raw_reaction_add", raw)
+
+    def raw_parse_message_reaction_remove(self, data) -> None:
+        emoji = self._raw_reaction_emoji(data)
+        raw = RawReactionActionEvent(data, emoji, "REACTION_REMOVE")
+        self.dispatch("raw_reaction_remove", raw)
+
+    def raw_parse_message_reaction_remove_all(self, data) -> None:
+        self.dispatch("raw_reaction_clear", RawReactionClearEvent(data))
+
+    def raw_parse_message_reaction_remove_emoji(self, data) -> None:
+        emoji = self._raw_reaction_emoji(data)
+        raw = RawReactionClearEmojiEvent(data, emoji)
+        self.dispatch("raw_reaction_clear_emoji", raw)
+
+    def raw_parse_message_poll_vote_add(self, data) -> None:
+        self.dispatch("raw_poll_vote_add", RawMessagePollVoteEvent(data, True))
+
+    def raw_parse_message_poll_vote_remove(self, data) -> None:
+        self.dispatch("raw_poll_vote_remove", RawMessagePollVoteEvent(data, False))
+
+    def raw_parse_thread_update(self, data) -> None:
+        self.dispatch("raw_thread_update", RawThreadUpdateEvent(data))
+
+    def raw_parse_thread_delete(self, data) -> None:
+        raw = RawThreadDeleteEvent(data)
+        guild = self._get_guild(raw.guild_id)
+        if guild is not None:
+            raw.thread = guild.get_thread(raw.thread_id)
+            guild._remove_thread(Object(id=raw.thread_id))
+        self.dispatch("raw_thread_delete", raw)
+
+    def raw_parse_guild_member_remove(self, data) -> None:
+        user = self.create_user(data["user"])
+        guild = self._get_guild(int(data["guild_id"]))
+        if guild is not None:
+            if guild._member_count is not None:
+                guild._member_count -= 1
+            guild._remove_member(user)
+        self.dispatch("raw_member_remove", RawMemberRemoveEvent(data, user))
+
+    def raw_parse_integration_delete(self, data) -> None:
+        self.dispatch("raw_integration_delete", RawIntegrationDeleteEvent(data))
+
+    def raw_parse_voice_channel_status_update(self, data) -> None:
+        raw = RawVoiceChannelStatusUpdateEvent(data)
+        self.dispatch("raw_voice_channel_status_update", raw)
+
+    def raw_parse_typing_start(self, data) -> None:
+        self.dispatch("raw_typing", RawTypingEvent(data))
+
     def _get_typing_user(
         self, channel: MessageableChannel | None, user_id: int
     ) -> User | Member | None:
@@ -2052,9 +2462,7 @@ class AutoShardedConnectionState(ConnectionState):
     async def _delay_ready(self) -> None:
         await self.shards_launched.wait()
         processed = []
-        max_concurrency = len(self.shard_ids) * 2
-        current_bucket = []
-        while True:
+        while self._ready_pending or not self._ready_state.empty():
             # this snippet of code is basically waiting N seconds
             # until the last GUILD_CREATE was sent
             try:
@@ -2072,23 +2480,9 @@ class AutoShardedConnectionState(ConnectionState):
                         ),
                         guild.id,
                     )
-                    if len(current_bucket) >= max_concurrency:
-                        try:
-                            await utils.sane_wait_for(
-                                current_bucket, timeout=max_concurrency * 70.0
-                            )
-                        except asyncio.TimeoutError:
-                            fmt = (
-                                "Shard ID %s failed to wait for chunks from a"
-                                " sub-bucket with length %d"
-                            )
-                            _log.warning(fmt, guild.shard_id, len(current_bucket))
-                        finally:
-                            current_bucket = []
-
-                    # Chunk the guild in the background while we wait for GUILD_CREATE streaming
-                    future = asyncio.ensure_future(self.chunk_guild(guild))
-                    current_bucket.append(future)
+                    # Chunk the guild in the background while we wait for GUILD_CREATE streaming,
+                    # the scheduler paces the requests of each shard
+                    future = await self.chunk_guild(guild, wait=False)
                 else:
                     future = self.loop.create_future()
                     future.set_result([])
@@ -2159,6 +2553,7 @@ class AutoShardedConnectionState(ConnectionState):
 
         for guild_data in data["guilds"]:
             self._add_guild_from_data(guild_data)
+            self._ready_pending.add(int(guild_data["id"]))
 
         if self._messages:
             self._update_message_references()
@@ -68,6 +68,14 @@ class _PartialTemplateState:
     def member_cache_flags(self):
         return self.__state.member_cache_flags
 
+    @property
+    def compact_member_cache(self):
+        return False
+
+    @property
+    def lazy_guilds(self):
+        return False
+
     def store_emoji(self, guild, packet):
         return None
 
@@ -10,6 +10,7 @@ UI Kit helper for the Discord API
 
 from .button import *
 from .container import *
+from .dynamic import *
 from .file import *
 from .input_text import *
 from .item import *
@@ -0,0 +1,345 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Coroutine
+
+if TYPE_CHECKING:
+    from ..interactions import Interaction
+
+__all__ = (
+    "ComponentState",
+    "ComponentStateStore",
+    "SQLiteComponentStateStore",
+)
+
+_log = logging.getLogger(__name__)
+
+DynamicHandler = Callable[
+    ["Interaction", "re.Match[str] | None", "ComponentState"], Coroutine[Any, Any, Any]
+]
+
+
+class ComponentStateStore:
+    """Stores the state of components handled by dynamic handlers outside of memory.
+
+    Registering a dynamic handler with :meth:`Client.add_dynamic_handler`
+    lets components be handled without keeping a :class:`View` around for
+    every message. Whatever those messages need to remember, such as the page
+    of a paginator, can be kept in a store and is only loaded when one of
+    their components is used.
+
+    Subclass this and implement :meth:`get`, :meth:`set` and :meth:`delete`
+    to keep the state elsewhere, such as in a database.
+
+    .. versionadded:: 2.7
+    """
+
+    async def get(self, key: str) -> Any | None:
+        """|coro|
+
+        Returns the state stored under a key, or ``None`` if there is none.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The key of the state, by default the ID of the message.
+        """
+        raise NotImplementedError
+
+    async def set(self, key: str, value: Any) -> None:
+        """|coro|
+
+        Stores state under a key, replacing any existing state.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The key of the state, by default the ID of the message.
+        value: Any
+            The state to store. It must be serialisable to JSON.
+        """
+        raise NotImplementedError
+
+    async def delete(self, key: str) -> None:
+        """|coro|
+
+        Removes the state stored under a key, if any.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The key of the state, by default the ID of the message.
+        """
+        raise NotImplementedError
+
+
+class SQLiteComponentStateStore(ComponentStateStore):
+    """A :class:`ComponentStateStore` that keeps its state in an SQLite database.
+
+    State is stored as JSON. Queries run in the default executor, so they
+    don't block the event loop.
+
+    .. versionadded:: 2.7
+
+    Parameters
+    ----------
+    path: Union[:class:`str`, :class:`os.PathLike`]
+        The path of the database file. It is created if it does not exist.
+    table: :class:`str`
+        The name of the table to keep the state in. Defaults to ``component_state``.
+    """
+
+    def __init__(
+        self, path: str | os.PathLike[str], *, table: str = "component_state"
+    ) -> None:
+        if not table.isidentifier():
+            raise ValueError("table must be a valid identifier")
+
+        self.path: str = os.fspath(path)
+        self.table: str = table
+        self._connection: sqlite3.Connection | None = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table}"
+                " (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def _execute(self, query: str, *params: Any) -> list[tuple[Any, ...]]:
+        with self._lock:
+            connection = self._connect()
+            rows = connection.execute(query, params).fetchall()
+            connection.commit()
+            return rows
+
+    async def _run(self, query: str, *params: Any) -> list[tuple[Any, ...]]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._execute, query, *params)
+
+    async def get(self, key: str) -> Any | None:
+        rows = await self._run(f"SELECT value FROM {self.table} WHERE key = ?", key)
+        if not rows:
+            return None
+        return json.loads(rows[0][0])
+
+    async def set(self, key: str, value: Any) -> None:
+        await self._run(
+            f"INSERT OR REPLACE INTO {self.table} (key, value) VALUES (?, ?)",
+            key,
+            json.dumps(value, separators=(",", ":")),
+        )
+
+    async def delete(self, key: str) -> None:
+        await self._run(f"DELETE FROM {self.table} WHERE key = ?", key)
+
+    def close(self) -> None:
+        """Closes the connection to the database."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class ComponentState:
+    """The stored state of a component being handled by a dynamic handler.
+
+    Nothing is loaded from the :class:`ComponentStateStore` until :meth:`load`
+    is called, so handlers that don't need the state don't pay for it.
+
+    .. versionadded:: 2.7
+
+    Attributes
+    ----------
+    key: Optional[:class:`str`]
+        The key of the state, the ID of the message the component is attached to.
+        ``None`` if the component isn't attached to a message.
+    store: Optional[:class:`ComponentStateStore`]
+        The store the state is kept in, or ``None`` if the client has none.
+    """
+
+    __slots__ = ("key", "store", "_value", "_loaded")
+
+    def __init__(self, key: str | None, store: ComponentStateStore | None) -> None:
+        self.key: str | None = key
+        self.store: ComponentStateStore | None = store
+        self._value: Any | None = None
+        self._loaded: bool = False
+
+    def __repr__(self) -> str:
+        return f"<ComponentState key={self.key!r} loaded={self._loaded}>"
+
+    def _check(self) -> tuple[str, ComponentStateStore]:
+        if self.store is None:
+            raise RuntimeError("No component_state_store was passed to the client")
+        if self.key is None:
+            raise RuntimeError("The component isn't attached to a message")
+        return self.key, self.store
+
+    async def load(self) -> Any | None:
+        """|coro|
+
+        Loads the state from the store, or returns the already loaded state.
+
+        Raises
+        ------
+        RuntimeError
+            The client has no :class:`ComponentStateStore`, or the component
+            isn't attached to a message.
+        """
+        if not self._loaded:
+            key, store = self._check()
+            self._value = await store.get(key)
+            self._loaded = True
+        return self._value
+
+    async def save(self, value: Any) -> None:
+        """|coro|
+
+        Replaces the stored state.
+
+        Raises
+        ------
+        RuntimeError
+            The client has no :class:`ComponentStateStore`, or the component
+            isn't attached to a message.
+        """
+        key, store = self._check()
+        await store.set(key, value)
+        self._value = value
+        self._loaded = True
+
+    async def delete(self) -> None:
+        """|coro|
+
+        Removes the stored state.
+
+        Raises
+        ------
+        RuntimeError
+            The client has no :class:`ComponentStateStore`, or the component
+            isn't attached to a message.
+        """
+        key, store = self._check()
+        await store.delete(key)
+        self._value = None
+        self._loaded = True
+
+
+class _DynamicRoute:
+    __slots__ = ("prefix", "pattern", "handler", "component_type")
+
+    def __init__(
+        self,
+        prefix: str,
+        pattern: re.Pattern[str] | None,
+        handler: DynamicHandler,
+        component_type: int | None,
+    ) -> None:
+        self.prefix: str = prefix
+        self.pattern: re.Pattern[str] | None = pattern
+        self.handler: DynamicHandler = handler
+        self.component_type: int | None = component_type
+
+
+class _DynamicRouter:
+    # custom_id prefix: routes, checked in the order they were added
+    def __init__(self) -> None:
+        self._routes: dict[str, list[_DynamicRoute]] = {}
+        # the distinct prefix lengths, longest first, so the most specific prefix wins
+        self._lengths: list[int] = []
+
+    def __bool__(self) -> bool:
+        return bool(self._routes)
+
+    def add(self, route: _DynamicRoute) -> None:
+        self._routes.setdefault(route.prefix, []).append(route)
+        length = len(route.prefix)
+        if length not in self._lengths:
+            self._lengths.append(length)
+            self._lengths.sort(reverse=True)
+
+    def remove(self, prefix: str, handler: DynamicHandler | None = None) -> None:
+        routes = self._routes.get(prefix)
+        if routes is None:
+            return
+
+        routes[:] = [r for r in routes if handler is not None and r.handler != handler]
+        if not routes:
+            del self._routes[prefix]
+            self._lengths = sorted({len(p) for p in self._routes}, reverse=True)
+
+    def find(
+        self, component_type: int, custom_id: str
+    ) -> tuple[_DynamicRoute, re.Match[str] | None] | None:
+        routes = self._routes
+        for length in self._lengths:
+            if length > len(custom_id):
+                continue
+
+            for route in routes.get(custom_id[:length], ()):
+                if (
+                    route.component_type is not None
+                    and route.component_type != component_type
+                ):
+                    continue
+
+                if route.pattern is None:
+                    return route, None
+
+                match = route.pattern.fullmatch(custom_id)
+                if match is not None:
+                    return route, match
+        return None
+
+    async def run(
+        self,
+        route: _DynamicRoute,
+        match: re.Match[str] | None,
+        interaction: Interaction,
+        store: ComponentStateStore | None,
+    ) -> None:
+        message = interaction.message
+        state = ComponentState(message and str(message.id), store)
+        try:
+            await route.handler(interaction, match, state)
+        except Exception:
+            _log.exception(
+                "Ignoring exception in dynamic handler for custom_id prefix %r",
+                route.prefix,
+            )
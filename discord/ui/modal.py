@@ -14,6 +14,7 @@ from .input_text import InputText
 from .item import Item
 from .select import Select
 from .text_display import TextDisplay
+from .view import _TimeoutEntry, _TimeoutScheduler
 
 __all__ = (
     "Modal",
@@ -86,7 +87,8 @@ class Modal:
         self._stopped: asyncio.Future[bool] = loop.create_future()
         self.__cancel_callback: Callable[[Modal], None] | None = None
         self.__timeout_expiry: float | None = None
-        self.__timeout_task: asyncio.Task[None] | None = None
+        self.__timeouts: _TimeoutScheduler | None = None
+        self.__timeout_entry: _TimeoutEntry | None = None
         self.loop = asyncio.get_event_loop()
 
     def __repr__(self) -> str:
@@ -95,32 +97,39 @@ class Modal:
         )
         return f"<{self.__class__.__name__} {attrs}>"
 
-    def _start_listening_from_store(self, store: ModalStore) -> None:
-        self.__cancel_callback = partial(store.remove_modal)
+    def _start_listening_from_store(
+        self, store: ModalStore, user_id: int | None = None
+    ) -> None:
+        self.__cancel_callback = partial(store.remove_modal, user_id=user_id)
         if self.timeout:
-            loop = asyncio.get_running_loop()
-            if self.__timeout_task is not None:
-                self.__timeout_task.cancel()
-
+            self.__cancel_timeout()
+            self.__timeouts = store._timeouts
             self.__timeout_expiry = time.monotonic() + self.timeout
-            self.__timeout_task = loop.create_task(self.__timeout_task_impl())
+            self.__timeout_entry = self.__timeouts.call_at(
+                self.__timeout_expiry, self.__check_timeout
+            )
 
-    async def __timeout_task_impl(self) -> None:
-        while True:
-            # Guard just in case someone changes the value of the timeout at runtime
-            if self.timeout is None:
-                return
+    def __check_timeout(self) -> None:
+        self.__timeout_entry = None
+        # Guard just in case someone changes the value of the timeout at runtime
+        if self.timeout is None:
+            return
+
+        if self.__timeout_expiry is None:
+            return self._dispatch_timeout()
 
-            if self.__timeout_expiry is None:
-                return self._dispatch_timeout()
+        # Check if we've elapsed our currently set timeout
+        if time.monotonic() >= self.__timeout_expiry:
+            return self._dispatch_timeout()
 
-            # Check if we've elapsed our currently set timeout
-            now = time.monotonic()
-            if now >= self.__timeout_expiry:
-                return self._dispatch_timeout()
+        self.__timeout_entry = self.__timeouts.call_at(  # type: ignore
+            self.__timeout_expiry, self.__check_timeout
+        )
 
-            # Wait N seconds to see if timeout data has been refreshed
-            await asyncio.sleep(self.__timeout_expiry - now)
+    def __cancel_timeout(self) -> None:
+        if self.__timeout_entry is not None:
+            self.__timeouts.cancel(self.__timeout_entry)  # type: ignore
+            self.__timeout_entry = None
 
     @property
     def _expires_at(self) -> float | None:
@@ -133,6 +142,9 @@ class Modal:
             return
 
         self._stopped.set_result(True)
+        if self.__cancel_callback:
+            self.__cancel_callback(self)
+            self.__cancel_callback = None
         self.loop.create_task(
             self.on_timeout(), name=f"discord-ui-view-timeout-{self.custom_id}"
         )
@@ -296,9 +308,7 @@ class Modal:
         if not self._stopped.done():
             self._stopped.set_result(True)
         self.__timeout_expiry = None
-        if self.__timeout_task is not None:
-            self.__timeout_task.cancel()
-            self.__timeout_task = None
+        self.__cancel_timeout()
 
     async def wait(self) -> bool:
         """Waits for the modal dialog to be submitted."""
@@ -381,14 +391,18 @@ class ModalStore:
         # (user_id, custom_id) : Modal
         self._modals: dict[tuple[int, str], Modal] = {}
         self._state: ConnectionState = state
+        self._timeouts: _TimeoutScheduler = _TimeoutScheduler()
 
     def add_modal(self, modal: Modal, user_id: int):
         self._modals[(user_id, modal.custom_id)] = modal
-        modal._start_listening_from_store(self)
+        modal._start_listening_from_store(self, user_id)
 
     def remove_modal(self, modal: Modal, user_id):
         modal.stop()
-        self._modals.pop((user_id, modal.custom_id))
+        key = (user_id, modal.custom_id)
+        # the same modal may have been sent to this user again since
+        if self._modals.get(key) is modal:
+            del self._modals[key]
 
     async def dispatch(self, user_id: int, custom_id: str, interaction: Interaction):
         key = (user_id, custom_id)
@@ -26,6 +26,9 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
+import logging
 import os
 import sys
 import time
@@ -61,6 +64,85 @@ if TYPE_CHECKING:
 V = TypeVar("V", bound="View", covariant=True)
 
 
+_log = logging.getLogger(__name__)
+
+
+class _TimeoutEntry:
+    __slots__ = ("when", "callback", "cancelled")
+
+    def __init__(self, when: float, callback: Callable[[], Any]) -> None:
+        self.when: float = when
+        self.callback: Callable[[], Any] = callback
+        self.cancelled: bool = False
+
+
+class _TimeoutScheduler:
+    """Runs the timeouts of every view or modal of a store from a single timer.
+
+    Deadlines are :func:`time.monotonic` values kept in a heap, and everything
+    that is due when the timer fires is expired in one go. Cancelled entries
+    are skipped when they come up, or dropped in bulk once they make up most
+    of the heap.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[float, int, _TimeoutEntry]] = []
+        self._counter: Iterator[int] = itertools.count()
+        self._cancelled: int = 0
+        self._handle: asyncio.TimerHandle | None = None
+        self._next: float | None = None
+
+    def __len__(self) -> int:
+        return len(self._heap) - self._cancelled
+
+    def call_at(self, when: float, callback: Callable[[], Any]) -> _TimeoutEntry:
+        entry = _TimeoutEntry(when, callback)
+        heapq.heappush(self._heap, (when, next(self._counter), entry))
+        if self._next is None or when < self._next:
+            self._arm(when)
+        return entry
+
+    def cancel(self, entry: _TimeoutEntry) -> None:
+        if entry.cancelled:
+            return
+
+        entry.cancelled = True
+        entry.callback = None  # type: ignore
+        self._cancelled += 1
+        if self._cancelled > 64 and self._cancelled * 2 > len(self._heap):
+            self._heap = [item for item in self._heap if not item[2].cancelled]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+
+    def _arm(self, when: float) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+        loop = asyncio.get_running_loop()
+        self._next = when
+        self._handle = loop.call_later(max(0.0, when - time.monotonic()), self._run)
+
+    def _run(self) -> None:
+        self._handle = self._next = None
+        heap = self._heap
+        now = time.monotonic()
+        while heap and heap[0][0] <= now:
+            _, _, entry = heapq.heappop(heap)
+            if entry.cancelled:
+                self._cancelled -= 1
+                continue
+
+            entry.cancelled = True
+            try:
+                entry.callback()
+            except Exception:
+                _log.exception(
+                    "Ignoring exception in timeout callback %r", entry.callback
+                )
+
+        if heap:
+            self._arm(heap[0][0])
+
+
 def _walk_all_components(components: list[Component]) -> Iterator[Component]:
     for item in components:
         if isinstance(item, ActionRowComponent):
@@ -262,7 +344,8 @@ class View:
         self.id: str = os.urandom(16).hex()
         self.__cancel_callback: Callable[[View], None] | None = None
         self.__timeout_expiry: float | None = None
-        self.__timeout_task: asyncio.Task[None] | None = None
+        self.__timeouts: _TimeoutScheduler | None = None
+        self.__timeout_entry: _TimeoutEntry | None = None
         self.__stopped: asyncio.Future[bool] = loop.create_future()
         self._message: Message | InteractionMessage | None = None
         self.parent: Interaction | None = None
@@ -270,22 +353,28 @@ class View:
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} timeout={self.timeout} children={len(self.children)}>"
 
-    async def __timeout_task_impl(self) -> None:
-        while True:
-            # Guard just in case someone changes the value of the timeout at runtime
-            if self.timeout is None:
-                return
+    def __check_timeout(self) -> None:
+        self.__timeout_entry = None
+        # Guard just in case someone changes the value of the timeout at runtime
+        if self.timeout is None:
+            return
+
+        if self.__timeout_expiry is None:
+            return self._dispatch_timeout()
 
-            if self.__timeout_expiry is None:
-                return self._dispatch_timeout()
+        # Check if we've elapsed our currently set timeout
+        if time.monotonic() >= self.__timeout_expiry:
+            return self._dispatch_timeout()
 
-            # Check if we've elapsed our currently set timeout
-            now = time.monotonic()
-            if now >= self.__timeout_expiry:
-                return self._dispatch_timeout()
+        # The timeout was refreshed by an interaction, check again once it elapses
+        self.__timeout_entry = self.__timeouts.call_at(  # type: ignore
+            self.__timeout_expiry, self.__check_timeout
+        )
 
-            # Wait N seconds to see if timeout data has been refreshed
-            await asyncio.sleep(self.__timeout_expiry - now)
+    def __cancel_timeout(self) -> None:
+        if self.__timeout_entry is not None:
+            self.__timeouts.cancel(self.__timeout_entry)  # type: ignore
+            self.__timeout_entry = None
 
     def to_components(self) -> list[dict[str, Any]]:
         def key(item: Item[V]) -> int:
@@ -560,18 +649,21 @@ class View:
     def _start_listening_from_store(self, store: ViewStore) -> None:
         self.__cancel_callback = partial(store.remove_view)
         if self.timeout:
-            loop = asyncio.get_running_loop()
-            if self.__timeout_task is not None:
-                self.__timeout_task.cancel()
-
+            self.__cancel_timeout()
+            self.__timeouts = store._timeouts
             self.__timeout_expiry = time.monotonic() + self.timeout
-            self.__timeout_task = loop.create_task(self.__timeout_task_impl())
+            self.__timeout_entry = self.__timeouts.call_at(
+                self.__timeout_expiry, self.__check_timeout
+            )
 
     def _dispatch_timeout(self):
         if self.__stopped.done():
             return
 
         self.__stopped.set_result(True)
+        if self.__cancel_callback:
+            self.__cancel_callback(self)
+            self.__cancel_callback = None
         asyncio.create_task(
             self.on_timeout(), name=f"discord-ui-view-timeout-{self.id}"
         )
@@ -619,9 +711,7 @@ class View:
             self.__stopped.set_result(False)
 
         self.__timeout_expiry = None
-        if self.__timeout_task is not None:
-            self.__timeout_task.cancel()
-            self.__timeout_task = None
+        self.__cancel_timeout()
 
         if self.__cancel_callback:
             self.__cancel_callback(self)
@@ -734,9 +824,13 @@ class ViewStore:
     def __init__(self, state: ConnectionState):
         # (component_type, message_id, custom_id): (View, Item)
         self._views: dict[tuple[int, int | None, str], tuple[View, Item[V]]] = {}
+        # view.id: keys of that view in _views and _synced_message_views
+        self._view_keys: dict[str, list[tuple[int, int | None, str]]] = {}
+        self._view_messages: dict[str, list[int]] = {}
         # message_id: View
         self._synced_message_views: dict[int, View] = {}
         self._state: ConnectionState = state
+        self._timeouts: _TimeoutScheduler = _TimeoutScheduler()
 
     @property
     def persistent_views(self) -> Sequence[View]:
@@ -747,38 +841,34 @@ class ViewStore:
         }
         return list(views.values())
 
-    def __verify_integrity(self):
-        to_remove: list[tuple[int, int | None, str]] = []
-        for k, (view, _) in self._views.items():
-            if view.is_finished():
-                to_remove.append(k)
-
-        for k in to_remove:
-            del self._views[k]
-
     def add_view(self, view: View, message_id: int | None = None):
-        self.__verify_integrity()
+        if view.is_finished():
+            return
 
         view._start_listening_from_store(self)
+        keys = self._view_keys.setdefault(view.id, [])
         for item in view.walk_children():
             if item.is_storable():
-                self._views[(item.type.value, message_id, item.custom_id)] = (view, item)  # type: ignore
+                key = (item.type.value, message_id, item.custom_id)
+                self._views[key] = (view, item)  # type: ignore
+                keys.append(key)  # type: ignore
 
         if message_id is not None:
             self._synced_message_views[message_id] = view
+            self._view_messages.setdefault(view.id, []).append(message_id)
 
     def remove_view(self, view: View):
-        for item in view.walk_children():
-            if item.is_storable():
-                self._views.pop((item.type.value, item.custom_id), None)  # type: ignore
+        for key in self._view_keys.pop(view.id, ()):
+            value = self._views.get(key)
+            # the key may have been taken over by another view since
+            if value is not None and value[0] is view:
+                del self._views[key]
 
-        for key, value in self._synced_message_views.items():
-            if value.id == view.id:
-                del self._synced_message_views[key]
-                break
+        for message_id in self._view_messages.pop(view.id, ()):
+            if self._synced_message_views.get(message_id) is view:
+                del self._synced_message_views[message_id]
 
     def dispatch(self, component_type: int, custom_id: str, interaction: Interaction):
-        self.__verify_integrity()
         message_id: int | None = interaction.message and interaction.message.id
         key = (component_type, message_id, custom_id)
         # Fallback to None message_id searches in case a persistent view
@@ -787,6 +877,7 @@ class ViewStore:
             (component_type, None, custom_id)
         )
         if value is None:
+            self._dispatch_dynamic(component_type, custom_id, interaction)
             return
 
         view, item = value
@@ -794,6 +885,23 @@ class ViewStore:
         item.refresh_state(interaction)
         view._dispatch_item(item, interaction)
 
+    def _dispatch_dynamic(
+        self, component_type: int, custom_id: str, interaction: Interaction
+    ):
+        router = self._state._dynamic_router
+        if not router:
+            return
+
+        found = router.find(component_type, custom_id)
+        if found is None:
+            return
+
+        route, match = found
+        asyncio.create_task(
+            router.run(route, match, interaction, self._state.component_state_store),
+            name=f"discord-ui-dynamic-dispatch-{route.prefix}",
+        )
+
     def is_message_tracked(self, message_id: int):
         return message_id in self._synced_message_views
 
@@ -42,7 +42,6 @@ from __future__ import annotations
 import asyncio
 import datetime
 import logging
-import select
 import socket
 import struct
 import threading
@@ -53,11 +52,14 @@ from . import opus, utils
 from .backoff import ExponentialBackoff
 from .errors import ClientException, ConnectionClosed
 from .gateway import *
-from .player import AudioPlayer, AudioSource
+from .player import AudioPlayer, AudioScheduler, AudioSource
 from .sinks import RawData, RecordingException, Sink
 from .utils import MISSING
+from .voice_metrics import VoiceMetrics
 
 if TYPE_CHECKING:
+    import concurrent.futures
+
     from . import abc
     from .client import Client
     from .guild import Guild
@@ -87,6 +89,18 @@ __all__ = (
 _log = logging.getLogger(__name__)
 
 
+class _VoiceReceiveProtocol(asyncio.DatagramProtocol):
+    def __init__(self, client: VoiceClient):
+        self.client: VoiceClient = client
+
+    def datagram_received(self, data: bytes, addr: Any) -> None:
+        self.client._receive_packet(data)
+
+    def error_received(self, exc: Exception) -> None:
+        self.client.metrics.increment("socket_errors")
+        _log.warning("Voice receive socket error: %s", exc)
+
+
 class VoiceProtocol:
     """A class that represents the Discord voice protocol.
 
@@ -215,6 +229,11 @@ class VoiceClient(VoiceProtocol):
         The voice channel connected to.
     loop: :class:`asyncio.AbstractEventLoop`
         The event loop that the voice client is running on.
+    metrics: :class:`VoiceMetrics`
+        Packet counters and timings of this connection, including those of
+        everything played through it.
+
+        .. versionadded:: 2.7
 
     Warning
     -------
@@ -256,8 +275,13 @@ class VoiceClient(VoiceProtocol):
         self._player: AudioPlayer | None = None
         self.encoder: Encoder = MISSING
         self.decoder = None
+        self._receiver: asyncio.DatagramTransport | None = None
         self._lite_nonce: int = 0
+        self._box: nacl.secret.SecretBox | nacl.secret.Aead | None = None
+        self._encrypt: Callable[[bytes, bytes], bytes] = MISSING
+        self._decrypt: Callable[[memoryview, memoryview], bytes] = MISSING
         self.ws: DiscordVoiceWebSocket = MISSING
+        self.metrics: VoiceMetrics = VoiceMetrics()
 
         self.paused = False
         self.recording = False
@@ -372,6 +396,9 @@ class VoiceClient(VoiceProtocol):
         while ws.secret_key is None:
             await ws.poll_event()
         self._connected.set()
+        if self.recording:
+            # the socket is recreated when reconnecting
+            await self._start_receiving()
         return ws
 
     async def connect(self, *, reconnect: bool, timeout: float) -> None:
@@ -542,6 +569,9 @@ class VoiceClient(VoiceProtocol):
             await self.voice_disconnect()
         finally:
             self.cleanup()
+            if self.recording:
+                self.stop_recording()
+            self._stop_receiving()
             if self.socket:
                 self.socket.close()
 
@@ -573,86 +603,82 @@ class VoiceClient(VoiceProtocol):
         struct.pack_into(">I", header, 4, self.timestamp)
         struct.pack_into(">I", header, 8, self.ssrc)
 
-        encrypt_packet = getattr(self, f"_encrypt_{self.mode}")
-        return encrypt_packet(header, data)
+        return self._encrypt(header, data)
+
+    def _bind_crypto(self) -> None:
+        # called once the mode and secret key of a connection are known,
+        # so that sending and receiving don't look them up for every packet
+        key = bytes(self.secret_key)
+        if self.mode.startswith("aead_"):
+            self._box = nacl.secret.Aead(key)
+        else:
+            self._box = nacl.secret.SecretBox(key)
+        self._encrypt = getattr(self, f"_encrypt_{self.mode}")
+        self._decrypt = getattr(self, f"_decrypt_{self.mode}")
 
     def _encrypt_xsalsa20_poly1305(self, header: bytes, data) -> bytes:
         # Deprecated, remove in 2.7
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
-        nonce = bytearray(24)
-        nonce[:12] = header
+        nonce = bytes(header).ljust(24, b"\x00")
 
-        return header + box.encrypt(bytes(data), bytes(nonce)).ciphertext
+        return header + self._box.encrypt(bytes(data), nonce).ciphertext
 
     def _encrypt_xsalsa20_poly1305_suffix(self, header: bytes, data) -> bytes:
         # Deprecated, remove in 2.7
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
         nonce = nacl.utils.random(nacl.secret.SecretBox.NONCE_SIZE)
 
-        return header + box.encrypt(bytes(data), nonce).ciphertext + nonce
+        return header + self._box.encrypt(bytes(data), nonce).ciphertext + nonce
 
     def _encrypt_xsalsa20_poly1305_lite(self, header: bytes, data) -> bytes:
         # Deprecated, remove in 2.7
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
-        nonce = bytearray(24)
-
-        nonce[:4] = struct.pack(">I", self._lite_nonce)
+        nonce = struct.pack(">I", self._lite_nonce)
         self.checked_add("_lite_nonce", 1, 4294967295)
 
-        return header + box.encrypt(bytes(data), bytes(nonce)).ciphertext + nonce[:4]
+        return (
+            header
+            + self._box.encrypt(bytes(data), nonce.ljust(24, b"\x00")).ciphertext
+            + nonce
+        )
 
     def _encrypt_aead_xchacha20_poly1305_rtpsize(self, header: bytes, data) -> bytes:
         # Required as of Nov 18 2024
-        box = nacl.secret.Aead(bytes(self.secret_key))
-        nonce = bytearray(24)
-
-        nonce[:4] = struct.pack(">I", self._lite_nonce)
+        nonce = struct.pack(">I", self._lite_nonce)
         self.checked_add("_lite_nonce", 1, 4294967295)
 
         return (
             header
-            + box.encrypt(bytes(data), bytes(header), bytes(nonce)).ciphertext
-            + nonce[:4]
+            + self._box.encrypt(
+                bytes(data), bytes(header), nonce.ljust(24, b"\x00")
+            ).ciphertext
+            + nonce
         )
 
     def _decrypt_xsalsa20_poly1305(self, header, data):
         # Deprecated, remove in 2.7
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
+        nonce = bytes(header).ljust(24, b"\x00")
 
-        nonce = bytearray(24)
-        nonce[:12] = header
-
-        return self.strip_header_ext(box.decrypt(bytes(data), bytes(nonce)))
+        return self.strip_header_ext(self._box.decrypt(bytes(data), nonce))
 
     def _decrypt_xsalsa20_poly1305_suffix(self, header, data):
         # Deprecated, remove in 2.7
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
-
         nonce_size = nacl.secret.SecretBox.NONCE_SIZE
-        nonce = data[-nonce_size:]
+        nonce = bytes(data[-nonce_size:])
 
-        return self.strip_header_ext(box.decrypt(bytes(data[:-nonce_size]), nonce))
+        return self.strip_header_ext(
+            self._box.decrypt(bytes(data[:-nonce_size]), nonce)
+        )
 
     def _decrypt_xsalsa20_poly1305_lite(self, header, data):
         # Deprecated, remove in 2.7
-        box = nacl.secret.SecretBox(bytes(self.secret_key))
+        nonce = bytes(data[-4:]).ljust(24, b"\x00")
 
-        nonce = bytearray(24)
-        nonce[:4] = data[-4:]
-        data = data[:-4]
-
-        return self.strip_header_ext(box.decrypt(bytes(data), bytes(nonce)))
+        return self.strip_header_ext(self._box.decrypt(bytes(data[:-4]), nonce))
 
     def _decrypt_aead_xchacha20_poly1305_rtpsize(self, header, data):
         # Required as of Nov 18 2024
-        box = nacl.secret.Aead(bytes(self.secret_key))
-
-        nonce = bytearray(24)
-        nonce[:4] = data[-4:]
-        data = data[:-4]
+        nonce = bytes(data[-4:]).ljust(24, b"\x00")
 
         return self.strip_header_ext(
-            box.decrypt(bytes(data), bytes(header), bytes(nonce))
+            self._box.decrypt(bytes(data[:-4]), bytes(header), nonce)
         )
 
     @staticmethod
@@ -675,6 +701,7 @@ class VoiceClient(VoiceProtocol):
         *,
         after: Callable[[Exception | None], Any] | None = None,
         wait_finish: Literal[False] = False,
+        scheduler: AudioScheduler | None = None,
     ) -> None: ...
 
     @overload
@@ -684,6 +711,7 @@ class VoiceClient(VoiceProtocol):
         *,
         after: Callable[[Exception | None], Any] | None = None,
         wait_finish: Literal[True],
+        scheduler: AudioScheduler | None = None,
     ) -> asyncio.Future: ...
 
     def play(
@@ -692,6 +720,7 @@ class VoiceClient(VoiceProtocol):
         *,
         after: Callable[[Exception | None], Any] | None = None,
         wait_finish: bool = False,
+        scheduler: AudioScheduler | None = None,
     ) -> None | asyncio.Future:
         """Plays an :class:`AudioSource`.
 
@@ -718,6 +747,11 @@ class VoiceClient(VoiceProtocol):
             If False, None is returned and the function does not block.
 
             .. versionadded:: v2.5
+        scheduler: Optional[:class:`AudioScheduler`]
+            The scheduler to send the audio from. If not given, a dedicated
+            thread is started for this voice client.
+
+            .. versionadded:: 2.7
 
         Raises
         ------
@@ -756,7 +790,7 @@ class VoiceClient(VoiceProtocol):
 
             after = _after
 
-        self._player = AudioPlayer(source, self, after=after)
+        self._player = AudioPlayer(source, self, after=after, scheduler=scheduler)
         self._player.start()
         return future
 
@@ -790,7 +824,26 @@ class VoiceClient(VoiceProtocol):
 
         self.decoder.decode(data)
 
-    def start_recording(self, sink, callback, *args, sync_start: bool = False):
+    def _receive_packet(self, data: bytes) -> None:
+        # runs on the event loop, so decryption is left to the decode thread
+        if len(data) < 12 or data[1] != 0x78 or self.paused or not self.recording:
+            return
+        metrics = self.metrics
+        metrics.increment("packets_received")
+        metrics.increment("bytes_received", len(data))
+        if not self.decoder.feed(data, time.perf_counter()):
+            metrics.increment("receive_dropped")
+
+    def start_recording(
+        self,
+        sink,
+        callback,
+        *args,
+        sync_start: bool = False,
+        max_queue: int = 1024,
+        jitter_buffer: int = 3,
+        decode_workers: int = 1,
+    ):
         """The bot will begin recording audio from the current voice channel it is in.
         This function uses a thread so the current code line will not be stopped.
         Must be in a voice channel to use.
@@ -809,6 +862,23 @@ class VoiceClient(VoiceProtocol):
         sync_start: :class:`bool`
             If True, the recordings of subsequent users will start with silence.
             This is useful for recording audio just as it was heard.
+        max_queue: :class:`int`
+            The maximum number of received packets waiting to be decoded. Packets
+            received while the queue is full are dropped. Defaults to 1024.
+
+            .. versionadded:: 2.7
+        jitter_buffer: :class:`int`
+            The number of packets held per speaker to put out of order packets
+            back in order before they are decoded. Defaults to 3.
+
+            .. versionadded:: 2.7
+        decode_workers: :class:`int`
+            The number of threads decoding audio. Each speaker is always decoded
+            by the same thread. Increase this when recording many speakers at once
+            and :meth:`opus.DecodeManager.stats` shows packets waiting for long.
+            Defaults to 1.
+
+            .. versionadded:: 2.7
 
         Raises
         ------
@@ -828,22 +898,36 @@ class VoiceClient(VoiceProtocol):
 
         self.empty_socket()
 
-        self.decoder = opus.DecodeManager(self)
+        self._decoded_lock = threading.Lock()
+        self.decoder = opus.DecodeManager(
+            self,
+            max_queue=max_queue,
+            jitter_buffer=jitter_buffer,
+            workers=decode_workers,
+        )
         self.decoder.start()
         self.recording = True
         self.sync_start = sync_start
         self.sink = sink
+        self._recording_callback = (callback, args)
+        self.user_timestamps: dict[int, tuple[int, float]] = {}
+        self.starting_time = time.perf_counter()
+        self.first_packet_timestamp: float
         sink.init(self)
 
-        t = threading.Thread(
-            target=self.recv_audio,
-            args=(
-                sink,
-                callback,
-                *args,
-            ),
+        future = asyncio.run_coroutine_threadsafe(self._start_receiving(), self.loop)
+        future.add_done_callback(self._receiving_started)
+
+    def _receiving_started(self, future: concurrent.futures.Future[None]) -> None:
+        if future.cancelled() or future.exception() is None:
+            return
+
+        _log.error(
+            "Failed to start receiving voice packets, stopping the recording.",
+            exc_info=future.exception(),
         )
-        t.start()
+        if self.recording:
+            self.stop_recording()
 
     def stop_recording(self):
         """Stops the recording.
@@ -858,9 +942,12 @@ class VoiceClient(VoiceProtocol):
         """
         if not self.recording:
             raise RecordingException("Not currently recording audio.")
-        self.decoder.stop()
         self.recording = False
         self.paused = False
+        self.stopping_time = time.perf_counter()
+        self.loop.call_soon_threadsafe(self._stop_receiving)
+        # the decoder finishes the packets it already has and then calls the callback
+        self.decoder.stop()
 
     def toggle_pause(self):
         """Pauses or unpauses the recording.
@@ -879,44 +966,56 @@ class VoiceClient(VoiceProtocol):
 
     def empty_socket(self):
         while True:
-            ready, _, _ = select.select([self.socket], [], [], 0.0)
-            if not ready:
+            try:
+                self.socket.recv(4096)
+            except OSError:
                 break
-            for s in ready:
-                s.recv(4096)
 
-    def recv_audio(self, sink, callback, *args):
-        # Gets data from _recv_audio and sorts
-        # it by user, handles pcm files and
-        # silence that should be added.
-
-        self.user_timestamps: dict[int, tuple[int, float]] = {}
-        self.starting_time = time.perf_counter()
-        self.first_packet_timestamp: float
-        while self.recording:
-            ready, _, err = select.select([self.socket], [], [self.socket], 0.01)
-            if not ready:
-                if err:
-                    print(f"Socket error: {err}")
-                continue
+    async def _start_receiving(self) -> None:
+        self._stop_receiving()
+        if not self.recording:
+            return
 
-            try:
-                data = self.socket.recv(4096)
-            except OSError:
-                self.stop_recording()
-                continue
+        # the transport closes its socket when it's done,
+        # so give it a duplicate of the one used for sending
+        self._receiver, _ = await self.loop.create_datagram_endpoint(
+            lambda: _VoiceReceiveProtocol(self), sock=self.socket.dup()
+        )
 
-            self.unpack_audio(data)
+    def _stop_receiving(self) -> None:
+        if self._receiver is not None:
+            self._receiver.close()
+            self._receiver = None
 
-        self.stopping_time = time.perf_counter()
+    def _recording_finished(self) -> None:
+        # called from the decode thread once every packet has been written
         self.sink.cleanup()
-        callback = asyncio.run_coroutine_threadsafe(callback(sink, *args), self.loop)
-        result = callback.result()
+        callback, args = self._recording_callback
+        future = asyncio.run_coroutine_threadsafe(callback(self.sink, *args), self.loop)
+        result = future.result()
 
         if result is not None:
             print(result)
 
     def recv_decoded_audio(self, data: RawData):
+        # decode workers call this concurrently, one worker per SSRC, so waiting
+        # for an unknown speaker only holds up the worker it is assigned to
+        while data.ssrc not in self.ws.ssrc_map:
+            time.sleep(0.05)
+        user_id = self.ws.ssrc_map[data.ssrc]["user_id"]
+
+        with self._decoded_lock:
+            silence = self._silence_before(data)
+
+        data.decoded_data = (
+            struct.pack("<h", 0) * max(0, int(silence)) * opus._OpusStruct.CHANNELS
+            + data.decoded_data
+        )
+
+        with self._decoded_lock:
+            self.sink.write(data.decoded_data, user_id)
+
+    def _silence_before(self, data: RawData) -> float:
         # Add silence when they were not being recorded.
         if data.ssrc not in self.user_timestamps:  # First packet from user
             if (
@@ -944,15 +1043,27 @@ class VoiceClient(VoiceProtocol):
                 silence = dT - 960
 
         self.user_timestamps.update({data.ssrc: (data.timestamp, data.receive_time)})
+        return silence
 
-        data.decoded_data = (
-            struct.pack("<h", 0) * max(0, int(silence)) * opus._OpusStruct.CHANNELS
-            + data.decoded_data
-        )
+    @property
+    def late_frames(self) -> int:
+        """The number of frames of the current audio source that were sent more
+        than one frame late.
 
-        while data.ssrc not in self.ws.ssrc_map:
-            time.sleep(0.05)
-        self.sink.write(data.decoded_data, self.ws.ssrc_map[data.ssrc]["user_id"])
+        .. versionadded:: 2.7
+        """
+        return self._player.late_frames if self._player else 0
+
+    @property
+    def playback_metrics(self) -> VoiceMetrics | None:
+        """The metrics of the audio source currently being played, if playing.
+
+        These only count what was recorded since the source started playing,
+        while :attr:`metrics` holds the totals of the connection.
+
+        .. versionadded:: 2.7
+        """
+        return self._player.metrics if self._player else None
 
     def is_playing(self) -> bool:
         """Indicates if we're currently playing audio."""
@@ -1016,22 +1127,32 @@ class VoiceClient(VoiceProtocol):
             Encoding the data failed.
         """
 
+        metrics = self.metrics
         self.checked_add("sequence", 1, 65535)
         if encode:
             if not self.encoder:
                 self.encoder = opus.Encoder()
+            start = time.perf_counter()
             encoded_data = self.encoder.encode(data, self.encoder.SAMPLES_PER_FRAME)
+            metrics.observe("encode_time", time.perf_counter() - start)
         else:
             encoded_data = data
         packet = self._get_voice_packet(encoded_data)
         try:
             self.socket.sendto(packet, (self.endpoint_ip, self.voice_port))
         except BlockingIOError:
+            metrics.increment("packets_dropped")
             _log.warning(
                 "A packet has been dropped (seq: %s, timestamp: %s)",
                 self.sequence,
                 self.timestamp,
             )
+        except OSError:
+            metrics.increment("socket_errors")
+            raise
+        else:
+            metrics.increment("packets_sent")
+            metrics.increment("bytes_sent", len(packet))
 
         self.checked_add("timestamp", opus.Encoder.SAMPLES_PER_FRAME, 4294967295)
 
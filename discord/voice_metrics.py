@@ -0,0 +1,278 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from bisect import bisect_left
+from typing import Any, Callable, Sequence
+
+__all__ = (
+    "Histogram",
+    "VoiceMetrics",
+)
+
+_log = logging.getLogger(__name__)
+
+#: Bucket upper bounds in seconds used by :class:`Histogram` by default.
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.02,
+    0.04,
+    0.08,
+    0.16,
+    0.32,
+    0.64,
+    1.28,
+)
+
+
+class Histogram:
+    """A fixed bucket histogram of timings.
+
+    .. versionadded:: 2.7
+
+    Attributes
+    ----------
+    buckets: Tuple[:class:`float`, ...]
+        The upper bound of each bucket, in ascending order. Values above the
+        last bound are counted in an extra overflow bucket.
+    counts: List[:class:`int`]
+        The number of values in each bucket, including the overflow bucket.
+    count: :class:`int`
+        The number of values observed.
+    total: :class:`float`
+        The sum of all values observed.
+    max: :class:`float`
+        The largest value observed.
+    """
+
+    __slots__ = ("buckets", "counts", "count", "total", "max")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets: tuple[float, ...] = tuple(sorted(buckets))
+        self.counts: list[int] = [0] * (len(self.buckets) + 1)
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"<Histogram count={self.count} mean={self.mean:.4f}"
+            f" p99={self.percentile(99):.4f} max={self.max:.4f}>"
+        )
+
+    def observe(self, value: float) -> None:
+        """Adds a value to the histogram."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float:
+        """The average of all values observed."""
+        if not self.count:
+            return 0.0
+        return self.total / self.count
+
+    def percentile(self, percent: float) -> float:
+        """Estimates a percentile of the values observed.
+
+        The result is the upper bound of the bucket the percentile falls in, or
+        :attr:`max` if it falls in the overflow bucket.
+
+        Parameters
+        ----------
+        percent: :class:`float`
+            The percentile to estimate, between 0 and 100.
+        """
+        if not self.count:
+            return 0.0
+
+        target = self.count * percent / 100
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= target:
+                return min(bound, self.max)
+        return self.max
+
+    def reset(self) -> None:
+        """Removes every value from the histogram."""
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the histogram as a dictionary that can be serialised to JSON."""
+        return {
+            "buckets": list(self.buckets),
+            "counts": self.counts.copy(),
+            "count": self.count,
+            "total": self.total,
+            "max": self.max,
+        }
+
+
+class VoiceMetrics:
+    """Counters and timing histograms for a voice connection or audio player.
+
+    Every :class:`VoiceClient` has one of these as :attr:`VoiceClient.metrics`,
+    and so does every audio player it starts. A player's metrics also count
+    towards the metrics of its voice client, so the voice client holds the
+    totals of the whole connection. Metrics can be recorded and read from any
+    thread.
+
+    The following counters are recorded:
+
+    - ``packets_sent``, ``bytes_sent``: voice packets sent.
+    - ``packets_dropped``: packets that could not be sent because the socket was busy.
+    - ``packets_received``, ``bytes_received``: voice packets received while recording.
+    - ``receive_dropped``: received packets dropped because the decode queue was full.
+    - ``decrypt_failures``: received packets that could not be decrypted.
+    - ``decode_failures``: received packets that could not be decoded.
+    - ``socket_errors``: errors raised by the UDP socket.
+    - ``frames_sent``: audio frames sent by a player.
+    - ``late_frames``: frames a player sent more than one frame late.
+
+    And the following histograms, in seconds:
+
+    - ``encode_time``: time spent encoding a frame to Opus.
+    - ``read_time``: time a player spent reading a frame from its source.
+    - ``decode_lag``: time between a packet being received and decoded.
+    - ``ws_latency``: voice websocket heartbeat latency.
+
+    .. versionadded:: 2.7
+
+    Parameters
+    ----------
+    callback: Optional[Callable[[:class:`str`, :class:`float`], Any]]
+        Called with the name and amount every time a counter is incremented,
+        and with the name and value every time a timing is recorded. It is
+        called from the thread recording the metric, so it should be quick.
+        This can be changed later through :attr:`callback`.
+    parent: Optional[:class:`VoiceMetrics`]
+        Metrics that everything recorded here is also recorded to.
+
+    Attributes
+    ----------
+    counters: Dict[:class:`str`, :class:`int`]
+        The value of every counter that was incremented at least once.
+    histograms: Dict[:class:`str`, :class:`Histogram`]
+        Every histogram that was recorded to at least once.
+    callback: Optional[Callable[[:class:`str`, :class:`float`], Any]]
+        The callback passed to the constructor.
+    """
+
+    def __init__(
+        self,
+        *,
+        callback: Callable[[str, float], Any] | None = None,
+        parent: VoiceMetrics | None = None,
+    ) -> None:
+        self.counters: dict[str, int] = {}
+        self.histograms: dict[str, Histogram] = {}
+        self.callback: Callable[[str, float], Any] | None = callback
+        self._parent: VoiceMetrics | None = parent
+        # metrics are recorded from the player, receive and event loop threads
+        self._lock: threading.Lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<VoiceMetrics counters={self.counters!r}>"
+
+    def __getitem__(self, name: str) -> int:
+        return self.counters.get(name, 0)
+
+    def _notify(self, name: str, value: float) -> None:
+        try:
+            self.callback(name, value)  # type: ignore
+        except Exception:
+            _log.exception("Voice metrics callback failed for %s", name)
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Increments a counter, creating it if needed.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the counter.
+        amount: :class:`int`
+            How much to add to the counter. Defaults to 1.
+        """
+        metrics = self
+        while metrics is not None:
+            with metrics._lock:
+                counters = metrics.counters
+                counters[name] = counters.get(name, 0) + amount
+            if metrics.callback is not None:
+                metrics._notify(name, amount)
+            metrics = metrics._parent
+
+    def observe(self, name: str, value: float) -> None:
+        """Records a timing in a histogram, creating it if needed.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            The name of the histogram.
+        value: :class:`float`
+            The timing in seconds.
+        """
+        metrics = self
+        while metrics is not None:
+            with metrics._lock:
+                histogram = metrics.histograms.get(name)
+                if histogram is None:
+                    histogram = metrics.histograms[name] = Histogram()
+                histogram.observe(value)
+            if metrics.callback is not None:
+                metrics._notify(name, value)
+            metrics = metrics._parent
+
+    def reset(self) -> None:
+        """Resets every counter and histogram."""
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns every counter and histogram as a dictionary that can be
+        serialised to JSON, for example to export them to a monitoring system.
+        """
+        with self._lock:
+            return {
+                "counters": self.counters.copy(),
+                "histograms": {
+                    name: histogram.to_dict()
+                    for name, histogram in self.histograms.items()
+                },
+            }
@@ -0,0 +1,77 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import discord
+
+
+def message(channel_id: int) -> SimpleNamespace:
+    return SimpleNamespace(channel=SimpleNamespace(id=channel_id))
+
+
+async def test_wait_for_key_only_matches_its_key():
+    client = discord.Client()
+    waiter = asyncio.ensure_future(client.wait_for("message", key=1))
+    await asyncio.sleep(0)
+
+    client.dispatch("message", message(2))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    expected = message(1)
+    client.dispatch("message", expected)
+    assert await waiter is expected
+    assert client._listeners == {}
+
+
+async def test_wait_for_removes_timed_out_waiters():
+    client = discord.Client()
+    with pytest.raises(asyncio.TimeoutError):
+        await client.wait_for("message", key=1, timeout=0.01)
+    with pytest.raises(asyncio.TimeoutError):
+        await client.wait_for("message", check=lambda m: False, timeout=0.01)
+    assert client._listeners == {}
+
+
+async def test_wait_for_removes_cancelled_waiters():
+    client = discord.Client()
+    waiter = asyncio.ensure_future(client.wait_for("message", key=1))
+    await asyncio.sleep(0)
+    assert client._listeners
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert client._listeners == {}
+
+
+async def test_wait_for_key_requires_supported_event():
+    client = discord.Client()
+    with pytest.raises(ValueError):
+        client.wait_for("ready", key=1)
@@ -0,0 +1,79 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from types import SimpleNamespace
+
+from discord.ext.commands import BucketType, Cooldown, CooldownMapping
+
+
+def message(author_id: int) -> SimpleNamespace:
+    return SimpleNamespace(author=SimpleNamespace(id=author_id))
+
+
+def test_unused_buckets_expire():
+    mapping = CooldownMapping(Cooldown(1, 10.0), BucketType.user)
+    first = mapping.get_bucket(message(1), 100.0)
+    assert mapping.update_rate_limit(message(1), 100.0) is None
+    assert mapping.update_rate_limit(message(1), 105.0) == 5.0
+    mapping.get_bucket(message(2), 108.0)
+
+    # the first bucket was last used at 105, so it lives until 115
+    mapping.get_bucket(message(3), 114.0)
+    assert mapping._cache[1] is first
+    mapping.get_bucket(message(3), 116.0)
+    assert 1 not in mapping._cache
+    assert 2 in mapping._cache
+
+    # a new bucket for the same key starts from scratch
+    assert mapping.get_bucket(message(1), 116.0) is not first
+    assert mapping.update_rate_limit(message(1), 116.0) is None
+
+
+def test_expiry_heap_stays_bounded():
+    mapping = CooldownMapping(Cooldown(1, 1.0), BucketType.user)
+    for current in range(1, 1000):
+        mapping.update_rate_limit(message(current), float(current))
+
+    assert len(mapping._cache) <= 2
+    assert len(mapping._expiry) <= 2
+
+
+def test_max_size_drops_least_recently_used():
+    mapping = CooldownMapping(Cooldown(1, 60.0), BucketType.user, max_size=2)
+    mapping.get_bucket(message(1), 1.0)
+    mapping.get_bucket(message(2), 2.0)
+    mapping.get_bucket(message(1), 3.0)
+    mapping.get_bucket(message(3), 4.0)
+
+    assert list(mapping._cache) == [1, 3]
+
+    # evicted buckets don't keep their expiry entries around either
+    mapping = CooldownMapping(Cooldown(1, 3600.0), BucketType.user, max_size=10)
+    for user_id in range(1, 100_001):
+        mapping.get_bucket(message(user_id), 1.0 + user_id / 1000)
+
+    assert len(mapping._cache) == 10
+    assert len(mapping._expiry) <= 2 * 10 + 16
+    assert {entry[2] for entry in mapping._expiry} >= set(mapping._cache)
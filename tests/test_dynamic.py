@@ -0,0 +1,99 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import re
+
+from discord.ui.dynamic import _DynamicRoute, _DynamicRouter
+
+
+async def handler(interaction, match, state):
+    pass
+
+
+async def other_handler(interaction, match, state):
+    pass
+
+
+def route(prefix, pattern=None, component_type=None, callback=handler):
+    return _DynamicRoute(
+        prefix, pattern and re.compile(pattern), callback, component_type
+    )
+
+
+def test_longest_prefix_wins():
+    router = _DynamicRouter()
+    short = route("page:")
+    long = route("page:next:")
+    router.add(short)
+    router.add(long)
+
+    assert router.find(2, "page:next:3") == (long, None)
+    assert router.find(2, "page:prev:3") == (short, None)
+    assert router.find(2, "pag") is None
+    assert router.find(2, "other") is None
+
+
+def test_patterns_are_tried_in_order():
+    router = _DynamicRouter()
+    digits = route("vote:", r"vote:(\d+)")
+    anything = route("vote:", r"vote:(.+)")
+    router.add(digits)
+    router.add(anything)
+
+    found, match = router.find(2, "vote:12")
+    assert found is digits
+    assert match.group(1) == "12"
+
+    found, match = router.find(2, "vote:yes")
+    assert found is anything
+    assert match.group(1) == "yes"
+
+
+def test_component_type_and_fallback_to_shorter_prefix():
+    router = _DynamicRouter()
+    fallback = route("a")
+    select_only = route("ab", component_type=3)
+    router.add(fallback)
+    router.add(select_only)
+
+    assert router.find(3, "abc")[0] is select_only
+    assert router.find(2, "abc")[0] is fallback
+
+
+def test_remove():
+    router = _DynamicRouter()
+    router.add(route("a"))
+    router.add(route("a", callback=other_handler))
+    router.add(route("abc"))
+
+    router.remove("a", handler)
+    assert [r.handler for r in router._routes["a"]] == [other_handler]
+
+    router.remove("abc")
+    assert "abc" not in router._routes
+    assert router._lengths == [1]
+
+    router.remove("a")
+    assert not router
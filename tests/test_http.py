@@ -0,0 +1,124 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import json
+
+import pytest
+from multidict import CIMultiDict
+
+from discord.errors import HTTPException
+from discord.http import HTTPClient, Route
+
+
+class FakeResponse:
+    def __init__(self, status: int, data: object, **headers: str) -> None:
+        self.status = status
+        self.reason = "Fake"
+        self._text = json.dumps(data)
+        self.headers = CIMultiDict(headers)
+        self.headers["content-type"] = "application/json"
+
+    async def __aenter__(self) -> "FakeResponse":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        pass
+
+    async def text(self, encoding: str = "utf-8") -> str:
+        return self._text
+
+
+class FakeSession:
+    def __init__(self, *responses: FakeResponse) -> None:
+        self.responses = list(responses)
+        self.calls = []
+
+    def request(self, method: str, url: str, **kwargs) -> FakeResponse:
+        self.calls.append((method, url))
+        return self.responses.pop(0)
+
+
+def make_http(*responses: FakeResponse) -> tuple[HTTPClient, FakeSession]:
+    http = HTTPClient(global_ratelimit=None)
+    session = FakeSession(*responses)
+    http._HTTPClient__session = session
+    return http, session
+
+
+def ok(bucket: str = "abc", remaining: int = 4) -> FakeResponse:
+    return FakeResponse(
+        200,
+        {"id": "1"},
+        **{
+            "X-Ratelimit-Bucket": bucket,
+            "X-Ratelimit-Limit": "5",
+            "X-Ratelimit-Remaining": str(remaining),
+            "X-Ratelimit-Reset-After": "1.0",
+        },
+    )
+
+
+async def test_bucket_discovery_shares_state_between_routes():
+    http, _ = make_http(ok(), ok(remaining=3))
+    first = Route("GET", "/channels/{channel_id}", channel_id=1)
+    assert http._get_bucket_key(first) == f"{first.key}:{first.major_parameters}"
+
+    await http.request(first)
+    assert http._bucket_hashes[first.key] == "abc"
+    assert http._get_bucket_key(first) == f"abc:{first.major_parameters}"
+
+    ratelimit = http._buckets[http._get_bucket_key(first)]
+    assert (ratelimit.limit, ratelimit.remaining) == (5, 4)
+
+    # a route with other major parameters has a bucket of its own
+    other = Route("GET", "/channels/{channel_id}", channel_id=2)
+    assert http._get_bucket_key(other) == f"abc:{other.major_parameters}"
+    await http.request(other)
+    assert http._buckets[http._get_bucket_key(other)] is not ratelimit
+    assert ratelimit.remaining == 4
+
+
+async def test_429_exhausts_bucket_and_retries():
+    limited = FakeResponse(
+        429,
+        {"retry_after": 0.05, "global": False},
+        Via="1.1 google",
+        **{"X-Ratelimit-Bucket": "abc"},
+    )
+    http, session = make_http(limited, ok())
+    route = Route("POST", "/channels/{channel_id}/messages", channel_id=1)
+
+    start = http.loop.time()
+    assert await http.request(route) == {"id": "1"}
+    assert len(session.calls) == 2
+    # the retry waited for the bucket to reset
+    assert http.loop.time() - start >= 0.04
+
+
+async def test_429_without_via_is_raised():
+    http, session = make_http(FakeResponse(429, {"retry_after": 1.0}))
+    with pytest.raises(HTTPException):
+        await http.request(Route("GET", "/gateway"))
+    assert len(session.calls) == 1
@@ -0,0 +1,127 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+import datetime
+import gc
+from typing import Iterator
+
+import pytest
+
+from discord.flags import Intents
+from discord.guild import Guild
+from discord.member import CompactMemberStore, Member, _interned
+from discord.state import ConnectionState
+
+
+@pytest.fixture
+def guild() -> Iterator[Guild]:
+    loop = asyncio.new_event_loop()
+    state = ConnectionState(
+        dispatch=lambda *args: None,
+        handlers={},
+        hooks={},
+        http=None,
+        loop=loop,
+        intents=Intents.all(),
+    )
+    yield Guild(data={"id": "1", "member_count": 2}, state=state)
+    loop.close()
+
+
+def make_member(guild: Guild, user_id: int, **data) -> Member:
+    payload = {
+        "user": {
+            "id": str(user_id),
+            "username": f"user{user_id}",
+            "discriminator": "0",
+            "avatar": None,
+        },
+        "roles": ["30", "20"],
+        "joined_at": "2021-01-02T03:04:05.123456+00:00",
+        "nick": None,
+        "deaf": False,
+        "mute": False,
+        "flags": 0,
+        "pending": False,
+    }
+    payload.update(data)
+    return Member(data=payload, guild=guild, state=guild._state)
+
+
+def test_compact_member_store_round_trip(guild):
+    store = CompactMemberStore(guild, hot_size=1)
+    original = make_member(
+        guild,
+        10,
+        nick="nick",
+        premium_since="2022-05-06T07:08:09+00:00",
+        communication_disabled_until=None,
+        pending=True,
+    )
+    store[original.id] = original
+    # pushes the first member out of the hot members, packing it
+    store[11] = make_member(guild, 11)
+
+    member = store[10]
+    assert member is not original
+    assert member == original
+    assert member.guild is guild
+    assert member.nick == "nick"
+    assert member.pending is True
+    assert member.joined_at == original.joined_at
+    assert member.joined_at.microsecond == 123456
+    assert member.premium_since == datetime.datetime(
+        2022, 5, 6, 7, 8, 9, tzinfo=datetime.timezone.utc
+    )
+    assert member.communication_disabled_until is None
+    assert list(member._roles) == [20, 30]
+    assert member._user is original._user
+
+    assert len(store) == 2
+    assert sorted(store) == [10, 11]
+    assert sorted(m.id for m in store.values()) == [10, 11]
+
+
+def test_compact_member_store_pop_keeps_rows_dense(guild):
+    store = CompactMemberStore(guild, hot_size=0)
+    for user_id in (1, 2, 3):
+        store[user_id] = make_member(guild, user_id, nick=str(user_id))
+
+    assert store.pop(1).nick == "1"
+    assert store.pop(1) is None
+    assert 1 not in store
+    assert [store[user_id].nick for user_id in (2, 3)] == ["2", "3"]
+    assert len(store._ids) == len(store._nicks) == 2
+
+
+def test_compact_member_store_forgets_unused_combinations(guild):
+    store = CompactMemberStore(guild, hot_size=0)
+    store[1] = make_member(guild, 1, roles=["123456789"])
+    assert (123456789,) in _interned
+
+    store.clear()
+    gc.collect()
+    assert (123456789,) not in _interned
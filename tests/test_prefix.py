@@ -0,0 +1,84 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import pytest
+
+from discord.ext import commands
+from discord.ext.commands.bot import _PrefixMatcher
+
+
+def test_first_listed_prefix_wins():
+    # like checking str.startswith for each prefix in order
+    matcher = _PrefixMatcher(["!", "!!", "?"])
+    assert matcher.match("!!help") == "!"
+
+    matcher = _PrefixMatcher(["!!", "!"])
+    assert matcher.match("!!help") == "!!"
+    assert matcher.match("!help") == "!"
+
+    matcher = _PrefixMatcher(["bot ", "b"])
+    assert matcher.match("bot help") == "bot "
+    assert matcher.match("bo help") == "b"
+
+
+def test_no_match():
+    matcher = _PrefixMatcher(["!", "bot "])
+    assert matcher.match("help") is None
+    assert matcher.match("bot") is None
+    assert matcher.match("") is None
+    assert matcher.first_chars == frozenset("!b")
+
+
+def test_single_and_empty_prefix():
+    assert _PrefixMatcher("$").match("$help") == "$"
+
+    matcher = _PrefixMatcher(["!", ""])
+    assert matcher.first_chars is None
+    assert matcher.match("!help") == "!"
+    assert matcher.match("help") == ""
+
+    assert _PrefixMatcher(["", "!"]).match("!help") == ""
+
+
+def test_non_string_prefix():
+    with pytest.raises(TypeError):
+        _PrefixMatcher(["!", 1])
+
+
+async def test_pre_filter_respects_overridden_get_context():
+    class CustomBot(commands.Bot):
+        async def get_context(self, message, *, cls=commands.Context):
+            return await super().get_context(message, cls=cls)
+
+    payload = {"author": {"id": "1"}, "content": "help"}
+    bot = commands.Bot(command_prefix="!", skip_non_command_messages=True)
+    assert not bot._may_be_command("help", None)
+    assert bot._may_be_command("!help", None)
+    assert not bot._is_command_payload(payload)
+
+    bot = CustomBot(command_prefix="!", skip_non_command_messages=True)
+    assert bot._may_be_command("help", None)
+    assert bot._is_command_payload(payload)
+    assert not bot._is_command_payload({**payload, "author": {"bot": True}})
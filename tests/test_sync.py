@@ -0,0 +1,120 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from types import SimpleNamespace
+
+import discord
+from discord.commands.sync import CommandSyncStore, JSONCommandSyncStore
+
+
+class MemoryStore(CommandSyncStore):
+    def __init__(self) -> None:
+        self.entries = {}
+
+    async def get(self, application_id, guild_id):
+        return self.entries.get((application_id, guild_id))
+
+    async def set(self, application_id, guild_id, entry):
+        self.entries[application_id, guild_id] = entry
+
+
+class FakeHTTP:
+    def __init__(self) -> None:
+        self.bulk_calls = []
+
+    async def bulk_upsert_global_commands(self, application_id, payload):
+        self.bulk_calls.append(payload)
+        return [
+            {"id": str(index), "name": command["name"], "type": 1}
+            for index, command in enumerate(payload, 1)
+        ]
+
+    def __getattr__(self, name):
+        async def unexpected(*args, **kwargs):
+            raise AssertionError(f"unexpected call to {name}")
+
+        return unexpected
+
+
+def make_bot(store: CommandSyncStore) -> tuple[discord.Bot, FakeHTTP]:
+    bot = discord.Bot(command_sync_store=store)
+    bot._connection.user = SimpleNamespace(id=1234)
+    bot.http = FakeHTTP()
+
+    @bot.slash_command()
+    async def ping(ctx):
+        pass
+
+    return bot, bot.http
+
+
+async def test_sync_skips_unchanged_scope():
+    store = MemoryStore()
+    bot, http = make_bot(store)
+
+    registered = await bot.register_commands()
+    assert len(http.bulk_calls) == 1
+    entry = store.entries[1234, None]
+    assert entry["commands"] == [{"id": "1", "name": "ping", "type": 1}]
+
+    # a new bot with the same commands reuses the stored result
+    bot, http = make_bot(store)
+    assert await bot.register_commands() == registered
+    assert http.bulk_calls == []
+    assert bot.get_application_command("ping").id == "1"
+
+
+async def test_sync_runs_when_commands_change():
+    store = MemoryStore()
+    bot, http = make_bot(store)
+    await bot.register_commands()
+    old_hash = store.entries[1234, None]["hash"]
+
+    @bot.slash_command()
+    async def pong(ctx):
+        pass
+
+    await bot.register_commands()
+    assert len(http.bulk_calls) == 2
+    assert store.entries[1234, None]["hash"] != old_hash
+
+    await bot.register_commands(force=True)
+    assert len(http.bulk_calls) == 3
+
+
+async def test_json_sync_store_round_trip(tmp_path):
+    path = tmp_path / "sync.json"
+    store = JSONCommandSyncStore(path)
+    assert await store.get(1, None) is None
+
+    await store.set(1, None, {"hash": "a", "commands": []})
+    await store.set(1, 5, {"hash": "b", "commands": []})
+
+    reloaded = JSONCommandSyncStore(path)
+    assert (await reloaded.get(1, None))["hash"] == "a"
+    assert (await reloaded.get(1, 5))["hash"] == "b"
+
+    await reloaded.clear()
+    assert await JSONCommandSyncStore(path).get(1, None) is None
@@ -0,0 +1,74 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-2021 Rapptz
+Copyright (c) 2021-present Pycord Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+import time
+
+from discord.ui.view import _TimeoutScheduler
+
+
+async def test_timeouts_run_in_deadline_order():
+    scheduler = _TimeoutScheduler()
+    fired = []
+    now = time.monotonic()
+    scheduler.call_at(now + 0.03, lambda: fired.append("late"))
+    scheduler.call_at(now + 0.01, lambda: fired.append("early"))
+    cancelled = scheduler.call_at(now + 0.02, lambda: fired.append("cancelled"))
+    scheduler.cancel(cancelled)
+    assert len(scheduler) == 2
+
+    await asyncio.sleep(0.06)
+    assert fired == ["early", "late"]
+    assert len(scheduler) == 0
+    assert scheduler._heap == []
+    assert scheduler._handle is None
+
+
+async def test_failing_timeout_does_not_stop_the_others():
+    scheduler = _TimeoutScheduler()
+    fired = []
+    now = time.monotonic()
+    scheduler.call_at(now, lambda: 1 / 0)
+    scheduler.call_at(now, lambda: fired.append(True))
+
+    await asyncio.sleep(0.01)
+    assert fired == [True]
+
+
+async def test_cancelled_entries_are_compacted():
+    scheduler = _TimeoutScheduler()
+    later = time.monotonic() + 60
+    entries = [scheduler.call_at(later + i, lambda: None) for i in range(200)]
+    kept = entries[-10:]
+    for entry in entries[:-10]:
+        scheduler.cancel(entry)
+        scheduler.cancel(entry)
+
+    assert len(scheduler) == 10
+    # compaction runs once cancelled entries are most of the heap
+    assert len(scheduler._heap) < 200
+    assert all(item[2] in kept or item[2].cancelled for item in scheduler._heap)
+    assert scheduler._cancelled == sum(item[2].cancelled for item in scheduler._heap)
+    scheduler._handle.cancel()